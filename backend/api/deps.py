@@ -13,7 +13,9 @@ from backend.core.config import settings
 from backend.core import security
 from backend.core.db import engine
 from backend.api.schemas import TokenPayload
-from backend.logic.models import User
+from backend.logic.controllers import profiles, users
+from backend.logic.controllers.users import UserSnapshot
+from backend.logic.models import Profile
 from backend.logic.enum import UserTypes, UserStatus
 
 
@@ -37,19 +39,29 @@ SessionDep = Annotated[Session, Depends(get_db)]
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
-def get_current_user(session: SessionDep, token: TokenDep) -> User:
+def get_token_payload(token: TokenDep) -> TokenPayload:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
         )
-        token_data = TokenPayload(**payload)
+        return TokenPayload(**payload)
     except (PyJWTError, ValidationError):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    
-    user = session.get(User, uuid.UUID(token_data.sub))
+
+
+TokenPayloadDep = Annotated[TokenPayload, Depends(get_token_payload)]
+
+
+def get_current_user(session: SessionDep, token_data: TokenPayloadDep) -> UserSnapshot:
+    """
+    Checks the user of the token, from a snapshot of its status and type
+    cached by ``users.get_user_snapshot``. Routes needing the other fields
+    of the user read its row.
+    """
+    user = users.get_user_snapshot(session=session, user_id=uuid.UUID(token_data.sub))
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     if not user.user_status == UserStatus.ACTIVE:
@@ -57,10 +69,71 @@ def get_current_user(session: SessionDep, token: TokenDep) -> User:
     return user
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[UserSnapshot, Depends(get_current_user)]
+
+
+def get_optional_profile_id(
+    session: SessionDep, current_user: CurrentUser, token_data: TokenPayloadDep
+) -> uuid.UUID | None:
+    """
+    Resolves the id of the profile of the current user, None if it has none.
+
+    FastAPI solves a dependency once per request, so a route and the
+    dependencies asking for it share the result. Across requests the id is
+    kept in ``profiles.profile_cache`` for ``PROFILE_CACHE_TTL_SECONDS``,
+    dropped by the worker that creates or deletes the profile; the other
+    workers may keep a deleted id until it expires, ``CurrentProfile``
+    drops it on its first miss. On a miss,
+    the ``profile_id`` claim of the token is checked with a primary key
+    lookup, which leaves the profile in the session for ``CurrentProfile``;
+    tokens issued before the profile was created fall back to a lookup by
+    user id.
+
+    Returns:
+        uuid.UUID | None: The id of the profile.
+    """
+    profile_id = profiles.profile_cache.get(current_user.user_id)
+    if profile_id is not None:
+        return profile_id
+
+    profile = None
+    if token_data.profile_id:
+        profile = session.get(Profile, uuid.UUID(token_data.profile_id))
+    if profile is not None and profile.user_id == current_user.user_id:
+        profile_id = profile.profile_id
+    else:
+        # A token without the claim, or issued before the profile was replaced
+        profile_id = profiles.get_profile_id_by_user_id(session=session, user_id=current_user.user_id)
+    if profile_id is not None:
+        profiles.profile_cache.put(current_user.user_id, profile_id)
+    return profile_id
+
+
+OptionalProfileId = Annotated[uuid.UUID | None, Depends(get_optional_profile_id)]
+
+
+def get_current_profile_id(profile_id: OptionalProfileId) -> uuid.UUID:
+    if profile_id is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile_id
+
+
+CurrentProfileId = Annotated[uuid.UUID, Depends(get_current_profile_id)]
+
+
+def get_current_profile(session: SessionDep, current_user: CurrentUser, profile_id: CurrentProfileId) -> Profile:
+    profile = session.get(Profile, profile_id)
+    if not profile:
+        # Deleted since it was cached
+        profiles.profile_cache.invalidate(current_user.user_id)
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile
+
+
+CurrentProfile = Annotated[Profile, Depends(get_current_profile)]
 
 
-def get_current_active_admin(current_user: CurrentUser) -> User:
+def get_current_active_admin(current_user: CurrentUser) -> UserSnapshot:
     if not current_user.user_type == UserTypes.ADMIN:
         raise HTTPException(
             status_code=403, detail="The user doesn't have enough privileges"
@@ -8,9 +8,11 @@ from backend.api.routes import (
     article_tags,
     movie_lists,
     ratings,
+    recommendations,
     follows,
     reactions,
     comments,
+    feed,
     uploads
 )
 
@@ -20,9 +22,11 @@ api_router.include_router(users.router)
 api_router.include_router(profiles.router)
 api_router.include_router(movie_lists.router)
 api_router.include_router(ratings.router)
+api_router.include_router(recommendations.router)
 api_router.include_router(follows.router)
 api_router.include_router(reactions.router)
 api_router.include_router(comments.router)
+api_router.include_router(feed.router)
 api_router.include_router(articles.router)
 api_router.include_router(article_tags.router)
 # api_router.include_router(uploads.router)
\ No newline at end of file
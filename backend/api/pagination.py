@@ -0,0 +1,57 @@
+from contextlib import contextmanager
+from typing import Annotated, Any, Iterator, Literal, Sequence
+
+from fastapi import HTTPException, Query
+from sqlmodel import Session
+from sqlmodel.sql.expression import SelectOfScalar
+
+from backend.core import pagination
+from backend.core.pagination import InvalidCursor
+
+Skip = Annotated[
+    int | None,
+    Query(deprecated=True, description="Offset pagination, use the `after` cursor instead.")
+]
+
+CountMode = Annotated[
+    Literal["exact", "estimate"],
+    Query(alias="count", description="`estimate` returns an approximate count from the database statistics.")
+]
+
+
+@contextmanager
+def cursor_errors() -> Iterator[None]:
+    """
+    Report an ``InvalidCursor`` raised in the block, by ``paginate`` or a
+    controller paginating with ``backend.core.pagination``, as a 400.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or does not match the key.
+    """
+    try:
+        yield
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def paginate(
+    session: Session,
+    statement: SelectOfScalar,
+    *,
+    key: Sequence[Any],
+    after: str | None = None,
+    skip: int | None = None,
+    limit: int = 100,
+    descending: bool = False
+) -> tuple[list[Any], str | None]:
+    """
+    ``backend.core.pagination.paginate`` for the routes.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or does not match the key.
+    """
+    with cursor_errors():
+        return pagination.paginate(
+            session, statement,
+            key=key, after=after, skip=skip, limit=limit, descending=descending
+        )
@@ -1,7 +1,7 @@
 from typing import Any, Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import func, select
+from sqlmodel import select
 
 from backend.logic.models import (
     Section,
@@ -15,8 +15,9 @@ from backend.logic.schemas.articles_tags import (
     NewsletterPublic,
     NewslettersPublic
 )
-from backend.logic.controllers import article_tags
+from backend.logic.controllers import article_tags, counts
 from backend.api.deps import SessionDep, get_current_active_internal_or_admin
+from backend.api.pagination import CountMode, Skip, paginate
 from backend.api.schemas import Message
 
 
@@ -28,27 +29,47 @@ msg_n = "The newsletter with this id does not exist in the system"
     "/sections",
     response_model=SectionsPublic
 )
-def read_sections(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
-    count_statement = select(func.count()).select_from(Section)
-    count = session.exec(count_statement).one()
+def read_sections(
+    session: SessionDep,
+    after: str | None = None,
+    limit: int = 100,
+    skip: Skip = None,
+    count_mode: CountMode = "exact"
+) -> Any:
+    count = counts.count_rows(
+        session=session, model=Section, estimate=count_mode == "estimate"
+    )
 
-    statement = select(Section).offset(skip).limit(limit)
-    sections= session.exec(statement).all()
+    sections, next_cursor = paginate(
+        session, select(Section),
+        key=(Section.section_id,),
+        after=after, skip=skip, limit=limit
+    )
 
-    return SectionsPublic(sections=sections, count=count)
+    return SectionsPublic(sections=sections, count=count, next_cursor=next_cursor)
 
 @router.get(
     "/newsletters", 
     response_model=NewslettersPublic
 )
-def read_newsletters(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
-    count_statement = select(func.count()).select_from(Newsletter)
-    count = session.exec(count_statement).one()
+def read_newsletters(
+    session: SessionDep,
+    after: str | None = None,
+    limit: int = 100,
+    skip: Skip = None,
+    count_mode: CountMode = "exact"
+) -> Any:
+    count = counts.count_rows(
+        session=session, model=Newsletter, estimate=count_mode == "estimate"
+    )
 
-    statement = select(Newsletter).offset(skip).limit(limit)
-    newsletters= session.exec(statement).all()
+    newsletters, next_cursor = paginate(
+        session, select(Newsletter),
+        key=(Newsletter.newsletter_id,),
+        after=after, skip=skip, limit=limit
+    )
 
-    return NewslettersPublic(newsletters=newsletters, count=count)
+    return NewslettersPublic(newsletters=newsletters, count=count, next_cursor=next_cursor)
 
 
 @router.post(
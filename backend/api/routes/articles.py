@@ -1,17 +1,15 @@
 import uuid
 from typing import Any, Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import func, select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlmodel import select
 
 from backend.logic.models import (
     Article,
-    Profile,
     AuthorArticle,
     Section,
     Newsletter
 )
-from backend.logic.models.users import User
 from backend.logic.schemas.articles import (
     ArticlePublicEXT,
     CreateArticle,
@@ -24,10 +22,17 @@ from backend.logic.schemas.articles import (
     UpdateBodyArticle
 )
 from backend.logic.entities.article import Article as EntityArticle
-from backend.logic.controllers import articles, article_controller, authors_articles
+from backend.logic.controllers import articles, article_controller, authors_articles, counts
+from backend.logic.controllers.newsletter_snapshots import Snapshot, snapshots
 from backend.logic.schemas.author_articles import CreateAuthor
-from backend.api.deps import CurrentUser, SessionDep, get_current_active_internal_or_admin
-from backend.api.schemas import Message
+from backend.api.deps import (
+    CurrentProfileId,
+    SessionDep,
+    get_current_active_admin,
+    get_current_active_internal_or_admin
+)
+from backend.api.pagination import CountMode, Skip, paginate
+from backend.api.schemas import CacheStats, Message
 
 
 router = APIRouter(prefix="/articles", tags=["article"])
@@ -38,14 +43,24 @@ msg = "The article with this id does not exist in the system"
     "/",
     response_model=ArticlesPublic,
 )
-def read_articles(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
-    count_statement = select(func.count()).select_from(Article)
-    count = session.exec(count_statement).one()
+def read_articles(
+    session: SessionDep,
+    after: str | None = None,
+    limit: int = 100,
+    skip: Skip = None,
+    count_mode: CountMode = "exact"
+) -> Any:
+    count = counts.count_rows(
+        session=session, model=Article, estimate=count_mode == "estimate"
+    )
 
-    statement = select(Article).offset(skip).limit(limit)
-    articles= session.exec(statement).all()
+    articles, next_cursor = paginate(
+        session, select(Article),
+        key=(Article.created_at, Article.article_id),
+        after=after, skip=skip, limit=limit
+    )
 
-    return ArticlesPublic(articles=articles, count=count)
+    return ArticlesPublic(articles=articles, count=count, next_cursor=next_cursor)
 
 
 @router.post(
@@ -58,15 +73,11 @@ def create_article(
     session: SessionDep, 
     article_in: CreateArticle, 
     body_article:BodyArticle,
-    current_user: CurrentUser
+    profile_id: CurrentProfileId
 ) -> Any:
     """
     Create a new article
     """
-    profile_id = session.exec(
-        select(Profile.profile_id)
-        .where(Profile.user_id == current_user.user_id)
-    ).first()
     article = articles.create_article(session=session, article_create=article_in)
     try:
         article_controller.ArticleController().add(EntityArticle(
@@ -96,48 +107,24 @@ def create_article(
     "/newsletter/latest",
     response_model=NewsletterArticles
 )
-def get_latest_newsletter_articles(session: SessionDep) -> Any:
-    # Buscar el newsletter más reciente
-    latest_newsletter = session.exec(
-        select(Newsletter).order_by(Newsletter.name.desc()).limit(1)
-    ).first()
-
-    if not latest_newsletter:
+def get_latest_newsletter_articles(request: Request, session: SessionDep) -> Any:
+    snapshot = snapshots.get_latest(session=session)
+    if not snapshot:
         raise HTTPException(status_code=404, detail="No newsletters found")
 
-    # Buscar secciones con artículos de ese newsletter
-    sections = session.exec(
-        select(Section)
-        .join(Article)
-        .where(Article.newsletter_id == latest_newsletter.newsletter_id)
-        .distinct()
-    ).all()
+    return snapshot_response(request, snapshot)
 
-    section_articles_list = []
-    total_articles = 0
 
-    for section in sections:
-        articles_in_section = session.exec(
-            select(Article).where(
-                (Article.newsletter_id == latest_newsletter.newsletter_id) &
-                (Article.section_id == section.section_id)
-            )
-        ).all()
-        section_articles_list.append(
-            SectionArticles(
-                section=section.name,
-                articles=articles_in_section,
-                count=len(articles_in_section)
-            )
-        )
-        total_articles += len(articles_in_section)
-
-    return NewsletterArticles(
-        newsletter=latest_newsletter.name,
-        data=section_articles_list,
-        total_articles=total_articles,
-        total_sections=len(section_articles_list)
-    )
+@router.get(
+    "/cache/stats",
+    dependencies=[Depends(get_current_active_admin)],
+    response_model=CacheStats
+)
+def read_article_cache_stats() -> Any:
+    """
+    Hit, miss and eviction counters of the article body cache of this process.
+    """
+    return CacheStats(**article_controller.body_cache.stats())
 
 
 @router.get("/{article_id}", response_model=ArticlePublicEXT)
@@ -145,28 +132,15 @@ def read_article_by_id(
     article_id: uuid.UUID, 
     session: SessionDep
 ) -> Any:
-    article: Article = session.get(Article, article_id)
-    if not article:
+    detail = articles.get_article_detail(session=session, article_id=article_id)
+    if not detail:
         raise HTTPException(status_code=404, detail="Article not found")
 
-    section = session.get(Section, article.section_id)
-    section_name = section.name if section else None
-    if not section:
+    article, section_name, newsletter_name, author = detail
+    if not section_name:
         raise HTTPException(status_code=500, detail="Section not found")
-
-    newsletter_name = None
-    if article.newsletter_id:
-        newsletter = session.get(Newsletter, article.newsletter_id)
-        newsletter_name = newsletter.name if newsletter else None
-        if not newsletter:
-            raise HTTPException(status_code=500, detail="Newsletter not found")
-
-    author = session.exec(
-        select(User.full_name)
-        .join(Profile, User.user_id == Profile.profile_id)
-        .join(AuthorArticle, Profile.profile_id == AuthorArticle.profile_id)
-        .where(AuthorArticle.article_id == article_id)
-    ).first()
+    if article.newsletter_id and not newsletter_name:
+        raise HTTPException(status_code=500, detail="Newsletter not found")
 
     author_name = author or "Unknown"
 
@@ -196,13 +170,8 @@ def update_article(
     article_id: uuid.UUID,
     article_in: UpdateArticle,
     body_article: UpdateBodyArticle,
-    current_user: CurrentUser
+    profile_id: CurrentProfileId
 ) -> Any:
-    profile_id = session.exec(
-        select(Profile.profile_id)
-        .where(Profile.user_id == current_user.user_id)
-    ).first()
-
     db_article = session.get(Article, article_id)
     if not db_article:
         raise HTTPException(
@@ -247,14 +216,9 @@ def update_article(
 )
 def delete_article(
     session: SessionDep, 
-    current_user: CurrentUser, 
+    profile_id: CurrentProfileId, 
     article_id: uuid.UUID
 ) -> None:
-    profile_id = session.exec(
-        select(Profile.profile_id)
-        .where(Profile.user_id == current_user.user_id)
-    ).first()
-
     db_article = session.get(Article, article_id)
     if not db_article:
         raise HTTPException(
@@ -311,37 +275,27 @@ def get_articles_by_section(section_id: int, session: SessionDep) -> Any:
     "/newsletter/{newsletter_id}",
     response_model=NewsletterArticles
 )
-def get_articles_by_newsletter(newsletter_id: int, session: SessionDep) -> Any:
-    newsletter = session.get(Newsletter, newsletter_id)
-    if not newsletter:
+def get_articles_by_newsletter(
+    newsletter_id: int,
+    request: Request,
+    session: SessionDep
+) -> Any:
+    snapshot = snapshots.get(session=session, newsletter_id=newsletter_id)
+    if not snapshot:
         raise HTTPException(status_code=404, detail="Newsletter not found")
 
-    # Obtener secciones asociadas a artículos dentro del newsletter
-    statement = select(Section).join(Article).where(Article.newsletter_id == newsletter_id).distinct()
-    sections = session.exec(statement).all()
-
-    section_articles_list = []
-    total_articles = 0
+    return snapshot_response(request, snapshot)
 
-    for section in sections:
-        articles_in_section = session.exec(
-            select(Article).where(
-                (Article.newsletter_id == newsletter_id) &
-                (Article.section_id == section.section_id)
-            )
-        ).all()
-        section_articles_list.append(
-            SectionArticles(
-                section=section.name,
-                articles=articles_in_section,
-                count=len(articles_in_section)
-            )
-        )
-        total_articles += len(articles_in_section)
 
-    return NewsletterArticles(
-        newsletter=newsletter.name,
-        data=section_articles_list,
-        total_articles=total_articles,
-        total_sections=len(section_articles_list)
-    )
+def snapshot_response(request: Request, snapshot: Snapshot) -> Response:
+    """
+    Serve the pre-serialized payload of a snapshot, or 304 if the client
+    already has it.
+    """
+    headers = {"ETag": snapshot.etag}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        if snapshot.etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.payload, media_type="application/json", headers=headers)
@@ -1,10 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import select
 import uuid
 
-from backend.api.deps import CurrentUser, SessionDep, get_current_user
+from backend.api.deps import CurrentProfileId, SessionDep, get_current_user
 from backend.logic.controllers import comments
-from backend.logic.models import Comment, Profile
+from backend.logic.models import Comment
 from backend.logic.schemas.comments import (
     CreateComment, 
     CommentPublic, 
@@ -27,12 +26,8 @@ router = APIRouter(prefix="/comments", tags=["interactions"])
 def get_my_comments(
     *,
     session: SessionDep,
-    current_user: CurrentUser
+    profile_id: CurrentProfileId
 ) -> ProfileComments:
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    profile_id = profile_in.profile_id
-
     comment_list = comments.get_comments_by_profile(session=session, profile_id=profile_id)
     return ProfileComments(
         profile_id=profile_id,
@@ -49,20 +44,16 @@ def get_my_comments(
 def create_comment(
     *,
     session: SessionDep,
-    current_user: CurrentUser,
+    profile_id: CurrentProfileId,
     comment_in: CreateComment,
     target_id: str,
     target_type: TargetTypes
 ) -> Comment:
-    profile = session.exec(select(Profile).where(Profile.user_id == current_user.user_id)).first()
-    if not profile:
-        raise HTTPException(status_code=404, detail="Profile not found.")
-
     try:
         db_comment = comments.create_comment(
             session=session,
             comment_in=comment_in,
-            profile_id=profile.profile_id,
+            profile_id=profile_id,
             target_id=target_id,
             target_type=target_type
         )
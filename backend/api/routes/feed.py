@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, Query
+
+from backend.logic.schemas.feed import FeedPublic
+from backend.logic.controllers import feed
+from backend.api.deps import CurrentProfileId, SessionDep, get_current_user
+from backend.api.pagination import cursor_errors
+
+
+router = APIRouter(prefix="/feed", tags=["feed"])
+
+
+@router.get(
+    "/",
+    dependencies=[Depends(get_current_user)],
+    response_model=FeedPublic
+)
+def read_feed(
+    *,
+    session: SessionDep,
+    profile_id: CurrentProfileId,
+    after: str | None = None,
+    limit: int = Query(default=50, ge=1, le=100)
+) -> FeedPublic:
+    """
+    Get what the profiles followed by the current user did, newest first,
+    one page at a time.
+    """
+    with cursor_errors():
+        return feed.get_feed(session=session, profile_id=profile_id, after=after, limit=limit)
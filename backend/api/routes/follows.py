@@ -1,22 +1,46 @@
 import uuid
 from typing import Any, Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import select
 
 from backend.api.schemas import Message
 from backend.logic.models import Profile, Follow
 from backend.logic.schemas.follows import (
     FollowersPublic,
-    FollowingPublic
+    FollowingPublic,
+    FollowStatusesPublic,
+    FollowSuggestionsPublic,
+    ProfileIdsIn
 )
 from backend.logic.controllers import follows
-from backend.api.deps import CurrentUser, SessionDep, get_current_user
+from backend.api.deps import CurrentProfileId, SessionDep, get_current_user
+from backend.api.pagination import cursor_errors
 
 
 router = APIRouter(prefix="/follows", tags=["follows"])
 
 
+@router.post(
+    "/status",
+    dependencies=[Depends(get_current_user)],
+    response_model=FollowStatusesPublic,
+)
+def read_follow_statuses(
+    session: SessionDep,
+    profile_id: CurrentProfileId,
+    profiles_in: ProfileIdsIn
+) -> FollowStatusesPublic:
+    """
+    Tell, for each given profile, whether the current user follows it and
+    is followed by it.
+    """
+    statuses = follows.get_follow_statuses(
+        session=session, profile_id=profile_id, profile_ids=profiles_in.profile_ids
+    )
+    return FollowStatusesPublic(statuses=statuses)
+
+
 @router.post(
     "/{following_id}",  
     dependencies=[Depends(get_current_user)],
@@ -25,17 +49,13 @@ router = APIRouter(prefix="/follows", tags=["follows"])
 def create_follow(
     *, 
     session: SessionDep,
-    current_user: CurrentUser,
+    follower_id: CurrentProfileId,
     following_id: uuid.UUID
 ) -> Follow:
     """
     Create a new follow relationship between two profiles.
     Validates that both profiles exist before creating the relationship.
     """
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    follower_id = profile_in.profile_id
-
     following_profile = session.get(Profile, following_id)
 
     if not following_profile:
@@ -59,17 +79,19 @@ def create_follow(
     dependencies=[Depends(get_current_user)],
     response_model=FollowersPublic,
 )
-def read_profiles_followers(session: SessionDep, current_user: CurrentUser) -> FollowersPublic:
+def read_profiles_followers(
+    session: SessionDep,
+    follower_id: CurrentProfileId,
+    after: str | None = None,
+    limit: int = 100
+) -> FollowersPublic:
     """
-    Get all followers for a given profile.
+    Get the followers of a profile, one page at a time.
     """
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    follower_id = profile_in.profile_id
-
-    followers = follows.get_profile_followers(
-        session=session, profile_id=follower_id
-    )
+    with cursor_errors():
+        followers = follows.get_profile_followers(
+            session=session, profile_id=follower_id, after=after, limit=limit
+        )
 
     if not followers:
         raise HTTPException(status_code=404, detail="Profile not found")
@@ -82,17 +104,19 @@ def read_profiles_followers(session: SessionDep, current_user: CurrentUser) -> F
     dependencies=[Depends(get_current_user)],
     response_model=FollowingPublic,
 )
-def read_profiles_following(session: SessionDep, current_user: CurrentUser) -> FollowingPublic:
+def read_profiles_following(
+    session: SessionDep,
+    follower_id: CurrentProfileId,
+    after: str | None = None,
+    limit: int = 100
+) -> FollowingPublic:
     """
-    Get all profiles that a given profile is following.
+    Get the profiles that a profile is following, one page at a time.
     """
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    follower_id = profile_in.profile_id
-
-    followings = follows.get_profile_following(
-        session=session, profile_id=follower_id
-    )
+    with cursor_errors():
+        followings = follows.get_profile_following(
+            session=session, profile_id=follower_id, after=after, limit=limit
+        )
 
     if not followings:
         raise HTTPException(status_code=404, detail="Profile not found")
@@ -100,18 +124,41 @@ def read_profiles_following(session: SessionDep, current_user: CurrentUser) -> F
     return followings
 
 
+@router.get(
+    "/suggestions",
+    dependencies=[Depends(get_current_user)],
+    response_model=FollowSuggestionsPublic,
+)
+def read_follow_suggestions(
+    session: SessionDep,
+    profile_id: CurrentProfileId,
+    limit: int = Query(default=20, ge=1, le=100)
+) -> FollowSuggestionsPublic:
+    """
+    Suggest profiles followed by the profiles the current user follows.
+    """
+    suggestions = follows.get_follow_suggestions(session=session, profile_id=profile_id, limit=limit)
+    return FollowSuggestionsPublic(suggestions=suggestions)
+
+
 @router.get(
     "/profile/{profile_id}/followers",
     dependencies=[Depends(get_current_user)],
     response_model=FollowersPublic,
 )
-def read_other_profiles_followers(session: SessionDep, profile_id: uuid.UUID) -> FollowersPublic:
+def read_other_profiles_followers(
+    session: SessionDep,
+    profile_id: uuid.UUID,
+    after: str | None = None,
+    limit: int = 100
+) -> FollowersPublic:
     """
-    Get all followers for a given profile.
+    Get the followers of a profile, one page at a time.
     """
-    followers = follows.get_profile_followers(
-        session=session, profile_id=profile_id
-    )
+    with cursor_errors():
+        followers = follows.get_profile_followers(
+            session=session, profile_id=profile_id, after=after, limit=limit
+        )
 
     if not followers:
         raise HTTPException(status_code=404, detail="Profile not found")
@@ -124,13 +171,19 @@ def read_other_profiles_followers(session: SessionDep, profile_id: uuid.UUID) ->
     dependencies=[Depends(get_current_user)],
     response_model=FollowingPublic,
 )
-def read_other_profiles_following(session: SessionDep, profile_id: uuid.UUID) -> FollowingPublic:
+def read_other_profiles_following(
+    session: SessionDep,
+    profile_id: uuid.UUID,
+    after: str | None = None,
+    limit: int = 100
+) -> FollowingPublic:
     """
-    Get all profiles that a given profile is following.
+    Get the profiles that a profile is following, one page at a time.
     """
-    followings = follows.get_profile_following(
-        session=session, profile_id=profile_id
-    )
+    with cursor_errors():
+        followings = follows.get_profile_following(
+            session=session, profile_id=profile_id, after=after, limit=limit
+        )
 
     if not followings:
         raise HTTPException(status_code=404, detail="Profile not found")
@@ -145,16 +198,12 @@ def read_other_profiles_following(session: SessionDep, profile_id: uuid.UUID) ->
 )
 def delete_follow(
     session: SessionDep,
-    current_user: CurrentUser,
+    follower_id: CurrentProfileId,
     followed_id: uuid.UUID
 ) -> dict:
     """
     Delete an existing follow relationship between two profiles.
     """
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    follower_id = profile_in.profile_id
-
     db_follow = session.exec(
         select(Follow).where(
             Follow.follower_id == follower_id,
@@ -168,6 +217,5 @@ def delete_follow(
             detail="Follow not found.",
         )
     
-    session.delete(db_follow)
-    session.commit()
+    follows.delete_follow(session=session, follow=db_follow)
     return Message(message="Follow deleted successfully.")
\ No newline at end of file
@@ -4,11 +4,12 @@ from typing import Annotated, Any
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 
-from backend.logic.controllers import users
+from backend.logic.controllers import profiles, users
 from backend.api.deps import CurrentUser, SessionDep
 from backend.core import security
 from backend.core.security import get_password_hash
 from backend.api.schemas import Token
+from backend.logic.models import User
 from backend.logic.schemas.users import UserPublic
 
 
@@ -32,14 +33,16 @@ def login_access_token(
     access_token_expires = timedelta(minutes=60 * 24 * 8)
     return Token(
         access_token=security.create_access_token(
-            user.user_id, expires_delta=access_token_expires
+            user.user_id,
+            expires_delta=access_token_expires,
+            profile_id=profiles.get_profile_id_by_user_id(session=session, user_id=user.user_id)
         )
     )
 
 
 @router.post("/login/test-token", response_model=UserPublic)
-def test_token(current_user: CurrentUser) -> Any:
+def test_token(session: SessionDep, current_user: CurrentUser) -> Any:
     """
     Test access token
     """
-    return current_user
+    return session.get(User, current_user.user_id)
@@ -2,21 +2,18 @@ import uuid
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import func, select
+from sqlmodel import select
 
-from backend.logic.models import (
-    MovieList,
-    Profile
-)
-from backend.logic.entities.movie_list import MovieList as EntityMovieList
+from backend.logic.models import MovieList
 from backend.logic.schemas.movie_lists import (
     CreateMovieList,
     UpdateMovieList,
     MovieListPublic,
     MovieListsPublic
 )
-from backend.logic.controllers import movie_lists, movie_list_controller
-from backend.api.deps import CurrentUser, SessionDep, get_current_user
+from backend.logic.controllers import counts, movie_lists
+from backend.api.deps import CurrentProfileId, SessionDep, get_current_user
+from backend.api.pagination import CountMode, Skip, paginate
 from backend.api.schemas import Message
 
 
@@ -29,32 +26,32 @@ msg = "The movie lists with this id does not exist in the system"
     dependencies=[Depends(get_current_user)],
     response_model=MovieListsPublic
 )
-def read_public_lists(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
-    count_statement = select(func.count()).select_from(MovieList).filter(MovieList.privacy == False)
-    count = session.exec(count_statement).one()
+def read_public_lists(
+    session: SessionDep,
+    after: str | None = None,
+    limit: int = 100,
+    skip: Skip = None,
+    count_mode: CountMode = "exact"
+) -> Any:
+    count = counts.count_rows(
+        session=session, model=MovieList, where=MovieList.privacy == False, estimate=count_mode == "estimate"
+    )
 
-    statement = select(MovieList).offset(skip).limit(limit).filter(MovieList.privacy == False)
-    movielists = session.exec(statement).all()
-    
-    if movielists:
-        json_file = movie_list_controller.MovieListController().get_all()
-        json_list = {
-            (item["id"], item["profile_id"]): item
-            for item in json_file
-        }
-        
-        final_movie_lists = []
-        for ml in movielists:
-            key = (str(ml.list_id), str(ml.profile_id))
-            movies = json_list.get(key, {}).get("movies", [])
-            
-            movie_list_data = {attr: getattr(ml, attr) for attr in dir(ml) if not attr.startswith('_')}
-            movie_list_data["movies"] = movies
+    movielists, next_cursor = paginate(
+        session, select(MovieList).filter(MovieList.privacy == False),
+        key=(MovieList.created_at, MovieList.list_id),
+        after=after, skip=skip, limit=limit
+    )
 
-            final_movie_lists.append(movie_list_data)
-        movielists = final_movie_lists
+    movies = movie_lists.get_movies_by_list_ids(
+        session=session, list_ids=[ml.list_id for ml in movielists]
+    )
+    movielists = [
+        MovieListPublic.model_validate(ml, update={"movies": movies[ml.list_id]})
+        for ml in movielists
+    ]
 
-    return MovieListsPublic(movie_lists=movielists, count=count)
+    return MovieListsPublic(movie_lists=movielists, count=count, next_cursor=next_cursor)
 
 
 @router.get(
@@ -62,18 +59,11 @@ def read_public_lists(session: SessionDep, skip: int = 0, limit: int = 100) -> A
     dependencies=[Depends(get_current_user)],
     response_model=MovieListsPublic,
 )
-def read_lists(session: SessionDep, current_user: CurrentUser) -> Any:
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    profile_id = profile_in.profile_id
-
-    count_statement = select(func.count()).select_from(MovieList).filter(MovieList.profile_id == profile_id)
-    count = session.exec(count_statement).one()
-
+def read_lists(session: SessionDep, profile_id: CurrentProfileId) -> Any:
     statement = select(MovieList).filter(MovieList.profile_id == profile_id)
     movielists = session.exec(statement).all()
 
-    return MovieListsPublic(movie_lists=movielists, count=count)
+    return MovieListsPublic(movie_lists=movielists, count=len(movielists))
 
 
 @router.post(
@@ -81,24 +71,8 @@ def read_lists(session: SessionDep, current_user: CurrentUser) -> Any:
     dependencies=[Depends(get_current_user)],
     response_model=MovieListPublic
 )
-def create_list(session: SessionDep, list_in: CreateMovieList, current_user: CurrentUser) -> MovieList:
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    profile_id = profile_in.profile_id
-
+def create_list(session: SessionDep, list_in: CreateMovieList, profile_id: CurrentProfileId) -> MovieList:
     movielist = movie_lists.create_movie_list(session=session, movielist_create=list_in, profile_id=profile_id)
-    try:
-        movie_list_controller.MovieListController().add(EntityMovieList(
-            id=str(movielist.list_id),
-            profile_id=str(movielist.profile_id)
-        ))
-    except Exception:
-        session.delete(session.get(MovieList, movielist.list_id))
-        session.commit()
-        raise HTTPException(
-            status_code=500,
-            detail="Could not create movie list"
-        )
     return movielist
 
 
@@ -110,19 +84,18 @@ def create_list(session: SessionDep, list_in: CreateMovieList, current_user: Cur
 def read_movie_list_by_id(
     list_id: uuid.UUID, 
     session: SessionDep,
-    current_user: CurrentUser
+    profile_id: CurrentProfileId
 ) -> Any:
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    profile_id = profile_in.profile_id
-
     movielist: MovieList = session.get(MovieList, list_id)
+    if not movielist:
+        raise HTTPException(
+            status_code=404,
+            detail=msg,
+        )
     if not movielist.privacy or movielist.profile_id == profile_id:
-        json_file = movie_list_controller.MovieListController().get_by_id(str(list_id))
-        
-        movielist = {attr: getattr(movielist, attr) for attr in dir(movielist) if not attr.startswith('_')}
-        movielist["movies"] = json_file["movies"]
-    
+        movies = movie_lists.get_movies_by_list_ids(session=session, list_ids=[list_id])
+        return MovieListPublic.model_validate(movielist, update={"movies": movies[list_id]})
+
     return movielist
 
 
@@ -132,17 +105,12 @@ def read_movie_list_by_id(
     response_model=MovieListsPublic,
 )
 def read_lists_by_profile(session: SessionDep, profile_id: uuid.UUID) -> Any:
-    count_statement = select(func.count()).select_from(MovieList).where(
-        (MovieList.profile_id == profile_id) & (MovieList.privacy == False)
-    )
-    count = session.exec(count_statement).one()
-
     statement = select(MovieList).where(
         (MovieList.profile_id == profile_id) & (MovieList.privacy == False)
     )
     movielists = session.exec(statement).all()
 
-    return MovieListsPublic(movie_lists=movielists, count=count)
+    return MovieListsPublic(movie_lists=movielists, count=len(movielists))
 
 
 @router.patch(
@@ -154,12 +122,8 @@ def update_list(
     session: SessionDep, 
     list_id: uuid.UUID, 
     list_in: UpdateMovieList,
-    current_user: CurrentUser
+    profile_id: CurrentProfileId
 ) -> Any:
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    profile_id = profile_in.profile_id
-
     db_list: MovieList = session.get(MovieList, list_id)
     if not db_list:
         raise HTTPException(
@@ -185,12 +149,8 @@ def add_movie_to_list(
     session: SessionDep,
     list_id: uuid.UUID, 
     movie_id: str,
-    current_user: CurrentUser
+    profile_id: CurrentProfileId
 ) -> Any:
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    profile_id = profile_in.profile_id
-
     db_list: MovieList = session.get(MovieList, list_id)
     if not db_list:
         raise HTTPException(
@@ -203,7 +163,7 @@ def add_movie_to_list(
             detail='Not authorize to update list'
         )
     
-    add = movie_list_controller.MovieListController().add_movie(str(list_id), movie_id)
+    add = movie_lists.add_movie(session=session, list_id=list_id, movie_id=movie_id)
     alter = "not " if not add else " "
     return Message(message=f"{movie_id} {alter}added")
 
@@ -217,12 +177,8 @@ def remove_movie_to_list(
     session: SessionDep,
     list_id: uuid.UUID, 
     movie_id: str,
-    current_user: CurrentUser
+    profile_id: CurrentProfileId
 ) -> Any:
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    profile_id = profile_in.profile_id
-
     db_list: MovieList = session.get(MovieList, list_id)
     if not db_list:
         raise HTTPException(
@@ -235,7 +191,7 @@ def remove_movie_to_list(
             detail='Not authorize to update list'
         )
 
-    rmv = movie_list_controller.MovieListController().remove_movie(str(list_id), movie_id)
+    rmv = movie_lists.remove_movie(session=session, list_id=list_id, movie_id=movie_id)
     alter = "not " if not rmv else " "
     return Message(message=f"{movie_id} {alter}removed")
 
@@ -245,11 +201,7 @@ def remove_movie_to_list(
     dependencies=[Depends(get_current_user)],
     response_model=Message
 )
-def delete_movie_list(session: SessionDep, list_id: uuid.UUID, current_user: CurrentUser) -> Any:
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    profile_id = profile_in.profile_id
-
+def delete_movie_list(session: SessionDep, list_id: uuid.UUID, profile_id: CurrentProfileId) -> Any:
     db_list: MovieList = session.get(MovieList, list_id)
     if not db_list:
         raise HTTPException(
@@ -262,13 +214,5 @@ def delete_movie_list(session: SessionDep, list_id: uuid.UUID, current_user: Cur
             detail='Not authorize to delete list'
         )
     
-    rmv = movie_list_controller.MovieListController().remove(str(list_id))
-    if not rmv:
-        raise HTTPException(
-            status_code=500,
-            detail="Could not delete movie list"
-        )
-
-    session.delete(db_list)
-    session.commit()
+    movie_lists.delete_movie_list(session=session, db_movielist=db_list)
     return Message(message=f"{list_id} removed successfully")
@@ -1,10 +1,10 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import func, select
-from sqlalchemy.orm import selectinload
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session, select
 
+from backend.api.pagination import CountMode, Skip, paginate
 from backend.api.schemas import Message
 from backend.logic.models import (
     Profile
@@ -15,10 +15,19 @@ from backend.logic.schemas.profiles import (
     UpdateProfile,
     ProfilePublic,
     ProfilesPublic,
-    ProfilePublicEXT
+    ProfilePublicEXT,
+    TasteMatch,
+    TasteMatchesPublic
+)
+from backend.logic.controllers import counts, profile_counters, profiles, taste_match
+from backend.api.deps import (
+    CurrentProfile,
+    CurrentProfileId,
+    CurrentUser,
+    SessionDep,
+    get_current_active_admin,
+    get_current_user
 )
-from backend.logic.controllers import profiles
-from backend.api.deps import CurrentUser, SessionDep, get_current_active_admin, get_current_user
 
 
 router = APIRouter(prefix="/profiles", tags=["profiles"])
@@ -35,19 +44,48 @@ profile_not_found: dict[str, Any] = {
         }
 
 
+def _profile_public_ext(*, session: Session, profile: Profile) -> ProfilePublicEXT:
+    """
+    Build the extended public view of a profile from its stored counters,
+    without loading its ratings, follows or lists.
+    """
+    counters = profile_counters.get_profile_counters(session=session, profile_id=profile.profile_id)
+    return ProfilePublicEXT(
+        profile_id=profile.profile_id,
+        image_rel_path=profile.image_rel_path,
+        username=profile.username,
+        description=profile.description,
+        profile_role=profile.profile_role,
+        lists_count=counters.lists_count,
+        movies_rated=counters.movies_rated,
+        followers_count=counters.followers_count,
+        following_count=counters.following_count
+    )
+
+
 @router.get(
     "/",
     dependencies=[Depends(get_current_user)],
     response_model=ProfilesPublic,
 )
-def read_profiles(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
-    count_statement = select(func.count()).select_from(Profile)
-    count = session.exec(count_statement).one()
+def read_profiles(
+    session: SessionDep,
+    after: str | None = None,
+    limit: int = 100,
+    skip: Skip = None,
+    count_mode: CountMode = "exact"
+) -> Any:
+    count = counts.count_rows(
+        session=session, model=Profile, estimate=count_mode == "estimate"
+    )
 
-    statement = select(Profile).offset(skip).limit(limit)
-    profiles = session.exec(statement).all()
+    profiles, next_cursor = paginate(
+        session, select(Profile),
+        key=(Profile.profile_id,),
+        after=after, skip=skip, limit=limit
+    )
 
-    return ProfilesPublic(profiles=profiles, count=count)
+    return ProfilesPublic(profiles=profiles, count=count, next_cursor=next_cursor)
 
 
 @router.post(
@@ -84,52 +122,18 @@ def create_profile(*, session: SessionDep, profile_in: CreateProfile, current_us
 )
 def delete_profile(
     session: SessionDep, 
-    current_user: CurrentUser
+    db_profile: CurrentProfile
 ) -> Message:
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    db_profile = session.exec(statement).first()
-    if not db_profile:
-        raise HTTPException(
-            status_code=404,
-            detail="The profile with this id does not exist in the system",
-        )
-    
-    session.delete(db_profile)
-    session.commit()
+    profiles.delete_profile(session=session, db_profile=db_profile)
     return Message(message='Profile deleted successfully')
 
 
 @router.get("/my-profile", response_model=ProfilePublicEXT)
 def read_profile_by_user( 
     session: SessionDep,
-    current_user: CurrentUser
+    profile: CurrentProfile
 ) -> Any:
-    statement = (
-        select(Profile)
-        .where(Profile.user_id == current_user.user_id)
-        .options(
-            selectinload(Profile.rating),
-            selectinload(Profile.followers),
-            selectinload(Profile.following),
-            selectinload(Profile.movie_list)
-        )
-    )
-    result = session.exec(statement).first()
-
-    if not result:
-        raise HTTPException(status_code=404, detail=profile_not_found)
-
-    return ProfilePublicEXT(
-        profile_id=result.profile_id,
-        image_rel_path=result.image_rel_path,
-        username=result.username,
-        description=result.description,
-        profile_role= result.profile_role,
-        lists_count=len(result.movie_list),
-        movies_rated=len(result.rating),
-        followers_count=len(result.followers),
-        following_count=len(result.following)
-    )
+    return _profile_public_ext(session=session, profile=profile)
 
 
 @router.patch(
@@ -141,18 +145,11 @@ def update_logged_profile(
     *,
     session: SessionDep,
     profile_in: UpdateLogged,
-    current_user: CurrentUser
+    db_profile: CurrentProfile
 ) -> Any:
     """
     Update a user.
     """
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    db_profile = session.exec(statement).first()
-    if not db_profile:
-        raise HTTPException(
-            status_code=404,
-            detail="The profile with this id does not exist in the system",
-        )
     if profile_in.username:
         existing_profile = profiles.get_profile_by_username(session=session, username=profile_in.username)
         if existing_profile and existing_profile.profile_id != db_profile.profile_id:
@@ -169,32 +166,57 @@ def read_profile_by_id(
     profile_id: uuid.UUID, 
     session: SessionDep,
 ) -> Any:
-    statement = (
-        select(Profile)
-        .where(Profile.profile_id == profile_id)
-        .options(
-            selectinload(Profile.rating),
-            selectinload(Profile.followers),
-            selectinload(Profile.following),
-            selectinload(Profile.movie_list)
-        )
-    )
-    result = session.exec(statement).first()
+    result = session.get(Profile, profile_id)
 
     if not result:
         raise HTTPException(status_code=404, detail=profile_not_found)
 
-    return ProfilePublicEXT(
-        profile_id=result.profile_id,
-        image_rel_path=result.image_rel_path,
-        username=result.username,
-        description=result.description,
-        profile_role= result.profile_role,
-        lists_count=len(result.movie_list),
-        movies_rated=len(result.rating),
-        followers_count=len(result.followers),
-        following_count=len(result.following)
+    return _profile_public_ext(session=session, profile=result)
+
+
+@router.get(
+    "/{profile_id}/taste-match",
+    dependencies=[Depends(get_current_user)],
+    response_model=TasteMatch
+)
+def read_taste_match(
+    *,
+    session: SessionDep,
+    own_profile_id: CurrentProfileId,
+    profile_id: uuid.UUID
+) -> Any:
+    """
+    Get how similar the ratings of the current user and a profile are, on
+    the movies both rated.
+    """
+    other = session.get(Profile, profile_id)
+    if not other:
+        raise HTTPException(status_code=404, detail=profile_not_found)
+
+    return taste_match.get_taste_match(session=session, profile_id=own_profile_id, other=other)
+
+
+@router.get(
+    "/{profile_id}/taste-match/followers",
+    dependencies=[Depends(get_current_user)],
+    response_model=TasteMatchesPublic
+)
+def read_follower_taste_matches(
+    *,
+    session: SessionDep,
+    profile_id: uuid.UUID,
+    limit: int = Query(default=100, ge=1, le=1000)
+) -> Any:
+    """
+    Get the followers of a profile with the most similar ratings.
+    """
+    if not session.get(Profile, profile_id):
+        raise HTTPException(status_code=404, detail=profile_not_found)
+
+    matches = taste_match.get_follower_taste_matches(
+        session=session, profile_id=profile_id, limit=limit
     )
+    return TasteMatchesPublic(profile_id=profile_id, matches=matches)
 
 
 @router.patch(
@@ -1,17 +1,25 @@
+import io
 import uuid
-from typing import Any, Annotated
+from typing import Any, Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import func, select
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from sqlmodel import select
 
 from backend.logic.models import Rating, Profile
 from backend.logic.schemas.ratings import (
     CreateRating,
     ProfileRatingsPublic, 
-    MovieRatingsPublic
+    MovieRatingsPublic,
+    MovieIdsIn,
+    MovieRatingAveragesPublic,
+    MovieRatingStatsPublic,
+    RatingImportResult,
+    TopMoviesPublic
 )
 from backend.logic.controllers import ratings
-from backend.api.deps import CurrentUser, SessionDep, get_current_user
+from backend.logic.controllers.rating_leaderboard import Window, leaderboard
+from backend.core.config import settings
+from backend.api.deps import CurrentProfileId, OptionalProfileId, SessionDep, get_current_user
 from backend.api.schemas import Message
 
 
@@ -26,15 +34,11 @@ router = APIRouter(prefix="/ratings", tags=["ratings"])
 def read_my_ratings(
     *,
     session: SessionDep,
-    current_user: CurrentUser   
+    profile_id: CurrentProfileId
 ) -> ProfileRatingsPublic:
     """
     Retrieve all ratings made by a user (by profile).
     """
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    profile_id = profile_in.profile_id
-
     return ratings.get_ratings_by_profile(session=session, profile_id=profile_id)
 
 
@@ -44,12 +48,25 @@ def get_rating_statistics(*, session: SessionDep) -> dict[str, int]:
     Get the statistics of rating values across all movies.
     Returns a dictionary where keys are rating values (as strings) and values are counts.
     """
-    results = session.exec(
-        select(Rating.rate, func.count(Rating.rate))
-        .group_by(Rating.rate)
-    ).all()
+    return ratings.get_rating_histogram(session=session)
 
-    return {str(rate): count for rate, count in results}
+
+@router.get("/top", response_model=TopMoviesPublic)
+def read_top_movies(
+    *,
+    session: SessionDep,
+    window: Window = "all",
+    limit: int = Query(default=10, ge=1, le=100)
+) -> TopMoviesPublic:
+    """
+    Get the best rated movies, all time or rated in the last 7 or 30 days,
+    ranked by their Bayesian average so that movies with few ratings are
+    pulled towards the mean.
+    """
+    return TopMoviesPublic(
+        window=window,
+        movies=leaderboard.top(session=session, window=window, limit=limit)
+    )
 
 
 @router.post(
@@ -60,17 +77,13 @@ def get_rating_statistics(*, session: SessionDep) -> dict[str, int]:
 def create_or_update_rating(
     *, 
     session: SessionDep,
-    current_user: CurrentUser,
+    profile_id: CurrentProfileId,
     movie_id: str,
     rate_in: CreateRating
 ) -> Rating:
     """
     Create or update a rating for a movie by a profile.
     """
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    profile_id = profile_in.profile_id
-
     rating = CreateRating(
         rate=rate_in.rate,
     )
@@ -84,6 +97,37 @@ def create_or_update_rating(
     return rating
 
 
+@router.post(
+    "/import",
+    dependencies=[Depends(get_current_user)],
+    response_model=RatingImportResult
+)
+def import_ratings(
+    *,
+    session: SessionDep,
+    profile_id: CurrentProfileId,
+    file: UploadFile = File(...),
+    format: Literal["csv", "ndjson"] = "csv"
+) -> RatingImportResult:
+    """
+    Import ratings of the current user from a CSV (movie_id, rate) or NDJSON
+    file. The file is read line by line and written in batches, invalid rows
+    are skipped and reported.
+    """
+    lines = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    try:
+        return ratings.import_ratings(
+            session=session,
+            profile_id=profile_id,
+            rows=ratings.parse_ratings(lines, format=format),
+            batch_size=settings.RATING_IMPORT_BATCH_SIZE
+        )
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="The file must be UTF-8 encoded")
+    finally:
+        lines.detach()
+
+
 @router.get(
     "/profile/{profile_id}",
     dependencies=[Depends(get_current_user)],
@@ -128,12 +172,42 @@ def get_average_rating_for_movie(
     """
     Retrieve the average rating for a specific movie.
     """
-    avg = session.exec(
-        select(func.avg(Rating.rate)).where(Rating.movie_id == movie_id)
-    ).one_or_none()
-    
-    average = avg if avg is not None else 0.0
-    return {'avg_rate': round(average, 2)}
+    stats = ratings.get_movie_rating_stats(session=session, movie_id=movie_id)
+    return {'avg_rate': stats.avg_rate}
+
+
+@router.get("/movie/{movie_id}/stats", response_model=MovieRatingStatsPublic)
+def get_rating_stats_for_movie(
+    *,
+    session: SessionDep,
+    movie_id: str
+) -> MovieRatingStatsPublic:
+    """
+    Retrieve the number of ratings, the average and the distribution of the
+    rates of a movie.
+    """
+    return ratings.get_movie_rating_stats(session=session, movie_id=movie_id)
+
+
+@router.post(
+    "/movies/averages",
+    dependencies=[Depends(get_current_user)],
+    response_model=MovieRatingAveragesPublic
+)
+def get_average_ratings_for_movies(
+    *,
+    session: SessionDep,
+    profile_id: OptionalProfileId,
+    movies_in: MovieIdsIn
+) -> MovieRatingAveragesPublic:
+    """
+    Retrieve the average rating, the number of ratings and the rate of the
+    current user for several movies at once.
+    """
+    averages = ratings.get_movie_rating_averages(
+        session=session, movie_ids=movies_in.movie_ids, profile_id=profile_id
+    )
+    return MovieRatingAveragesPublic(averages=averages)
 
 
 @router.delete(
@@ -160,6 +234,5 @@ def delete_rating(
     if not rating:
         raise HTTPException(status_code=404, detail="Rating not found.")
 
-    session.delete(rating)
-    session.commit()
+    ratings.delete_rating(session=session, rating=rating)
     return Message(message="Rating deleted successfully.")
@@ -3,9 +3,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import func, select
 import uuid
 
-from backend.api.deps import CurrentUser, SessionDep, get_current_user
+from backend.api.deps import CurrentProfileId, SessionDep, get_current_user
 from backend.logic.controllers import reactions
-from backend.logic.models import Reaction, Profile
+from backend.logic.models import Reaction
 from backend.logic.enum import TargetTypes
 from backend.logic.schemas.reactions import (
     ReactionPublic,
@@ -28,12 +28,8 @@ def get_my_reactions(
     *,
     target_type: TargetTypes, 
     session: SessionDep,
-    current_user: CurrentUser
+    profile_id: CurrentProfileId
 ) -> None:
-    statement = select(Profile).where(Profile.user_id == current_user.user_id)
-    profile_in: Profile = session.exec(statement).first()
-    profile_id = profile_in.profile_id
-
     db_objs: list[Reaction] = reactions.get_reactions_by_profile(
         session=session, profile_id=profile_id, target_type=target_type
     )
@@ -51,24 +47,19 @@ def get_my_reactions(
 def create_reaction(
     *,
     session: SessionDep,
-    current_user: CurrentUser,
+    profile_id: CurrentProfileId,
     target_id: str,
     target_type: TargetTypes
 ) -> Reaction:
     """
     Create a reaction (like) to a target (movie, comment, article).
     """
-    profile = session.exec(select(Profile).where(Profile.user_id == current_user.user_id)).first()
-
-    if not profile:
-        raise HTTPException(status_code=404, detail="Profile not found for current user.")
-
     try:
         reaction = reactions.create_reaction(
             session=session,
             target_id=target_id,
             target_type=target_type,
-            profile_id=profile.profile_id
+            profile_id=profile_id
         )
     except Exception as e:
         raise HTTPException(
@@ -133,15 +124,10 @@ def delete_reaction(
     session: SessionDep, 
     target_type: TargetTypes, 
     target_id: str,
-    current_user: CurrentUser
+    profile_id: CurrentProfileId
 ) -> Message:
-    profile = session.exec(select(Profile).where(Profile.user_id == current_user.user_id)).first()
-
-    if not profile:
-        raise HTTPException(status_code=404, detail="Profile not found for current user.")
-    
     statement = select(Reaction).where(
-        (Reaction.profile_id == profile.profile_id) &
+        (Reaction.profile_id == profile_id) &
         (Reaction.target_type == target_type) & 
         (Reaction.target_id == target_id)
     )
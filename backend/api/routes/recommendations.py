@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Query
+
+from backend.logic.schemas.recommendations import MovieRecommendationsPublic
+from backend.logic.controllers import recommendations
+from backend.api.deps import CurrentProfileId, SessionDep, get_current_user
+
+
+router = APIRouter(prefix="/recommendations", tags=["recommendations"])
+
+
+@router.get(
+    "/movies",
+    dependencies=[Depends(get_current_user)],
+    response_model=MovieRecommendationsPublic
+)
+def read_movie_recommendations(
+    *,
+    session: SessionDep,
+    profile_id: CurrentProfileId,
+    limit: int = Query(default=20, ge=1, le=100)
+) -> MovieRecommendationsPublic:
+    """
+    Recommend movies to the current user from the movies similar to the
+    ones they rated, as computed by the offline neighbour index.
+    """
+    return MovieRecommendationsPublic(
+        profile_id=profile_id,
+        recommendations=recommendations.recommend_movies(
+            session=session, profile_id=profile_id, limit=limit
+        )
+    )
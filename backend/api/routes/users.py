@@ -2,9 +2,10 @@ from typing import Any, Annotated
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import func, select
+from sqlmodel import select
 
-from backend.api.schemas import Message
+from backend.api.pagination import CountMode, Skip, paginate
+from backend.api.schemas import Message, TTLCacheStats
 from backend.core.security import verify_password
 from backend.logic.models import (
     User
@@ -18,7 +19,7 @@ from backend.logic.schemas.users import (
     UserPublic,
     UsersPublic
 )
-from backend.logic.controllers import users
+from backend.logic.controllers import counts, users
 from backend.api.deps import CurrentUser, SessionDep, get_current_active_admin, get_current_user
 
 
@@ -31,18 +32,28 @@ msg = "The user with this id does not exist in the system"
     dependencies=[Depends(get_current_active_admin)],
     response_model=UsersPublic,
 )
-def read_users(session: SessionDep, skip: int = 0, limit: int = 100) -> Any:
+def read_users(
+    session: SessionDep,
+    after: str | None = None,
+    limit: int = 100,
+    skip: Skip = None,
+    count_mode: CountMode = "exact"
+) -> Any:
     """
     Retrieve users.
     """
 
-    count_statement = select(func.count()).select_from(User)
-    count = session.exec(count_statement).one()
+    count = counts.count_rows(
+        session=session, model=User, estimate=count_mode == "estimate"
+    )
 
-    statement = select(User).offset(skip).limit(limit)
-    users = session.exec(statement).all()
+    users, next_cursor = paginate(
+        session, select(User),
+        key=(User.created_at, User.user_id),
+        after=after, skip=skip, limit=limit
+    )
 
-    return UsersPublic(users=users, count=count)
+    return UsersPublic(users=users, count=count, next_cursor=next_cursor)
 
 
 @router.post(
@@ -65,6 +76,20 @@ def create_user(*, session: SessionDep, user_in: CreateUser) -> Any:
     return user
 
 
+@router.get(
+    "/cache/stats",
+    dependencies=[Depends(get_current_active_admin)],
+    response_model=TTLCacheStats
+)
+def read_user_cache_stats() -> Any:
+    """
+    Counters of the cache of authenticated users of this process.
+    """
+    stats = users.user_snapshots.stats()
+    lookups = stats["hits"] + stats["misses"]
+    return TTLCacheStats(**stats, hit_rate=stats["hits"] / lookups if lookups else 0.0)
+
+
 @router.post(
     "/signup",
     response_model=UserPublic
@@ -245,6 +270,5 @@ def delete_user_definitely(
             detail=msg,
         )
     
-    session.delete(db_user)
-    session.commit()
+    users.delete_user(session=session, db_user=db_user)
     return Message(message='User deleted successfully')
\ No newline at end of file
@@ -12,4 +12,22 @@ class Token(SQLModel):
     
 class TokenPayload(SQLModel):
     sub: str | None = None
-    
\ No newline at end of file
+    profile_id: str | None = None
+    
+
+
+class CacheStats(SQLModel):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+class TTLCacheStats(SQLModel):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    hit_rate: float
@@ -1,19 +1,32 @@
+from contextlib import asynccontextmanager, contextmanager
+
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 import uvicorn
 
+from backend.api.deps import get_db
 from backend.api.main import api_router
 from backend.core.config import settings
+from backend.logic.controllers.follow_graph import graph
 
 def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the follow graph before the first request needs it
+    with contextmanager(get_db)() as session:
+        graph.ensure_loaded(session=session)
+    yield
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
 )
 
 
@@ -0,0 +1,115 @@
+import argparse
+import time
+import uuid
+
+import numpy as np
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, func, insert, select
+
+from backend.core.config import settings
+from backend.logic.controllers import feed, profile_counters
+from backend.logic.enum import FeedActivities
+from backend.logic.models import FeedItem, Follow, Profile, ProfileCounters
+
+
+def popularity(n_profiles: int) -> np.ndarray:
+    weights = 1 / np.arange(1, n_profiles + 1) ** 1.1
+    return weights / weights.sum()
+
+
+def synthetic_follows(session: Session, n_profiles: int, follows_per_profile: int, seed: int = 0) -> list[uuid.UUID]:
+    """
+    Create profiles following others with a popularity skew, so a few
+    profiles have far more followers than the rest.
+    """
+    rng = np.random.default_rng(seed)
+    profile_ids = [uuid.uuid4() for _ in range(n_profiles)]
+    session.exec(insert(Profile), params=[
+        dict(profile_id=profile_id, user_id=uuid.uuid4(), username=f"p{i}")
+        for i, profile_id in enumerate(profile_ids)
+    ])
+
+    followed = rng.choice(n_profiles, (n_profiles, follows_per_profile), p=popularity(n_profiles))
+    followers = np.repeat(np.arange(n_profiles), follows_per_profile)
+    follows = {
+        (int(follower), int(other))
+        for follower, other in zip(followers, followed.ravel())
+        if follower != other
+    }
+    session.exec(insert(Follow), params=[
+        dict(follower_id=profile_ids[follower], following_id=profile_ids[followed])
+        for follower, followed in follows
+    ])
+    session.commit()
+    profile_counters.refresh_profile_counters(session=session)
+    return profile_ids
+
+
+def percentiles(timings: list[float]) -> str:
+    return f"p50 {np.percentile(timings, 50) * 1000:.2f}ms, p99 {np.percentile(timings, 99) * 1000:.2f}ms"
+
+
+def run(session: Session, profile_ids: list[uuid.UUID], activities: int, max_followers: int) -> None:
+    settings.FEED_FANOUT_MAX_FOLLOWERS = max_followers
+    session.exec(FeedItem.__table__.delete())
+    session.commit()
+
+    # Popular profiles are also the most active ones
+    rng = np.random.default_rng(1)
+    written, timings = 0, []
+    for actor in rng.choice(len(profile_ids), activities, p=popularity(len(profile_ids))):
+        start = time.perf_counter()
+        written += feed.publish_activity(
+            session=session,
+            actor_id=profile_ids[actor],
+            activity=FeedActivities.RATING,
+            object_id=uuid.uuid4().hex[:20],
+            detail="4.5"
+        )
+        session.commit()
+        timings.append(time.perf_counter() - start)
+    stored = session.exec(select(func.count()).select_from(FeedItem)).one()
+    print(f"  write: {written / activities:.1f} items per activity, {stored} stored, {percentiles(timings)}")
+
+    first, second = [], []
+    for reader in rng.choice(len(profile_ids), 500, replace=False):
+        start = time.perf_counter()
+        page = feed.get_feed(session=session, profile_id=profile_ids[reader], limit=50)
+        first.append(time.perf_counter() - start)
+        if page.next_cursor:
+            start = time.perf_counter()
+            feed.get_feed(session=session, profile_id=profile_ids[reader], after=page.next_cursor, limit=50)
+            second.append(time.perf_counter() - start)
+    print(f"  read first page: {percentiles(first)}")
+    if second:
+        print(f"  read next page: {percentiles(second)}")
+
+
+def init(n_profiles: int, follows_per_profile: int, activities: int) -> None:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        start = time.perf_counter()
+        profile_ids = synthetic_follows(session, n_profiles, follows_per_profile)
+        followers = session.exec(select(func.max(ProfileCounters.followers_count))).one()
+        print(f"{n_profiles} profiles, {session.exec(select(func.count()).select_from(Follow)).one()} follows "
+              f"(most followed: {followers}) generated in {time.perf_counter() - start:.1f}s")
+
+        configured = settings.FEED_FANOUT_MAX_FOLLOWERS
+        print(f"fan-out on write only, {activities} activities:")
+        run(session, profile_ids, activities, max_followers=n_profiles)
+        print(f"fan-out on read above {configured} followers:")
+        run(session, profile_ids, activities, max_followers=configured)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the feed write amplification and read latency.")
+    parser.add_argument("--profiles", type=int, default=10_000)
+    parser.add_argument("--follows", type=int, default=30, help="Follows per profile")
+    parser.add_argument("--activities", type=int, default=500)
+    args = parser.parse_args()
+    init(args.profiles, args.follows, args.activities)
+
+
+if __name__ == "__main__":
+    main()
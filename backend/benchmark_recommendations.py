@@ -0,0 +1,82 @@
+import argparse
+import time
+
+import numpy as np
+
+from backend.logic.controllers.recommendations import RatingMatrix, build_neighbour_index
+
+
+def synthetic_ratings(n_ratings: int, n_profiles: int, n_movies: int, seed: int = 0) -> RatingMatrix:
+    """
+    Generate ratings with a popularity skew and a latent taste structure, so
+    the neighbours are neither uniform nor random.
+    """
+    rng = np.random.default_rng(seed)
+    popularity = 1 / np.arange(1, n_movies + 1) ** 0.8
+    popularity /= popularity.sum()
+
+    # Draw more pairs than needed and drop the repeated ones
+    profiles = rng.integers(0, n_profiles, int(n_ratings * 1.3))
+    movies = rng.choice(n_movies, size=len(profiles), p=popularity)
+    _, first = np.unique(profiles.astype(np.int64) * n_movies + movies, return_index=True)
+    first = rng.permutation(first)[:n_ratings]
+    profiles, movies = profiles[first], movies[first]
+
+    tastes = rng.normal(size=(n_profiles, 8)).astype(np.float32)
+    genres = rng.normal(size=(n_movies, 8)).astype(np.float32)
+    affinity = np.einsum('ij,ij->i', tastes[profiles], genres[movies]) / np.sqrt(8)
+    rates = np.clip(np.round((3.25 + affinity + rng.normal(0, 0.5, len(profiles))) * 2) / 2, 0.5, 5)
+
+    return RatingMatrix(
+        movie_ids=np.array([f"tt{i:07d}" for i in range(n_movies)], dtype='U20'),
+        profiles=profiles.astype(np.int32),
+        movies=movies.astype(np.int32),
+        rates=rates.astype(np.float32),
+        n_profiles=n_profiles
+    )
+
+
+def init(n_ratings: int, n_profiles: int, n_movies: int, k: int, changed: int) -> None:
+    start = time.perf_counter()
+    matrix = synthetic_ratings(n_ratings, n_profiles, n_movies)
+    print(f"{len(matrix.rates)} ratings, {n_profiles} profiles, {n_movies} movies "
+          f"generated in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    index, _ = build_neighbour_index(matrix, k=k)
+    print(f"full build (k={k}): {time.perf_counter() - start:.1f}s, "
+          f"{index.neighbours.nbytes + index.scores.nbytes + index.movie_ids.nbytes} bytes")
+
+    rng = np.random.default_rng(1)
+    changed_ids = matrix.movie_ids[rng.choice(n_movies, changed, replace=False)]
+    start = time.perf_counter()
+    _, rebuilt = build_neighbour_index(matrix, k=k, previous=index, changed=changed_ids)
+    print(f"incremental build ({rebuilt} changed movies): {time.perf_counter() - start:.1f}s")
+
+    order = np.argsort(matrix.profiles, kind='stable')
+    bounds = np.searchsorted(matrix.profiles[order], np.arange(n_profiles + 1))
+    timings = []
+    for profile in rng.choice(n_profiles, 1000, replace=False):
+        rows = order[bounds[profile]:bounds[profile + 1]]
+        movie_ids, rates = matrix.movie_ids[matrix.movies[rows]], matrix.rates[rows]
+        start = time.perf_counter()
+        index.recommend(list(movie_ids), list(rates), limit=20)
+        timings.append(time.perf_counter() - start)
+
+    timings = np.array(timings) * 1000
+    print(f"recommend: p50 {np.percentile(timings, 50):.2f}ms, p99 {np.percentile(timings, 99):.2f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the recommendation index on synthetic ratings.")
+    parser.add_argument("--ratings", type=int, default=1_000_000)
+    parser.add_argument("--profiles", type=int, default=50_000)
+    parser.add_argument("--movies", type=int, default=10_000)
+    parser.add_argument("--k", type=int, default=50)
+    parser.add_argument("--changed", type=int, default=100, help="Movies recomputed by the incremental build")
+    args = parser.parse_args()
+    init(args.ratings, args.profiles, args.movies, args.k, args.changed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import argparse
+
+from sqlmodel import Session
+
+from backend.core.config import settings
+from backend.core.db import engine
+from backend.logic.controllers import recommendations
+
+
+def init(k: int, full: bool, cosine: bool) -> None:
+    with Session(engine) as session:
+        result = recommendations.build_recommendations(
+            session=session, k=k, adjusted=not cosine, full=full
+        )
+
+    mode = "updated" if result.incremental else "built"
+    print(f"Neighbour index {mode}: {result.movies} movies, {result.rebuilt} rows computed")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the item-item index of the movie recommendations.")
+    parser.add_argument("--k", type=int, default=settings.RECOMMENDATION_NEIGHBOURS, help="Neighbours kept per movie")
+    parser.add_argument("--full", action="store_true", help="Recompute every movie instead of the changed ones")
+    parser.add_argument("--cosine", action="store_true", help="Plain cosine instead of the adjusted cosine")
+    args = parser.parse_args()
+    init(args.k, args.full, args.cosine)
+
+
+if __name__ == "__main__":
+    main()
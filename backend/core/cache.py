@@ -0,0 +1,170 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class LRUCache:
+    """
+    Thread-safe least recently used cache bounded by the size of its values.
+
+    Every entry carries a ``version`` (for instance the mtime of the file it
+    was read from). A lookup with a different version is a miss, which lets
+    callers detect changes made by other processes without reading the data.
+
+    Args:
+        max_bytes (int): Total size of the cached values before evicting.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, version: Any = None) -> Any | None:
+        """
+        Return the cached value, None if it is missing or stale.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int, version: Any = None) -> None:
+        """
+        Cache a value of ``size`` bytes, evicting the least recently used ones.
+
+        Values bigger than the whole cache are not stored.
+        """
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, version, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.size -= evicted
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                size_bytes=self.size,
+                max_bytes=self.max_bytes
+            )
+
+
+class TTLCache:
+    """
+    Thread-safe cache whose entries expire ``ttl`` seconds after being stored.
+
+    ``get_or_load`` is single-flight: when an entry is missing, only one
+    thread runs the loader while the others wait for its result, so an
+    expired hot key causes one reload instead of one per request.
+
+    Args:
+        ttl (float): Lifetime of an entry in seconds.
+        max_entries (int): Number of entries kept before evicting the oldest ones.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._loading: dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Return the cached value, None if it is missing or expired.
+        """
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        Return the cached value, calling ``load`` once to fill a missing entry.
+        """
+        with self._lock:
+            value = self._get(key)
+            if value is not None:
+                return value
+            loading = self._loading.setdefault(key, threading.Lock())
+
+        with loading:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] > time.monotonic():
+                    return entry[0]
+            try:
+                value = load()
+                if value is not None:
+                    self.put(key, value)
+                return value
+            finally:
+                with self._lock:
+                    if self._loading.get(key) is loading:
+                        del self._loading[key]
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries)
+            )
@@ -70,6 +70,44 @@ class Settings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    # Size of the in-process cache of article bodies
+    ARTICLE_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    # Lifetime of the cached total counts of the list endpoints
+    COUNT_CACHE_TTL_SECONDS: int = 30
+    # Number of rows written by each upsert of a rating import
+    RATING_IMPORT_BATCH_SIZE: int = 500
+    # Number of similar movies kept per movie by the recommendation index
+    RECOMMENDATION_NEIGHBOURS: int = 50
+    # Virtual ratings at the mean added to every movie of the top movies
+    RATING_TOP_PRIOR_WEIGHT: float = 10
+    # Minimum delay between two writes of the top movies aggregates
+    RATING_TOP_PERSIST_SECONDS: int = 60
+    # Lifetime of the cached histogram of /ratings/statistics
+    RATING_STATISTICS_TTL_SECONDS: int = 60
+    # Items kept in the feed timeline of each profile
+    FEED_MAX_ITEMS: int = 500
+    # Profiles with more followers are read from their outbox by each
+    # follower instead of being copied to every timeline
+    FEED_FANOUT_MAX_FOLLOWERS: int = 200
+    # Items a timeline holds over FEED_MAX_ITEMS before a write trims it
+    FEED_TRIM_MARGIN: int = 50
+    # Minimum delay between two checks of the in-memory follow graph against
+    # the follows written by the other workers
+    FOLLOW_GRAPH_CHECK_SECONDS: int = 10
+    # Lifetime of the cached rating vectors of the taste matches, the ratings
+    # written by the other workers are seen once it expires
+    TASTE_VECTOR_TTL_SECONDS: int = 30
+    # Number of profiles whose rating vectors are cached
+    TASTE_VECTOR_MAX_ENTRIES: int = 20_000
+    # Lifetime of the cached profile id of each authenticated user, kept
+    # short since the other workers only see a deleted profile once it expires
+    PROFILE_CACHE_TTL_SECONDS: int = 10
+    # Lifetime of the cached status and type of each authenticated user,
+    # 0 reads the user on every request
+    USER_CACHE_TTL_SECONDS: int = 30
+    # Number of users whose status and type are cached
+    USER_CACHE_MAX_ENTRIES: int = 10_000
+
     EMAIL_TEST_USER: EmailStr = "test@example.com"
     FIRST_SUPERUSER: EmailStr
     FIRST_SUPERUSER_PASSWORD: str
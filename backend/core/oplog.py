@@ -0,0 +1,280 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from backend.core.storage import atomic_write_json, file_id, file_lock, fsync_dir
+
+
+class OperationLog:
+    """
+    Append-only operation log backed by a snapshot file.
+
+    Every change is written as a single JSON line to ``<snapshot>.log`` and
+    applied to an in-memory state, so a small edit costs one appended line
+    instead of rewriting the whole document. Once the log grows past
+    ``compact_threshold`` records it is rotated and folded into the snapshot
+    by a background thread.
+
+    Several processes can share the same files. Writers hold an exclusive
+    ``file_lock`` on the snapshot and first catch up with the records other
+    processes appended. Readers never take the lock while the files are only
+    growing: they tail the live log from the last offset they applied, and
+    only fall back to a full reload under a shared lock after a compaction
+    replaced the files.
+
+    Recovery replays ``snapshot + rotated log + live log``. A torn trailing
+    line (a crash in the middle of an append) is discarded and truncated.
+    Operations must be idempotent: a crash between writing the new snapshot
+    and removing the rotated log replays records already in the snapshot.
+
+    Args:
+        snapshot_path (str): Path of the JSON snapshot file.
+        load (Callable): Builds the in-memory state from the snapshot content.
+        dump (Callable): Serializes the in-memory state back to snapshot content.
+        apply (Callable): Applies one record to the state, returns True if it changed it.
+        copy (Callable): Returns a detached copy of the state for compaction.
+        compact_threshold (int): Number of log records that triggers a compaction.
+        fsync (bool): Whether to fsync the log after every append.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        *,
+        load: Callable[[Any], dict],
+        dump: Callable[[dict], Any],
+        apply: Callable[[dict, dict], bool],
+        copy: Callable[[dict], dict],
+        compact_threshold: int = 1000,
+        fsync: bool = True,
+    ):
+        self.snapshot_path = snapshot_path
+        self.log_path = f"{os.path.splitext(snapshot_path)[0]}.log"
+        self.rotated_path = f"{self.log_path}.1"
+        self.compact_path = f"{self.log_path}.compact"
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+
+        self._load = load
+        self._dump = dump
+        self._apply = apply
+        self._copy = copy
+
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._compacting: threading.Thread | None = None
+        self.state: dict = {}
+        self.pending = 0
+        self._snapshot_id = None
+        self._log_ino = None
+        self._log_offset = 0
+
+        with file_lock(self.snapshot_path, shared=True):
+            self.recover()
+
+    def recover(self) -> None:
+        """
+        Rebuild the in-memory state from the snapshot and the pending logs.
+
+        Must be called holding the file lock, shared or exclusive.
+        """
+        with self._lock:
+            snapshot = None
+            if os.path.exists(self.snapshot_path):
+                try:
+                    with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                        snapshot = json.load(f)
+                except json.JSONDecodeError:
+                    snapshot = None
+            self._snapshot_id = file_id(self.snapshot_path)
+            self.state = self._load(snapshot)
+            self.pending = 0
+
+            self._replay(self._read_log(self.rotated_path, 0)[0])
+            records, self._log_offset, self._log_ino = self._read_log(self.log_path, 0)
+            self._replay(records)
+
+    def _replay(self, records: list[dict]) -> None:
+        for record in records:
+            self._apply(self.state, record)
+            self.pending += 1
+
+    def _read_log(self, path: str, offset: int) -> tuple[list[dict], int, int | None]:
+        """
+        Read the complete records of a log from an offset.
+
+        Returns:
+            tuple: The records, the offset after the last complete record
+            and the inode of the file that was read (None if it does not exist).
+        """
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return [], 0, None
+
+        records = []
+        with f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+                offset += len(line)
+            return records, offset, os.fstat(f.fileno()).st_ino
+
+    def _sync(self) -> None:
+        """
+        Apply the records appended by other processes since the last sync.
+        """
+        log_id = file_id(self.log_path)
+        log_ino = log_id[0] if log_id else None
+        rotated = log_ino != self._log_ino and not (log_ino is not None and self._log_ino is None)
+        if file_id(self.snapshot_path) != self._snapshot_id or rotated:
+            # Another process compacted the files, reload everything
+            self._reload()
+            return
+
+        if log_id is None or log_id[2] == self._log_offset:
+            return
+        records, offset, ino = self._read_log(self.log_path, self._log_offset)
+        if ino != log_ino:
+            self._reload()
+            return
+        self._replay(records)
+        self._log_offset = offset
+        self._log_ino = ino
+
+    def _reload(self) -> None:
+        if self._lock_depth:
+            self.recover()
+            return
+        with file_lock(self.snapshot_path, shared=True):
+            self.recover()
+
+    @contextmanager
+    def read(self) -> Iterator[dict]:
+        """
+        Give access to an up to date state without taking the file lock.
+        """
+        with self._lock:
+            self._sync()
+            yield self.state
+
+    @contextmanager
+    def transaction(self) -> Iterator[dict]:
+        """
+        Give exclusive access to the state, across threads and processes.
+
+        Calls to ``append`` inside the transaction reuse the lock.
+        """
+        with self._lock:
+            if self._lock_depth:
+                self._lock_depth += 1
+                try:
+                    yield self.state
+                finally:
+                    self._lock_depth -= 1
+                return
+
+            with file_lock(self.snapshot_path):
+                self._lock_depth = 1
+                try:
+                    self._sync()
+                    yield self.state
+                finally:
+                    self._lock_depth = 0
+
+    def append(self, record: dict) -> bool:
+        """
+        Apply a record to the in-memory state and persist it to the log.
+
+        Records that do not change the state are not written.
+
+        Returns:
+            bool: True if the record changed the state.
+        """
+        with self.transaction() as state:
+            if not self._apply(state, record):
+                return False
+
+            line = json.dumps(record, separators=(',', ':')) + '\n'
+            log_id = file_id(self.log_path)
+            if log_id and log_id[2] != self._log_offset:
+                # Drop a torn tail left by a crashed writer
+                os.truncate(self.log_path, self._log_offset)
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+                self._log_offset = f.tell()
+                self._log_ino = os.fstat(f.fileno()).st_ino
+
+            self.pending += 1
+            if self.pending >= self.compact_threshold:
+                self._start_compaction()
+            return True
+
+    def _start_compaction(self) -> None:
+        if self._compacting and self._compacting.is_alive():
+            return
+        self._compacting = threading.Thread(target=self.compact, daemon=True)
+        self._compacting.start()
+
+    def compact(self) -> None:
+        """
+        Fold the log into a new snapshot.
+
+        The live log is rotated under the lock together with a copy of the
+        state, so writers only wait for the rename while the snapshot itself
+        is written outside the lock. Only one process compacts at a time.
+        """
+        with file_lock(self.compact_path, blocking=False) as acquired:
+            if not acquired:
+                return
+
+            with self.transaction() as state:
+                if os.path.exists(self.rotated_path):
+                    # A previous compaction crashed, the rotated log is part of
+                    # the state and must not be overwritten
+                    self._replace_snapshot(self._copy(state))
+                if os.path.exists(self.log_path):
+                    os.replace(self.log_path, self.rotated_path)
+                self._log_ino = None
+                self._log_offset = 0
+                state = self._copy(state)
+                self.pending = 0
+
+            tmp_path = f"{self.snapshot_path}.tmp"
+            atomic_write_json(tmp_path, self._dump(state))
+
+            with self.transaction():
+                os.replace(tmp_path, self.snapshot_path)
+                if os.path.exists(self.rotated_path):
+                    os.remove(self.rotated_path)
+                fsync_dir(os.path.dirname(os.path.abspath(self.snapshot_path)))
+                self._snapshot_id = file_id(self.snapshot_path)
+
+    def _replace_snapshot(self, state: dict) -> None:
+        atomic_write_json(self.snapshot_path, self._dump(state))
+        if os.path.exists(self.rotated_path):
+            os.remove(self.rotated_path)
+        self._snapshot_id = file_id(self.snapshot_path)
+
+    def reset(self, state: dict) -> None:
+        """
+        Replace the whole state and drop every pending log.
+        """
+        with self.transaction():
+            self.state = state
+            self._replace_snapshot(self._copy(state))
+            if os.path.exists(self.log_path):
+                os.remove(self.log_path)
+            self._log_ino = None
+            self._log_offset = 0
+            self.pending = 0
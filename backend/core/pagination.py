@@ -0,0 +1,106 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy import tuple_
+from sqlmodel import Session
+from sqlmodel.sql.expression import SelectOfScalar
+
+
+class InvalidCursor(ValueError):
+    """
+    Raised for a cursor that is malformed or does not match the key.
+    """
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Build an opaque cursor from the key values of the last row of a page.
+    """
+    data = json.dumps([
+        value.isoformat() if isinstance(value, datetime) else
+        str(value) if isinstance(value, uuid.UUID) else value
+        for value in values
+    ], separators=(',', ':'))
+    return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, key: Sequence[Any]) -> list[Any]:
+    """
+    Read the key values of a cursor built by ``encode_cursor``.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or does not match the key.
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(data)
+        if not isinstance(values, list) or len(values) != len(key):
+            raise ValueError(cursor)
+
+        decoded = []
+        for column, value in zip(key, values):
+            python_type = column.type.python_type
+            if python_type is datetime:
+                decoded.append(datetime.fromisoformat(value))
+            elif python_type is uuid.UUID:
+                decoded.append(uuid.UUID(value))
+            else:
+                decoded.append(python_type(value))
+        return decoded
+    except (ValueError, TypeError):
+        raise InvalidCursor("Invalid cursor")
+
+
+def paginate(
+    session: Session,
+    statement: SelectOfScalar,
+    *,
+    key: Sequence[Any],
+    after: str | None = None,
+    skip: int | None = None,
+    limit: int = 100,
+    descending: bool = False
+) -> tuple[list[Any], str | None]:
+    """
+    Read one page of a statement ordered by a unique key.
+
+    With ``after`` the page starts right after the row the cursor points to,
+    using a row value comparison that an index on the key columns can serve,
+    so the cost does not depend on how deep the page is. ``skip`` is the
+    deprecated offset pagination and is ignored when a cursor is given.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        statement (SelectOfScalar): Select of the rows to paginate, without ordering.
+        key (Sequence): Columns that order the rows, the last one must make them unique.
+        after (str | None): Cursor returned by the previous page.
+        skip (int | None): Number of rows to skip.
+        limit (int): Maximum number of rows of the page.
+        descending (bool): Order by the key from the highest value.
+
+    Returns:
+        tuple: The rows of the page and the cursor of the next page, None on the last page.
+
+    Raises:
+        InvalidCursor: If ``after`` is not a cursor of this key.
+    """
+    if descending:
+        statement = statement.order_by(*(column.desc() for column in key))
+    else:
+        statement = statement.order_by(*key)
+    if after:
+        position = tuple_(*decode_cursor(after, key))
+        statement = statement.where(tuple_(*key) < position if descending else tuple_(*key) > position)
+    elif skip:
+        statement = statement.offset(skip)
+
+    rows = session.exec(statement.limit(limit + 1)).all()
+    if len(rows) <= limit:
+        return list(rows), None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return list(rows), encode_cursor([getattr(last, column.key) for column in key])
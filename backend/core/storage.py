@@ -0,0 +1,105 @@
+import fcntl
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+
+def lock_path(path: str) -> str:
+    return f"{path}.lock"
+
+
+@contextmanager
+def file_lock(path: str, *, shared: bool = False, blocking: bool = True) -> Iterator[bool]:
+    """
+    Advisory lock shared by every process working on a storage file.
+
+    The lock is taken on a sidecar ``<path>.lock`` file, so the data file
+    itself can be replaced by an atomic rename while the lock is held.
+
+    Args:
+        path (str): Path of the protected storage file.
+        shared (bool): Take a shared lock instead of an exclusive one.
+        blocking (bool): Wait for the lock. When False the context yields
+            False instead of waiting if the lock is held by someone else.
+
+    Yields:
+        bool: Whether the lock was acquired.
+    """
+    fd = os.open(lock_path(path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        if not blocking:
+            flags |= fcntl.LOCK_NB
+        try:
+            fcntl.flock(fd, flags)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_json(path: str, data: Any, *, indent: int | None = 4) -> None:
+    """
+    Write a JSON document so that readers see either the old or the new file.
+
+    The content is written to a temporary file in the same directory, flushed
+    to disk and renamed over the target.
+
+    Args:
+        path (str): Destination file.
+        data (Any): JSON serializable content.
+        indent (int | None): Indentation passed to ``json.dump``.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    fsync_dir(directory)
+
+
+def fsync_dir(directory: str) -> None:
+    """
+    Persist a rename or an unlink done inside a directory.
+    """
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def read_json(path: str) -> Any:
+    """
+    Read a JSON document without taking any lock.
+
+    Writers only replace files through ``atomic_write_json``, so a reader
+    never observes a partially written document.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def file_id(path: str) -> tuple[int, int, int] | None:
+    """
+    Identify the current version of a file, None if it does not exist.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
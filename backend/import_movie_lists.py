@@ -0,0 +1,22 @@
+from sqlmodel import Session
+
+from backend.core.db import engine
+from backend.logic.controllers import movie_lists
+from backend.logic.controllers.movie_list_controller import MovieListController
+
+
+def init() -> None:
+    with Session(engine) as session:
+        imported = movie_lists.import_movie_lists(
+            session=session,
+            movie_lists_data=MovieListController().get_all()
+        )
+    print(f"{imported} movies imported")
+
+
+def main() -> None:
+    init()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import argparse
+
+from sqlmodel import Session
+
+from backend.core.config import settings
+from backend.core.db import engine
+from backend.logic.controllers import profiles, ratings
+from backend.logic.controllers.rating_leaderboard import leaderboard
+
+
+def init(path: str, username: str, format: str, batch_size: int) -> None:
+    with Session(engine) as session:
+        profile = profiles.get_profile_by_username(session=session, username=username)
+        if not profile:
+            raise SystemExit(f"Profile '{username}' not found")
+
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            result = ratings.import_ratings(
+                session=session,
+                profile_id=profile.profile_id,
+                rows=ratings.parse_ratings(f, format=format),
+                batch_size=batch_size
+            )
+        # The API process picks up the rebuilt top movies on its next read
+        leaderboard.rebuild(session=session)
+
+    print(f"{result.imported} ratings imported, {result.failed} rows failed")
+    for error in result.errors:
+        print(f"line {error.line}: {error.error}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import the ratings of a profile from a CSV or NDJSON file.")
+    parser.add_argument("path", help="CSV file with movie_id and rate columns, or NDJSON file")
+    parser.add_argument("--username", required=True, help="Profile the ratings belong to")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="Defaults to the file extension")
+    parser.add_argument("--batch-size", type=int, default=settings.RATING_IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    format = args.format or ("ndjson" if args.path.endswith((".ndjson", ".jsonl")) else "csv")
+    init(args.path, args.username, format, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,101 +1,167 @@
+import hashlib
 import json
+import logging
 import os
+import shutil
+from backend.core.cache import LRUCache
+from backend.core.config import settings
+from backend.core.storage import atomic_write_json, file_id, file_lock, read_json
 from backend.logic.entities.article import Article
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 DIR_DATA = os.path.join(CURRENT_DIR, '..', '..', 'data', 'json')
 DIR_DATA = os.path.abspath(DIR_DATA)
 
+body_cache = LRUCache(max_bytes=settings.ARTICLE_CACHE_MAX_BYTES)
+
+logger = logging.getLogger(__name__)
+
 
 class ArticleController:
+    """
+    Storage of article bodies, one JSON document per article.
+
+    Documents are spread over hashed subdirectories
+    (``articles/ab/cd/<article_id>.json``) so that reading, updating or
+    deleting an article only touches its own file. Writers lock the leaf
+    directory of the document and replace it with an atomic rename.
+
+    Documents read by ``get_by_id`` are kept in ``body_cache``. Writes made
+    through the controller invalidate the entry, and every hit is checked
+    against the file identity so changes from other processes are seen.
+    """
+
     def __init__(self):
+        self.cache = body_cache
+        self.directory = os.path.join(DIR_DATA, 'articles')
         self.file = os.path.join(DIR_DATA, 'storage_article.json')
-        if not os.path.exists(self.file):
+        if not os.path.exists(self.directory):
             try:
-                with open(self.file, 'w', encoding='utf-8') as f:
-                    json.dump([], f)
-            except Exception as e:
-                print(f"Error al crear el articulo: {e}")
+                os.makedirs(self.directory, exist_ok=True)
+            except Exception:
+                logger.exception("Error al crear el articulo")
                 raise
 
+    def _path(self, article_id: str) -> str:
+        digest = hashlib.sha1(str(article_id).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest[2:4], f"{article_id}.json")
+
     def add(self, new_article: Article) -> Article:
         if not isinstance(new_article, Article):
             raise ValueError("El objeto proporcionado no es una instancia de Articulo.")
 
         try:
-            with open(self.file, 'r+', encoding='utf-8') as f:
-                content = f.read().strip()
-                data = json.loads(content) if content else []
-                data.append(new_article.to_dict())
-                f.seek(0)
-                f.truncate()
-                json.dump(data, f, indent=4)
+            self._write(new_article.to_dict())
             return new_article.article_id
         except Exception as e:
             raise RuntimeError(f"Error al agregar articulo: {e}")
 
+    def _write(self, article: dict) -> None:
+        path = self._path(article['article_id'])
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        with file_lock(directory):
+            atomic_write_json(path, article)
+            self.cache.invalidate(path)
+
     def get_all(self):
+        articles = []
         try:
-            with open(self.file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return data
-        except Exception as e:
-            print(f"Error al obtener los articulos: {e}")
+            for root, _, files in os.walk(self.directory):
+                for name in sorted(files):
+                    if name.endswith('.json'):
+                        articles.append(read_json(os.path.join(root, name)))
+            return articles
+        except Exception:
+            logger.exception("Error al obtener los articulos")
             return []
 
     def get_by_id(self, article_id: str):
-        print(article_id)
+        """
+        Get an article document, from the cache when the file did not change.
+
+        The returned document is shared with the cache and must not be modified.
+        """
+        path = self._path(article_id)
         try:
-            with open(self.file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                for article in data:
-                    if article['article_id'] == article_id:
-                        return article
-        except Exception as e:
-            print(f"Error al obtener articulo con su id '{article_id}': {e}")
+            version = file_id(path)
+            if version is None:
+                return None
+
+            article = self.cache.get(path, version)
+            if article is None:
+                article = read_json(path)
+                self.cache.put(path, article, size=version[2], version=version)
+            return article
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.exception("Error al obtener articulo con su id '%s'", article_id)
         return None
-    
+
     def update_article(self, article_id: str, updates: dict) -> bool:
+        path = self._path(article_id)
         try:
-            with open(self.file, 'r+', encoding='utf-8') as f:
-                data = json.load(f)
-
-                for i, article in enumerate(data):
-                    if article['article_id'] == article_id:
-                        data[i]['body'].update(updates)
-                        f.seek(0)
-                        f.truncate()
-                        json.dump(data, f, indent=4)
-                        return True
-
+            with file_lock(os.path.dirname(path)):
+                article = read_json(path)
+                article['body'].update(updates)
+                atomic_write_json(path, article)
+                self.cache.invalidate(path)
+                return True
+        except FileNotFoundError:
             return False  # No se encontró el artículo
-        except Exception as e:
-            print(f"Error al actualizar artículo con ID '{article_id}': {e}")
+        except Exception:
+            logger.exception("Error al actualizar artículo con ID '%s'", article_id)
             return False
-        
+
     def delete_article(self, article_id: str) -> bool:
+        path = self._path(article_id)
         try:
-            with open(self.file, 'r+', encoding='utf-8') as f:
-                data = json.load(f)
-                original_length = len(data)
-                
-                data = [article for article in data if article['article_id'] != article_id]
-                
-                if len(data) == original_length:
-                    return False  # No se encontró el artículo
-
-                f.seek(0)
-                f.truncate()
-                json.dump(data, f, indent=4)
+            with file_lock(os.path.dirname(path)):
+                self.cache.invalidate(path)
+                os.remove(path)
                 return True
+        except FileNotFoundError:
+            return False  # No se encontró el artículo
         except Exception as e:
             raise RuntimeError(f"Error al eliminar articulo: {e}")
-        
+
+    def migrate(self) -> int:
+        """
+        Move the bodies of the legacy monolithic ``storage_article.json`` into
+        the sharded store. Articles already in the sharded store are kept.
+
+        Returns:
+            int: Number of articles migrated.
+
+        Raises:
+            RuntimeError: If the legacy file cannot be parsed, which is then
+                left untouched.
+        """
+        if not os.path.exists(self.file):
+            return 0
+
+        with file_lock(self.file):
+            try:
+                data = read_json(self.file)
+            except json.JSONDecodeError as e:
+                raise RuntimeError(f"Error al migrar los articulos: {e}")
+
+            migrated = 0
+            for article in data:
+                if not os.path.exists(self._path(article['article_id'])):
+                    self._write(article)
+                    migrated += 1
+
+            atomic_write_json(self.file, [])
+        return migrated
+
     def flush_list(self) -> bool:
         try:
-            with open(self.file, "w", encoding="utf-8") as f:
-                json.dump([], f, indent=4)
+            self.cache.clear()
+            shutil.rmtree(self.directory, ignore_errors=True)
+            os.makedirs(self.directory, exist_ok=True)
             return True
-        except Exception as e:
-            print(f"Error al vaciar la lista: {e}")
-            return False
\ No newline at end of file
+        except Exception:
+            logger.exception("Error al vaciar la lista")
+            return False
@@ -1,9 +1,23 @@
 import uuid
+from itertools import groupby
 from typing import Any
+from sqlalchemy import Row
 from sqlmodel import Session, select
 
-from backend.logic.models import Article
-from backend.logic.schemas.articles import CreateArticle, UpdateArticle
+from backend.logic.models import (
+    Article,
+    AuthorArticle,
+    Newsletter,
+    Profile,
+    Section,
+    User
+)
+from backend.logic.schemas.articles import (
+    CreateArticle,
+    NewsletterArticles,
+    SectionArticles,
+    UpdateArticle
+)
 
 
 def create_article(*, session: Session, article_create: CreateArticle) -> Article:
@@ -42,4 +56,72 @@ def update_article(*, session: Session, db_article: Article, article_in: UpdateA
     session.add(db_article)
     session.commit()
     session.refresh(db_article)
-    return db_article
\ No newline at end of file
+    return db_article
+
+
+def get_article_detail(*, session: Session, article_id: uuid.UUID) -> Row | None:
+    """
+    Get an article with the names of its section, newsletter and author in a
+    single query.
+
+    The main author is preferred when the article has several authors.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        article_id (uuid.UUID): The ID of the article.
+
+    Returns:
+        Row | None: ``(Article, section, newsletter, author)``, where the names
+        are None when the related row does not exist, or None if the article
+        does not exist.
+    """
+    statement = (
+        select(Article, Section.name, Newsletter.name, User.full_name)
+        .outerjoin(Section, Section.section_id == Article.section_id)
+        .outerjoin(Newsletter, Newsletter.newsletter_id == Article.newsletter_id)
+        .outerjoin(AuthorArticle, AuthorArticle.article_id == Article.article_id)
+        .outerjoin(Profile, Profile.profile_id == AuthorArticle.profile_id)
+        .outerjoin(User, User.user_id == Profile.user_id)
+        .where(Article.article_id == article_id)
+        .order_by(AuthorArticle.main_author.desc().nulls_last())
+        .limit(1)
+    )
+    return session.exec(statement).first()
+
+
+def get_newsletter_articles(*, session: Session, newsletter: Newsletter) -> NewsletterArticles:
+    """
+    Get the articles of a newsletter grouped by section.
+
+    The articles are read with a single query ordered by section and grouped
+    in memory, instead of one query per section.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        newsletter (Newsletter): The newsletter to read.
+
+    Returns:
+        NewsletterArticles: One group per section that has articles in the newsletter.
+    """
+    rows = session.exec(
+        select(Article, Section.name)
+        .join(Section, Section.section_id == Article.section_id)
+        .where(Article.newsletter_id == newsletter.newsletter_id)
+        .order_by(Section.section_id, Article.created_at)
+    ).all()
+
+    sections = []
+    for (_, section_name), group in groupby(rows, key=lambda row: (row[0].section_id, row[1])):
+        section_articles = [article for article, _ in group]
+        sections.append(SectionArticles(
+            section=section_name,
+            articles=section_articles,
+            count=len(section_articles)
+        ))
+
+    return NewsletterArticles(
+        newsletter=newsletter.name,
+        data=sections,
+        total_articles=len(rows),
+        total_sections=len(sections)
+    )
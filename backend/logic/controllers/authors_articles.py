@@ -1,5 +1,7 @@
 from sqlmodel import Session, select
-from backend.logic.models import AuthorArticle
+from backend.logic.controllers.feed import publish_activity
+from backend.logic.enum import FeedActivities
+from backend.logic.models import Article, AuthorArticle
 from backend.logic.schemas.author_articles import CreateAuthor, UpdateAuthor
 import uuid
 from typing import Any
@@ -18,6 +20,16 @@ def create_author_article(*, session: Session, author_create: CreateAuthor) -> A
     """
     db_obj = AuthorArticle.model_validate(author_create)
     session.add(db_obj)
+    article = session.get(Article, db_obj.article_id)
+    if article:
+        publish_activity(
+            session=session,
+            actor_id=db_obj.profile_id,
+            activity=FeedActivities.ARTICLE,
+            object_id=article.article_id,
+            movie_id=article.movie_ref_id,
+            detail=article.article_title
+        )
     session.commit()
     session.refresh(db_obj)
     return db_obj
@@ -2,9 +2,10 @@ import uuid
 from sqlmodel import Session, select
 from typing import List
 
+from backend.logic.controllers.feed import publish_activity
 from backend.logic.models import Comment, Article
 from backend.logic.schemas.comments import CreateComment
-from backend.logic.enum import TargetTypes
+from backend.logic.enum import FeedActivities, TargetTypes
 
 
 def create_comment(
@@ -36,6 +37,14 @@ def create_comment(
         has_spoilers=comment_in.has_spoilers
     )
     session.add(db_obj)
+    publish_activity(
+        session=session,
+        actor_id=profile_id,
+        activity=FeedActivities.COMMENT,
+        object_id=db_obj.comment_id,
+        movie_id=target_id if target_type == TargetTypes.MOVIE else None,
+        detail=None if db_obj.has_spoilers else db_obj.content
+    )
     session.commit()
     session.refresh(db_obj)
     return db_obj
@@ -0,0 +1,106 @@
+import json
+from collections import defaultdict
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.sql.elements import ColumnElement
+from sqlmodel import Session, SQLModel, func, select
+
+from backend.core.cache import TTLCache
+from backend.core.config import settings
+
+count_cache = TTLCache(ttl=settings.COUNT_CACHE_TTL_SECONDS)
+_generations: dict[str, int] = defaultdict(int)
+_PENDING = "counts"
+
+
+def count_rows(
+    *,
+    session: Session,
+    model: type[SQLModel],
+    where: ColumnElement[bool] | None = None,
+    estimate: bool = False
+) -> int:
+    """
+    Count the rows of a table, optionally filtered, without scanning it on
+    every call.
+
+    Exact counts are cached per table and filter. The entries of a table are
+    dropped when a session that inserted, updated or deleted its rows commits,
+    and expire after ``COUNT_CACHE_TTL_SECONDS`` to pick up changes made by
+    other processes.
+
+    With ``estimate`` the count comes from the planner statistics on
+    PostgreSQL, which is approximate but never scans the table. Other
+    databases fall back to the exact count.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        model (type[SQLModel]): Table model to count.
+        where (ColumnElement[bool] | None): Optional filter on the table.
+        estimate (bool): Use the planner estimate.
+
+    Returns:
+        int: Number of rows.
+    """
+    table = model.__table__.name
+    if estimate and session.get_bind().dialect.name == "postgresql":
+        rows = _estimate(session, model, where)
+        if rows is not None:
+            return rows
+
+    statement = select(func.count()).select_from(model)
+    if where is not None:
+        statement = statement.where(where)
+    key = (table, _generations[table], _filter_key(where))
+    return count_cache.get_or_load(key, lambda: session.exec(statement).one())
+
+
+def _filter_key(where: ColumnElement[bool] | None) -> Any:
+    if where is None:
+        return None
+    compiled = where.compile()
+    return str(compiled), tuple(sorted(compiled.params.items()))
+
+
+def _estimate(session: Session, model: type[SQLModel], where: ColumnElement[bool] | None) -> int | None:
+    table = model.__table__.name
+    if where is None:
+        reltuples = session.exec(
+            text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)"),
+            params={"name": table}
+        ).scalar()
+        # -1 until the table is vacuumed or analyzed for the first time
+        return int(reltuples) if reltuples is not None and reltuples >= 0 else None
+
+    statement = select(model).where(where).compile(
+        dialect=session.get_bind().dialect,
+        compile_kwargs={"literal_binds": True}
+    )
+    # Colons in literal values would be taken for bind parameters
+    sql = str(statement).replace(":", "\\:")
+    plan = session.exec(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_tables(session: Session, flush_context) -> None:
+    tables: set[str] = session.info.setdefault(_PENDING, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            tables.add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_counts(session: Session) -> None:
+    for table in session.info.pop(_PENDING, ()):
+        _generations[table] += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_tables(session: Session) -> None:
+    session.info.pop(_PENDING, None)
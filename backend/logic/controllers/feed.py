@@ -0,0 +1,184 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import and_, or_
+from sqlmodel import Session, delete, func, insert, select
+
+from backend.core.config import settings
+from backend.core.pagination import paginate
+from backend.logic.controllers.profile_counters import get_profile_counters
+from backend.logic.enum import FeedActivities
+from backend.logic.models import FeedItem, Follow, Profile, ProfileCounters
+from backend.logic.schemas.feed import FeedItemPublic, FeedPublic
+
+
+def publish_activity(
+    *,
+    session: Session,
+    actor_id: uuid.UUID,
+    activity: FeedActivities,
+    object_id: uuid.UUID | str,
+    movie_id: str | None = None,
+    detail: str | None = None
+) -> int:
+    """
+    Write an activity to the feed timelines, without committing.
+
+    The activity is copied to the timeline of every follower of the actor
+    (fan-out on write), so reading a feed is a range scan of one timeline.
+    An actor with more than ``FEED_FANOUT_MAX_FOLLOWERS`` followers writes
+    it once to its own timeline instead, read by each follower with its own
+    (fan-out on read).
+
+    A written timeline holding more than ``FEED_TRIM_MARGIN`` items over
+    ``FEED_MAX_ITEMS`` is trimmed back to its ``FEED_MAX_ITEMS`` newest, so
+    a timeline is trimmed once every ``FEED_TRIM_MARGIN`` items instead of
+    on every write.
+
+    Args:
+        session (Session): The session writing the activity.
+        actor_id (uuid.UUID): The profile that did the activity.
+        activity (FeedActivities): Kind of activity.
+        object_id (uuid.UUID | str): The rated movie, the list, the comment or the article.
+        movie_id (str | None): The movie involved, if any.
+        detail (str | None): Short text shown with the activity.
+
+    Returns:
+        int: Number of timeline items written.
+    """
+    followers = get_profile_counters(session=session, profile_id=actor_id).followers_count
+    if followers > settings.FEED_FANOUT_MAX_FOLLOWERS:
+        timelines = [actor_id]
+    else:
+        timelines = session.exec(
+            select(Follow.follower_id).where(Follow.following_id == actor_id)
+        ).all()
+    if not timelines:
+        return 0
+
+    item = dict(
+        actor_id=actor_id,
+        activity=activity,
+        object_id=str(object_id),
+        movie_id=movie_id,
+        detail=detail[:155] if detail else detail,
+        created_at=datetime.now(timezone.utc)
+    )
+    session.exec(insert(FeedItem), params=[
+        dict(item, profile_id=profile_id, feed_item_id=uuid.uuid4()) for profile_id in timelines
+    ])
+
+    trim_timelines(session=session, profile_ids=timelines, margin=settings.FEED_TRIM_MARGIN)
+    return len(timelines)
+
+
+def trim_timelines(*, session: Session, profile_ids: list[uuid.UUID], margin: int = 0) -> int:
+    """
+    Delete the items of some timelines past their ``FEED_MAX_ITEMS`` newest,
+    without committing.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_ids (list[uuid.UUID]): Owners of the timelines.
+        margin (int): Only trim the timelines holding more than
+            ``FEED_MAX_ITEMS + margin`` items.
+
+    Returns:
+        int: Number of deleted items.
+    """
+    if margin:
+        profile_ids = session.exec(
+            select(FeedItem.profile_id)
+            .where(FeedItem.profile_id.in_(profile_ids))
+            .group_by(FeedItem.profile_id)
+            .having(func.count() > settings.FEED_MAX_ITEMS + margin)
+        ).all()
+    if not profile_ids:
+        return 0
+
+    ranked = (
+        select(
+            FeedItem.feed_item_id,
+            func.row_number().over(
+                partition_by=FeedItem.profile_id,
+                order_by=(FeedItem.created_at.desc(), FeedItem.feed_item_id.desc())
+            ).label("position")
+        )
+        .where(FeedItem.profile_id.in_(profile_ids))
+        .subquery()
+    )
+    result = session.exec(
+        delete(FeedItem).where(FeedItem.feed_item_id.in_(
+            select(ranked.c.feed_item_id).where(ranked.c.position > settings.FEED_MAX_ITEMS)
+        ))
+    )
+    return result.rowcount
+
+
+def get_feed(
+    *,
+    session: Session,
+    profile_id: uuid.UUID,
+    after: str | None = None,
+    limit: int = 50
+) -> FeedPublic:
+    """
+    Retrieve one page of the feed of a profile, newest first.
+
+    The page merges the timeline of the profile with the activities of the
+    followed profiles that have too many followers to fan out. Each timeline
+    is capped, so the merge reads a bounded number of items per profile.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_id (uuid.UUID): The profile reading its feed.
+        after (str | None): Cursor returned by the previous page.
+        limit (int): Maximum number of items of the page.
+
+    Returns:
+        FeedPublic: A page of activities and the next cursor.
+    """
+    outboxes = session.exec(
+        select(Follow.following_id)
+        .join(ProfileCounters, ProfileCounters.profile_id == Follow.following_id)
+        .where(
+            Follow.follower_id == profile_id,
+            ProfileCounters.followers_count > settings.FEED_FANOUT_MAX_FOLLOWERS
+        )
+    ).all()
+
+    timelines = (FeedItem.profile_id == profile_id) & (FeedItem.actor_id != profile_id)
+    if outboxes:
+        timelines = or_(
+            timelines,
+            and_(FeedItem.profile_id.in_(outboxes), FeedItem.actor_id == FeedItem.profile_id)
+        )
+    query = (
+        select(FeedItem, Profile.username, FeedItem.created_at, FeedItem.feed_item_id)
+        .join(Profile, Profile.profile_id == FeedItem.actor_id)
+        .where(timelines)
+    )
+    rows, next_cursor = paginate(
+        session, query,
+        key=(FeedItem.created_at, FeedItem.feed_item_id),
+        after=after, limit=limit, descending=True
+    )
+
+    return FeedPublic(
+        items=[
+            FeedItemPublic.model_validate(row.FeedItem, update={"username": row.username})
+            for row in rows
+        ],
+        next_cursor=next_cursor
+    )
+
+
+def delete_timeline(*, session: Session, profile_id: uuid.UUID) -> None:
+    """
+    Delete the timeline of a profile about to be deleted, without committing.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_id (uuid.UUID): The profile.
+    """
+    session.exec(delete(FeedItem).where(FeedItem.profile_id == profile_id))
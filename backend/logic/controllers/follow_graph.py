@@ -0,0 +1,333 @@
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+from sqlalchemy import event
+from sqlmodel import Session, func, select
+
+from backend.core.config import settings
+from backend.logic.models import Follow
+
+LOAD_CHUNK = 50_000
+# Number of patched follows kept aside before they are merged into the arrays
+COMPACT_CHANGES = 10_000
+_PENDING = "follow_graph"
+_EMPTY = np.zeros(0, dtype=np.int32)
+
+
+class FollowGraph:
+    """
+    Who follows whom, held in memory in compressed sparse row form.
+
+    Profiles are mapped to dense ints; the profiles followed by profile ``i``
+    are ``neighbours[offsets[i]:offsets[i + 1]]``, sorted. Both arrays are
+    int32, so a million follows take about 4 MB.
+
+    The arrays are built once from the database. Follows created or deleted
+    afterwards are kept in small per-profile sets applied on top of the
+    arrays, and merged into new arrays once there are ``COMPACT_CHANGES`` of
+    them.
+
+    The follows written by this process are patched in as they commit. At
+    most every ``check_seconds`` the number of follows and the latest
+    creation date are compared with the database: the follows created since
+    the latest one known, by the other workers or directly in the database,
+    are read and patched in the same way. The graph is only rebuilt when
+    the number of follows still differs, i.e. follows were deleted by
+    someone else.
+
+    Args:
+        check_seconds (float): Minimum delay between two comparisons with
+            the database, 0 compares on every use.
+    """
+
+    def __init__(self, check_seconds: float = settings.FOLLOW_GRAPH_CHECK_SECONDS):
+        self.check_seconds = check_seconds
+        self._lock = threading.RLock()
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.loaded = False
+            self._ids: list[uuid.UUID] = []
+            self._index: dict[uuid.UUID, int] = {}
+            self._offsets = np.zeros(1, dtype=np.int32)
+            self._neighbours = _EMPTY
+            self._added: dict[int, set[int]] = {}
+            self._removed: dict[int, set[int]] = {}
+            self._changes = 0
+            # What the follow table should hold, compared by ensure_loaded
+            self._count = 0
+            self._latest: datetime | None = None
+            self._checked_at = 0.0
+
+    def build(self, *, session: Session) -> int:
+        """
+        Build the graph from every follow of the database.
+
+        Args:
+            session (Session): Active SQLModel database session.
+
+        Returns:
+            int: Number of follows.
+        """
+        # Follows committed during the build wait for the lock and are
+        # applied on top, patching a follow twice changes nothing
+        with self._lock:
+            self.clear()
+            followers, followed = [], []
+            latest = None
+            result = session.exec(
+                select(Follow.follower_id, Follow.following_id, Follow.created_at)
+                .execution_options(yield_per=LOAD_CHUNK)
+            )
+            for follower_id, following_id, created_at in result:
+                followers.append(self._node(follower_id))
+                followed.append(self._node(following_id))
+                if latest is None or created_at > latest:
+                    latest = created_at
+
+            self._set_edges(
+                np.array(followers, dtype=np.int32), np.array(followed, dtype=np.int32)
+            )
+            self._count, self._latest = len(followers), _utc(latest)
+            self._checked_at = time.monotonic()
+            self.loaded = True
+        return len(followers)
+
+    def ensure_loaded(self, *, session: Session) -> None:
+        """
+        Build the graph on first use, and catch up with the follows written
+        by the other processes.
+
+        Args:
+            session (Session): Active SQLModel database session.
+        """
+        with self._lock:
+            if not self.loaded:
+                self.build(session=session)
+                return
+            if time.monotonic() - self._checked_at < self.check_seconds:
+                return
+
+            count, latest = session.exec(
+                select(func.count(), func.max(Follow.created_at)).select_from(Follow)
+            ).one()
+            latest = _utc(latest)
+            if latest is not None and (self._latest is None or latest > self._latest):
+                statement = select(Follow.follower_id, Follow.following_id, Follow.created_at)
+                if self._latest is not None:
+                    statement = statement.where(Follow.created_at > self._latest)
+                self.apply([
+                    (follower_id, following_id, created_at, True)
+                    for follower_id, following_id, created_at in session.exec(statement)
+                ])
+            if count != self._count:
+                # Deleted by someone else, or created before the latest follow
+                self.build(session=session)
+            self._checked_at = time.monotonic()
+
+    def _set_edges(self, followers: np.ndarray, followed: np.ndarray) -> None:
+        order = np.lexsort((followed, followers))
+        counts = np.bincount(followers, minlength=len(self._ids))
+        self._offsets = np.zeros(len(self._ids) + 1, dtype=np.int32)
+        np.cumsum(counts, out=self._offsets[1:])
+        self._neighbours = followed[order].astype(np.int32)
+        self._added, self._removed, self._changes = {}, {}, 0
+
+    def _node(self, profile_id: uuid.UUID) -> int:
+        node = self._index.get(profile_id)
+        if node is None:
+            node = self._index[profile_id] = len(self._ids)
+            self._ids.append(profile_id)
+        return node
+
+    def _base(self, node: int) -> np.ndarray:
+        if node + 1 >= len(self._offsets):
+            return _EMPTY
+        return self._neighbours[self._offsets[node]:self._offsets[node + 1]]
+
+    def _in_base(self, node: int, other: int) -> bool:
+        row = self._base(node)
+        position = np.searchsorted(row, other)
+        return bool(position < len(row) and row[position] == other)
+
+    def _following(self, node: int) -> np.ndarray:
+        row = self._base(node)
+        removed = self._removed.get(node)
+        if removed:
+            row = row[~np.isin(row, list(removed))]
+        added = self._added.get(node)
+        if added:
+            row = np.union1d(row, np.fromiter(added, dtype=np.int32, count=len(added)))
+        return row
+
+    def apply(self, changes: list[tuple[uuid.UUID, uuid.UUID, datetime, bool]]) -> None:
+        """
+        Apply committed follow changes.
+
+        Args:
+            changes (list): Tuples of follower id, followed id, creation date
+                of the follow and True for a created follow or False for a
+                deleted one.
+        """
+        with self._lock:
+            if not self.loaded:
+                # The build reads the committed follows
+                return
+            for follower_id, following_id, created_at, created in changes:
+                created_at = _utc(created_at)
+                if created:
+                    if self.add(follower_id, following_id):
+                        self._count += 1
+                        if self._latest is None or created_at > self._latest:
+                            self._latest = created_at
+                elif self.remove(follower_id, following_id):
+                    self._count -= 1
+
+    def add(self, follower_id: uuid.UUID, following_id: uuid.UUID) -> bool:
+        """
+        Returns:
+            bool: False if the follow was already in the graph.
+        """
+        with self._lock:
+            follower, followed = self._node(follower_id), self._node(following_id)
+            if self._in_base(follower, followed):
+                removed = self._removed.get(follower, set())
+                if followed not in removed:
+                    return False
+                removed.discard(followed)
+            else:
+                added = self._added.setdefault(follower, set())
+                if followed in added:
+                    return False
+                added.add(followed)
+            self._changed()
+            return True
+
+    def remove(self, follower_id: uuid.UUID, following_id: uuid.UUID) -> bool:
+        """
+        Returns:
+            bool: False if the follow was not in the graph.
+        """
+        with self._lock:
+            follower, followed = self._index.get(follower_id), self._index.get(following_id)
+            if follower is None or followed is None:
+                return False
+            if self._in_base(follower, followed):
+                removed = self._removed.setdefault(follower, set())
+                if followed in removed:
+                    return False
+                removed.add(followed)
+            else:
+                added = self._added.get(follower, set())
+                if followed not in added:
+                    return False
+                added.discard(followed)
+            self._changed()
+            return True
+
+    def _changed(self) -> None:
+        self._changes += 1
+        if self._changes >= COMPACT_CHANGES:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Merge the patched follows into new arrays.
+        """
+        with self._lock:
+            rows = [self._following(node) for node in range(len(self._ids))]
+            lengths = np.array([len(row) for row in rows], dtype=np.int32)
+            followers = np.repeat(np.arange(len(self._ids), dtype=np.int32), lengths)
+            self._set_edges(followers, np.concatenate(rows or [_EMPTY]))
+
+    def following(self, profile_id: uuid.UUID) -> list[uuid.UUID]:
+        with self._lock:
+            node = self._index.get(profile_id)
+            if node is None:
+                return []
+            return [self._ids[other] for other in self._following(node)]
+
+    def is_following(self, follower_id: uuid.UUID, following_id: uuid.UUID) -> bool:
+        with self._lock:
+            follower, followed = self._index.get(follower_id), self._index.get(following_id)
+            if follower is None or followed is None:
+                return False
+            if followed in self._added.get(follower, ()):
+                return True
+            return self._in_base(follower, followed) and followed not in self._removed.get(follower, ())
+
+    def two_hop(self, profile_id: uuid.UUID, limit: int) -> list[tuple[uuid.UUID, int]]:
+        """
+        Profiles followed by the profiles a profile follows, that it does not
+        follow yet.
+
+        Args:
+            profile_id (uuid.UUID): The profile.
+            limit (int): Maximum number of profiles.
+
+        Returns:
+            list[tuple[uuid.UUID, int]]: Profile ids and the number of followed
+            profiles that follow them, most first.
+        """
+        with self._lock:
+            node = self._index.get(profile_id)
+            if node is None:
+                return []
+            following = self._following(node)
+            if not len(following):
+                return []
+
+            reached = np.concatenate([self._following(other) for other in following])
+            candidates, shared = np.unique(reached, return_counts=True)
+            keep = ~np.isin(candidates, following) & (candidates != node)
+            candidates, shared = candidates[keep], shared[keep]
+            order = np.argsort(-shared, kind='stable')[:limit]
+            return [(self._ids[other], int(shared[i])) for i, other in zip(order, candidates[order])]
+
+
+def _utc(moment: datetime | None) -> datetime | None:
+    # Naive UTC, as read back from the database
+    if moment is not None and moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+graph = FollowGraph()
+
+
+def track_follow_change(
+    *,
+    session: Session,
+    follower_id: uuid.UUID,
+    following_id: uuid.UUID,
+    created_at: datetime,
+    created: bool
+) -> None:
+    """
+    Record a created or deleted follow, applied to the graph when the session
+    commits.
+
+    Args:
+        session (Session): The session writing the follow.
+        follower_id (uuid.UUID): The following profile.
+        following_id (uuid.UUID): The followed profile.
+        created_at (datetime): Creation date of the follow.
+        created (bool): True for a new follow, False for a deleted one.
+    """
+    session.info.setdefault(_PENDING, []).append((follower_id, following_id, created_at, created))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_changes(session: Session) -> None:
+    changes = session.info.pop(_PENDING, None)
+    if changes:
+        graph.apply(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING, None)
@@ -1,15 +1,29 @@
 import uuid
 from typing import Any
 
-from sqlmodel import Session, select
+from sqlalchemy import or_, tuple_
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, delete, func, select, update
 
-from backend.logic.models import Follow, Profile
+from backend.core.pagination import paginate
+from backend.logic.controllers.follow_graph import graph, track_follow_change
+from backend.logic.controllers.profile_counters import get_profile_counters, update_profile_counters
+from backend.logic.models import Follow, Profile, ProfileCounters, Rating
 from backend.logic.schemas.profiles import ProfilePublic
 from backend.logic.schemas.follows import (
     FollowersPublic,
-    FollowingPublic
+    FollowingPublic,
+    FollowStatus,
+    FollowSuggestion
 )
 
+# Lowest rate of a movie counted as a shared taste
+HIGH_RATE = 4.0
+# Weight of a shared high rating against a shared follow in suggestion scores
+SHARED_RATING_WEIGHT = 0.25
+# Two-hop candidates scored with ratings, per suggestion returned
+CANDIDATES_PER_SUGGESTION = 5
+
 
 def create_follow(
     *, session: Session, 
@@ -17,7 +31,8 @@ def create_follow(
     follower_id: uuid.UUID
 ) -> Follow:
     """
-    Creates a follow relationship between two profiles.
+    Creates a follow relationship between two profiles and updates the
+    counters of both.
 
     Args:
         session (Session): Active SQLModel database session.
@@ -32,21 +47,106 @@ def create_follow(
         following_id=following_id
     )
     session.add(db_obj)
+    update_profile_counters(session=session, profile_id=follower_id, following_count=1)
+    update_profile_counters(session=session, profile_id=following_id, followers_count=1)
+    track_follow_change(
+        session=session,
+        follower_id=follower_id,
+        following_id=following_id,
+        created_at=db_obj.created_at,
+        created=True
+    )
     session.commit()
     session.refresh(db_obj)
     return db_obj
 
 
-def get_profile_followers(*, session: Session, profile_id: uuid) -> FollowersPublic | None:
+def delete_follow(*, session: Session, follow: Follow) -> None:
     """
-    Retrieve all followers of a specific profile.
+    Deletes a follow relationship and updates the counters of both profiles.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        follow (Follow): The follow relationship to delete.
+    """
+    follower_id, following_id, created_at = follow.follower_id, follow.following_id, follow.created_at
+    session.delete(follow)
+    update_profile_counters(session=session, profile_id=follower_id, following_count=-1)
+    update_profile_counters(session=session, profile_id=following_id, followers_count=-1)
+    track_follow_change(
+        session=session,
+        follower_id=follower_id,
+        following_id=following_id,
+        created_at=created_at,
+        created=False
+    )
+    session.commit()
+
+
+def delete_profile_follows(*, session: Session, profile_id: uuid.UUID) -> None:
+    """
+    Delete the follows of a profile about to be deleted, without committing.
+
+    The profiles it followed lose a follower and its followers lose a
+    following, with one relative update for each side, in the transaction
+    that deletes the profile.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_id (uuid.UUID): The profile.
+    """
+    profile_follows = session.exec(
+        select(Follow.follower_id, Follow.following_id, Follow.created_at)
+        .where(or_(Follow.follower_id == profile_id, Follow.following_id == profile_id))
+    ).all()
+    if not profile_follows:
+        return
+
+    session.exec(
+        delete(Follow)
+        .where(or_(Follow.follower_id == profile_id, Follow.following_id == profile_id))
+    )
+    for counter, others in (
+        ("followers_count", [following_id for follower_id, following_id, _ in profile_follows
+                             if follower_id == profile_id]),
+        ("following_count", [follower_id for follower_id, following_id, _ in profile_follows
+                             if following_id == profile_id]),
+    ):
+        # Profiles without a counters row are counted once the follows are gone
+        if others:
+            session.exec(
+                update(ProfileCounters)
+                .where(ProfileCounters.profile_id.in_(others))
+                .values({counter: getattr(ProfileCounters, counter) - 1})
+            )
+    for follower_id, following_id, created_at in profile_follows:
+        track_follow_change(
+            session=session,
+            follower_id=follower_id,
+            following_id=following_id,
+            created_at=created_at,
+            created=False
+        )
+
+
+def get_profile_followers(
+    *,
+    session: Session,
+    profile_id: uuid.UUID,
+    after: str | None = None,
+    limit: int = 100
+) -> FollowersPublic | None:
+    """
+    Retrieve one page of the followers of a specific profile, oldest follow first.
 
     Args:
         session (Session): SQLModel DB session.
         profile_id (uuid.UUID): ID of the profile whose followers to retrieve.
+        after (str | None): Cursor returned by the previous page.
+        limit (int): Maximum number of followers of the page.
 
     Returns:
-        FollowersPublic: A list of follower profiles and the count.
+        FollowersPublic: A page of follower profiles, the total count and the next cursor.
     """
     profile = session.get(Profile, profile_id)
 
@@ -54,31 +154,43 @@ def get_profile_followers(*, session: Session, profile_id: uuid) -> FollowersPub
         return None
 
     query = (
-        select(Profile)
+        select(Profile, Follow.created_at, Follow.follower_id)
         .join(Follow, Follow.follower_id == Profile.profile_id)
         .where(Follow.following_id == profile_id)
     )
-
-    followers = session.exec(query).all()
-    followers_list = [ProfilePublic.model_validate(f) for f in followers]
+    rows, next_cursor = paginate(
+        session, query,
+        key=(Follow.created_at, Follow.follower_id),
+        after=after, limit=limit
+    )
 
     return FollowersPublic(
         **ProfilePublic.model_validate(profile).model_dump(),
-        followers=followers_list,
-        count=len(followers_list)
+        followers=[ProfilePublic.model_validate(row.Profile) for row in rows],
+        count=get_profile_counters(session=session, profile_id=profile_id).followers_count,
+        next_cursor=next_cursor
     )
 
 
-def get_profile_following(*, session: Session, profile_id: uuid) -> FollowingPublic | None:
+def get_profile_following(
+    *,
+    session: Session,
+    profile_id: uuid.UUID,
+    after: str | None = None,
+    limit: int = 100
+) -> FollowingPublic | None:
     """
-    Retrieve all profiles that a given profile is following.
+    Retrieve one page of the profiles that a given profile is following,
+    oldest follow first.
 
     Args:
         session (Session): SQLModel DB session.
         profile_id (uuid.UUID): ID of the profile whose followers to retrieve.
+        after (str | None): Cursor returned by the previous page.
+        limit (int): Maximum number of profiles of the page.
 
     Returns:
-        FollowingPublic: A list of following profiles and the count.
+        FollowingPublic: A page of following profiles, the total count and the next cursor.
     """
     profile = session.get(Profile, profile_id)
 
@@ -86,16 +198,116 @@ def get_profile_following(*, session: Session, profile_id: uuid) -> FollowingPub
         return None
 
     query = (
-        select(Profile)
+        select(Profile, Follow.created_at, Follow.following_id)
         .join(Follow, Follow.following_id == Profile.profile_id)
         .where(Follow.follower_id == profile_id)
     )
-
-    followings = session.exec(query).all()
-    following_list = [ProfilePublic.model_validate(f) for f in followings]
+    rows, next_cursor = paginate(
+        session, query,
+        key=(Follow.created_at, Follow.following_id),
+        after=after, limit=limit
+    )
 
     return FollowingPublic(
         **ProfilePublic.model_validate(profile).model_dump(),
-        following=following_list,
-        count=len(following_list)
-    )
\ No newline at end of file
+        following=[ProfilePublic.model_validate(row.Profile) for row in rows],
+        count=get_profile_counters(session=session, profile_id=profile_id).following_count,
+        next_cursor=next_cursor
+    )
+
+
+def get_follow_suggestions(
+    *, session: Session, profile_id: uuid.UUID, limit: int = 20
+) -> list[FollowSuggestion]:
+    """
+    Suggest profiles to follow among the profiles followed by the profiles a
+    profile follows.
+
+    Candidates come from the in-memory follow graph, ranked by the number of
+    followed profiles that follow them. The best of them are then scored
+    with one query counting the movies both the profile and each candidate
+    rated ``HIGH_RATE`` or more; a shared high rating weighs
+    ``SHARED_RATING_WEIGHT`` of a shared follow.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_id (uuid.UUID): The profile to suggest to.
+        limit (int): Maximum number of suggestions.
+
+    Returns:
+        list[FollowSuggestion]: The suggestions, best first.
+    """
+    graph.ensure_loaded(session=session)
+    candidates = dict(graph.two_hop(profile_id, limit * CANDIDATES_PER_SUGGESTION))
+    if not candidates:
+        return []
+
+    own = aliased(Rating)
+    shared_ratings = dict(session.exec(
+        select(Rating.profile_id, func.count())
+        .select_from(own)
+        .join(Rating, Rating.movie_id == own.movie_id)
+        .where(
+            own.profile_id == profile_id,
+            own.rate >= HIGH_RATE,
+            Rating.rate >= HIGH_RATE,
+            Rating.profile_id.in_(list(candidates))
+        )
+        .group_by(Rating.profile_id)
+    ).all())
+
+    scores = {
+        other_id: shared + SHARED_RATING_WEIGHT * shared_ratings.get(other_id, 0)
+        for other_id, shared in candidates.items()
+    }
+    best = sorted(scores, key=lambda other_id: -scores[other_id])[:limit]
+    usernames = dict(session.exec(
+        select(Profile.profile_id, Profile.username).where(Profile.profile_id.in_(best))
+    ).all())
+    return [
+        FollowSuggestion(
+            profile_id=other_id,
+            username=usernames[other_id],
+            score=scores[other_id],
+            shared_follows=candidates[other_id],
+            shared_ratings=shared_ratings.get(other_id, 0)
+        )
+        for other_id in best
+        if other_id in usernames
+    ]
+
+
+def get_follow_statuses(
+    *, session: Session, profile_id: uuid.UUID, profile_ids: list[uuid.UUID]
+) -> list[FollowStatus]:
+    """
+    Tell, for each of several profiles, whether a profile follows it and is
+    followed by it.
+
+    A single query looks up both directions of every pair in the primary
+    key of ``Follow``. The in-memory follow graph is not used: it may lag
+    behind the follows written by the other workers.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_id (uuid.UUID): The profile asking, usually the caller.
+        profile_ids (list[uuid.UUID]): The other profiles.
+
+    Returns:
+        list[FollowStatus]: The relationship with each profile, in the order given.
+    """
+    profile_ids = list(dict.fromkeys(profile_ids))
+    pairs = [(profile_id, other_id) for other_id in profile_ids]
+    pairs += [(other_id, profile_id) for other_id in profile_ids]
+    follows = set(session.exec(
+        select(Follow.follower_id, Follow.following_id)
+        .where(tuple_(Follow.follower_id, Follow.following_id).in_(pairs))
+    ).all())
+    return [
+        FollowStatus(
+            profile_id=other_id,
+            following=(profile_id, other_id) in follows,
+            followed_by=(other_id, profile_id) in follows
+        )
+        for other_id in profile_ids
+    ]
@@ -1,8 +1,10 @@
-import json
+import logging
 import os
+import threading
 
 from datetime import datetime, timezone
 
+from backend.core.oplog import OperationLog
 from backend.logic.entities.movie_list import MovieList
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -11,126 +13,179 @@ DIR_DATA = os.path.abspath(DIR_DATA)
 
 message_404 = "Movie list not found"
 
+logger = logging.getLogger(__name__)
+
+_stores: dict[str, OperationLog] = {}
+_stores_lock = threading.Lock()
+
+
+def _load(snapshot) -> dict:
+    """
+    Build the index ``{list_id: {"id", "profile_id", "movies": {movie_id: added_at}}}``
+    from the snapshot content (the legacy list of movie lists).
+    """
+    index = {}
+    for movie_list in snapshot or []:
+        index[movie_list["id"]] = {
+            "id": movie_list["id"],
+            "profile_id": movie_list["profile_id"],
+            "movies": {
+                str(m["movie_id"]): m.get("added_at")
+                for m in movie_list.get("movies", [])
+            }
+        }
+    return index
+
+
+def _to_dict(entry: dict) -> dict:
+    return dict(
+        id=entry["id"],
+        profile_id=entry["profile_id"],
+        movies=[
+            {"movie_id": movie_id, "added_at": added_at}
+            for movie_id, added_at in entry["movies"].items()
+        ]
+    )
+
+
+def _dump(index: dict) -> list:
+    return [_to_dict(entry) for entry in index.values()]
+
+
+def _copy(index: dict) -> dict:
+    return {key: {**entry, "movies": dict(entry["movies"])} for key, entry in index.items()}
+
+
+def _apply(index: dict, record: dict) -> bool:
+    """
+    Apply one operation to the index. Every operation is idempotent so the
+    log can be safely replayed on top of a snapshot that already contains it.
+    """
+    op = record["op"]
+    list_id = record["id"]
+
+    if op == "add":
+        index[list_id] = {
+            "id": list_id,
+            "profile_id": record["profile_id"],
+            "movies": {}
+        }
+        return True
+
+    if op == "remove":
+        return index.pop(list_id, None) is not None
+
+    movie_list = index.get(list_id)
+    if movie_list is None:
+        return False
+    movies = movie_list["movies"]
+
+    if op == "add_movie":
+        if record["movie_id"] in movies:
+            return False
+        movies[record["movie_id"]] = record["added_at"]
+        return True
+
+    if op == "remove_movie":
+        return movies.pop(record["movie_id"], None) is not None
+
+    raise ValueError(f"Unknown operation '{op}'")
+
+
+def get_store(file: str) -> OperationLog:
+    """
+    Return the operation log of a storage file, replaying it on first use.
+    """
+    with _stores_lock:
+        store = _stores.get(file)
+        if store is None:
+            store = OperationLog(file, load=_load, dump=_dump, apply=_apply, copy=_copy)
+            _stores[file] = store
+        return store
+
+
 class MovieListController(object):
 
     def __init__(self):
         self.file = os.path.join(DIR_DATA, 'storage_movie_lists.json')
 
+    @property
+    def store(self) -> OperationLog:
+        return get_store(self.file)
+
     def add(self, new_movie_list: MovieList) -> MovieList:
         """
         Add a new movie list to the storage.
         """
-        with open(self.file, 'r+', encoding='utf-8') as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                data = []
-            data.append(new_movie_list.to_dict())
-            f.seek(0)
-            json.dump(data, f, indent=4)
+        self.store.append({
+            "op": "add",
+            "id": str(new_movie_list.id),
+            "profile_id": str(new_movie_list.profile_id)
+        })
         return new_movie_list
 
     def get_all(self):
         """
         Retrieve all movie lists.
         """
-        # Opening JSON file
-        with open(self.file, 'r', encoding='utf-8') as openfile:
-            # Reading from json file
-            data = json.load(openfile)
-        return data
+        with self.store.read() as index:
+            return _dump(index)
 
     def get_by_id(self, movie_list_id: str):
         """
         Get a movie list by its UUID (string).
         """
-        with open(self.file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            for movie_list in data:
-                if movie_list.get("id") == movie_list_id:
-                    return movie_list
-        return None
-    
-    def remove(self, movie_list_id: str) -> bool:
-        with open(self.file, "r+", encoding="utf-8") as f:
-            data = json.load(f)
+        with self.store.read() as index:
+            movie_list = index.get(movie_list_id)
+            return _to_dict(movie_list) if movie_list else None
 
-            # Buscar directamente en data
-        
-            new_movies_list = [m for m in data if m["id"] != movie_list_id]
+    def remove(self, movie_list_id: str) -> bool:
+        if not self.store.append({"op": "remove", "id": movie_list_id}):
+            logger.info("%s: %s", message_404, movie_list_id)
+            return False
+        return True
 
-            if len(data) == len(new_movies_list):
-                print(message_404)
+    def add_movie(self, movie_list_id: str, movie_id: str) -> bool:
+        with self.store.transaction() as index:
+            if movie_list_id not in index:
+                logger.info("%s: %s", message_404, movie_list_id)
                 return False
 
-            data = new_movies_list
-
-            # Guardar cambios
-            f.seek(0)
-            f.truncate()
-            json.dump(data, f, indent=4)
-            f.flush()
-            return True
-        
-
-    def add_movie(self, movie_list_id: str, movie_id: str) -> bool:
-        with open(self.file, "r+", encoding="utf-8") as f:
-            data = json.load(f)
-
-            # Buscar la lista directamente en data
-            for movie_list in data:
-                if movie_list["id"] == movie_list_id:
-                    if any(str(m["movie_id"]) == str(movie_id) for m in movie_list.get("movies", [])):
-                        print("Movie already in list.")
-                        return False
-
-                    movie_list.setdefault("movies", []).append({
-                        "movie_id": movie_id,
-                        "added_at": datetime.now(timezone.utc).isoformat()
-                    })
-
-                    # Guardar cambios
-                    f.seek(0)
-                    f.truncate()
-                    json.dump(data, f, indent=4)
-                    f.flush()
-                    return True
-
-            print(message_404)
-            return False
-    
+            added = self.store.append({
+                "op": "add_movie",
+                "id": movie_list_id,
+                "movie_id": str(movie_id),
+                "added_at": datetime.now(timezone.utc).isoformat()
+            })
+            if not added:
+                logger.info("Movie %s already in list %s.", movie_id, movie_list_id)
+            return added
 
     def remove_movie(self, movie_list_id: str, movie_id: str) -> bool:
-        with open(self.file, "r+", encoding="utf-8") as f:
-            data = json.load(f)
-
-            # Buscar directamente en data
-            for movie_list in data:
-                if movie_list["id"] == movie_list_id:
-                    movies = movie_list.get("movies", [])
-                    new_movies = [m for m in movies if m["movie_id"] != movie_id]
-
-                    if len(movies) == len(new_movies):
-                        print("Movie not found in list.")
-                        return False
+        with self.store.transaction() as index:
+            if movie_list_id not in index:
+                logger.info("%s: %s", message_404, movie_list_id)
+                return False
 
-                    movie_list["movies"] = new_movies
+            removed = self.store.append({
+                "op": "remove_movie",
+                "id": movie_list_id,
+                "movie_id": str(movie_id)
+            })
+            if not removed:
+                logger.info("Movie %s not found in list %s.", movie_id, movie_list_id)
+            return removed
 
-                    # Guardar cambios
-                    f.seek(0)
-                    f.truncate()
-                    json.dump(data, f, indent=4)
-                    f.flush()
-                    return True
+    def compact(self) -> None:
+        """
+        Fold the pending operations into the snapshot file.
+        """
+        self.store.compact()
 
-            print(message_404)
-            return False
-        
     def flush_list(self) -> bool:
         try:
-            with open(self.file, "w", encoding="utf-8") as f:
-                json.dump([], f, indent=4)
+            self.store.reset({})
             return True
-        except Exception as e:
-            print(f"Error al vaciar la lista: {e}")
-            return False
\ No newline at end of file
+        except Exception:
+            logger.exception("Error al vaciar la lista")
+            return False
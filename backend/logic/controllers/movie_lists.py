@@ -1,9 +1,14 @@
 import uuid
+from datetime import datetime
 from typing import Any
 
-from sqlmodel import Session, select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, delete, select
 
-from backend.logic.models import MovieList
+from backend.logic.controllers.feed import publish_activity
+from backend.logic.controllers.profile_counters import update_profile_counters
+from backend.logic.enum import FeedActivities
+from backend.logic.models import MovieList, MovieListItem
 from backend.logic.schemas.movie_lists import CreateMovieList, UpdateMovieList
 
 
@@ -12,6 +17,15 @@ def create_movie_list(*, session: Session, movielist_create: CreateMovieList, pr
         movielist_create, update={"profile_id": profile_id}
     )
     session.add(db_obj)
+    update_profile_counters(session=session, profile_id=profile_id, lists_count=1)
+    if not db_obj.privacy:
+        publish_activity(
+            session=session,
+            actor_id=profile_id,
+            activity=FeedActivities.LIST,
+            object_id=db_obj.list_id,
+            detail=db_obj.name
+        )
     session.commit()
     session.refresh(db_obj)
     return db_obj
@@ -25,4 +39,142 @@ def update_movie_list(*, session: Session, db_movielist: MovieList, movielist_in
     session.commit()
     session.refresh(db_movielist)
     return db_movielist
-    
\ No newline at end of file
+
+
+def delete_movie_list(*, session: Session, db_movielist: MovieList) -> None:
+    """
+    Delete a movie list together with all its movies and update the counters
+    of its profile.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        db_movielist (MovieList): The list to delete.
+    """
+    session.exec(delete(MovieListItem).where(MovieListItem.list_id == db_movielist.list_id))
+    profile_id = db_movielist.profile_id
+    session.delete(db_movielist)
+    update_profile_counters(session=session, profile_id=profile_id, lists_count=-1)
+    session.commit()
+
+
+def add_movie(*, session: Session, list_id: uuid.UUID, movie_id: str) -> bool:
+    """
+    Add a movie to a movie list.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        list_id (UUID): ID of the list.
+        movie_id (str): ID of the movie to add.
+
+    Returns:
+        bool: False if the movie was already in the list.
+    """
+    if session.get(MovieListItem, (list_id, movie_id)):
+        return False
+
+    session.add(MovieListItem(list_id=list_id, movie_id=movie_id))
+    movie_list = session.get(MovieList, list_id)
+    if movie_list and not movie_list.privacy:
+        publish_activity(
+            session=session,
+            actor_id=movie_list.profile_id,
+            activity=FeedActivities.LIST_MOVIE,
+            object_id=list_id,
+            movie_id=movie_id,
+            detail=movie_list.name
+        )
+    try:
+        session.commit()
+    except IntegrityError:
+        # Added concurrently by another request
+        session.rollback()
+        return False
+    return True
+
+
+def remove_movie(*, session: Session, list_id: uuid.UUID, movie_id: str) -> bool:
+    """
+    Remove a movie from a movie list.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        list_id (UUID): ID of the list.
+        movie_id (str): ID of the movie to remove.
+
+    Returns:
+        bool: False if the movie was not in the list.
+    """
+    result = session.exec(
+        delete(MovieListItem).where(
+            (MovieListItem.list_id == list_id) &
+            (MovieListItem.movie_id == movie_id)
+        )
+    )
+    session.commit()
+    return result.rowcount > 0
+
+
+def get_movies_by_list_ids(
+    *, session: Session, list_ids: list[uuid.UUID]
+) -> dict[uuid.UUID, list[MovieListItem]]:
+    """
+    Retrieve the movies of several lists with a single query.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        list_ids (list[UUID]): IDs of the lists to hydrate.
+
+    Returns:
+        dict[UUID, list[MovieListItem]]: Movies of every list, in the order they were added.
+    """
+    movies: dict[uuid.UUID, list[MovieListItem]] = {list_id: [] for list_id in list_ids}
+    if not list_ids:
+        return movies
+
+    statement = (
+        select(MovieListItem)
+        .where(MovieListItem.list_id.in_(list_ids))
+        .order_by(MovieListItem.list_id, MovieListItem.added_at)
+    )
+    for item in session.exec(statement):
+        movies[item.list_id].append(item)
+    return movies
+
+
+def import_movie_lists(*, session: Session, movie_lists_data: list[dict]) -> int:
+    """
+    Import the movies of lists stored in the legacy JSON document store.
+
+    Lists that do not exist in the database and movies already imported are
+    skipped, so the import can be run more than once.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        movie_lists_data (list[dict]): Lists as returned by ``MovieListController.get_all``.
+
+    Returns:
+        int: Number of movies imported.
+    """
+    imported = 0
+    for movie_list in movie_lists_data:
+        list_id = uuid.UUID(str(movie_list["id"]))
+        if not session.get(MovieList, list_id):
+            continue
+
+        existing = set(session.exec(
+            select(MovieListItem.movie_id).where(MovieListItem.list_id == list_id)
+        ).all())
+        for movie in movie_list.get("movies", []):
+            movie_id = str(movie["movie_id"])
+            if movie_id in existing:
+                continue
+            existing.add(movie_id)
+
+            item = MovieListItem(list_id=list_id, movie_id=movie_id)
+            if movie.get("added_at"):
+                item.added_at = datetime.fromisoformat(movie["added_at"])
+            session.add(item)
+            imported += 1
+
+    session.commit()
+    return imported
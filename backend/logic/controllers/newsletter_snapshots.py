@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+import threading
+from itertools import chain
+from typing import NamedTuple
+
+from sqlalchemy import event, inspect
+from sqlmodel import Session, select
+
+from backend.core.storage import atomic_write_json, file_id, file_lock, read_json
+from backend.logic.controllers import articles
+from backend.logic.models import Article, Newsletter, Section
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DIR_DATA = os.path.join(CURRENT_DIR, '..', '..', 'data', 'json')
+DIR_DATA = os.path.abspath(DIR_DATA)
+
+ALL = "*"
+LATEST = "latest"
+_PENDING = "newsletter_snapshots"
+
+
+class Snapshot(NamedTuple):
+    payload: bytes
+    etag: str
+    version: tuple[int, int]
+
+
+class NewsletterSnapshots:
+    """
+    Pre-serialized ``NewsletterArticles`` payloads, one per newsletter.
+
+    A snapshot is rendered once and then served as bytes until one of the
+    rows it covers changes. Changes are tracked with a small versions file
+    shared by every process: committing a session that touched an Article,
+    Section or Newsletter bumps the version of the affected newsletters (all
+    of them for a changed section, and the latest pointer for a newsletter),
+    and a snapshot built for an older version is rebuilt on its next read.
+
+    Args:
+        path (str): Path of the versions file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._snapshots: dict[int, Snapshot] = {}
+        self._latest: tuple[int, tuple[int, int]] | None = None
+        self._versions: dict[str, int] = {}
+        self._versions_id = None
+
+    def _version(self, key: str) -> tuple[int, int]:
+        with self._lock:
+            current_id = file_id(self.path)
+            if current_id != self._versions_id:
+                try:
+                    self._versions = read_json(self.path)
+                except (FileNotFoundError, json.JSONDecodeError):
+                    self._versions = {}
+                self._versions_id = current_id
+            return self._versions.get(key, 0), self._versions.get(ALL, 0)
+
+    def get(self, *, session: Session, newsletter_id: int) -> Snapshot | None:
+        """
+        Get the snapshot of a newsletter, rebuilding it if it is stale.
+
+        Args:
+            session (Session): Active SQLModel database session, only used to rebuild.
+            newsletter_id (int): The ID of the newsletter.
+
+        Returns:
+            Snapshot | None: The snapshot, or None if the newsletter does not exist.
+        """
+        version = self._version(str(newsletter_id))
+        snapshot = self._snapshots.get(newsletter_id)
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        newsletter = session.get(Newsletter, newsletter_id)
+        if not newsletter:
+            return None
+        return self._build(session, newsletter, version)
+
+    def get_latest(self, *, session: Session) -> Snapshot | None:
+        """
+        Get the snapshot of the most recent newsletter.
+
+        Returns:
+            Snapshot | None: The snapshot, or None if there are no newsletters.
+        """
+        version = self._version(LATEST)
+        latest = self._latest
+        if latest is not None and latest[1] == version:
+            return self.get(session=session, newsletter_id=latest[0])
+
+        newsletter = session.exec(
+            select(Newsletter).order_by(Newsletter.name.desc()).limit(1)
+        ).first()
+        if not newsletter:
+            return None
+        self._latest = (newsletter.newsletter_id, version)
+
+        newsletter_version = self._version(str(newsletter.newsletter_id))
+        snapshot = self._snapshots.get(newsletter.newsletter_id)
+        if snapshot is not None and snapshot.version == newsletter_version:
+            return snapshot
+        return self._build(session, newsletter, newsletter_version)
+
+    def _build(self, session: Session, newsletter: Newsletter, version: tuple[int, int]) -> Snapshot:
+        # The version is read before the data, so a change committed while
+        # building leaves a snapshot that is already stale and gets rebuilt
+        payload = articles.get_newsletter_articles(
+            session=session, newsletter=newsletter
+        ).model_dump_json().encode('utf-8')
+        etag = f'"{hashlib.sha256(payload).hexdigest()}"'
+        snapshot = Snapshot(payload=payload, etag=etag, version=version)
+        self._snapshots[newsletter.newsletter_id] = snapshot
+        return snapshot
+
+    def invalidate(self, keys: set[str]) -> None:
+        """
+        Bump the version of the given newsletter ids, ``LATEST`` or ``ALL``.
+        """
+        with file_lock(self.path):
+            try:
+                versions = read_json(self.path)
+            except (FileNotFoundError, json.JSONDecodeError):
+                versions = {}
+            for key in keys:
+                versions[key] = versions.get(key, 0) + 1
+            atomic_write_json(self.path, versions, indent=None)
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+        self._latest = None
+
+
+snapshots = NewsletterSnapshots(os.path.join(DIR_DATA, 'newsletter_snapshots.json'))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context) -> None:
+    keys: set[str] = session.info.setdefault(_PENDING, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Article):
+            history = inspect(obj).attrs.newsletter_id.history
+            for newsletter_id in chain(history.unchanged, history.added, history.deleted):
+                if newsletter_id is not None:
+                    keys.add(str(newsletter_id))
+        elif isinstance(obj, Section) and obj not in session.new:
+            # A new section has no articles yet
+            keys.add(ALL)
+        elif isinstance(obj, Newsletter):
+            keys.update((str(obj.newsletter_id), LATEST))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_snapshots(session: Session) -> None:
+    keys = session.info.pop(_PENDING, None)
+    if keys:
+        snapshots.invalidate(keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING, None)
@@ -0,0 +1,134 @@
+import uuid
+
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, delete, func, insert, select, update
+
+from backend.logic.models import Follow, MovieList, Profile, ProfileCounters, Rating
+
+COUNTERS = ("followers_count", "following_count", "lists_count", "movies_rated")
+# Above this many profiles every profile is counted instead of filtering by id
+MAX_FILTERED_PROFILES = 1000
+
+
+def update_profile_counters(*, session: Session, profile_id: uuid.UUID, **deltas: int) -> None:
+    """
+    Apply a change to the counters of a profile.
+
+    The row is changed with a relative update, so concurrent writers do not
+    overwrite each other, and is not committed: it is part of the transaction
+    that writes the follow, rating or list. A profile without a row yet gets
+    one counted from the tables, so the change must already be added to or
+    deleted from the session: it is flushed and counted instead of the delta.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_id (uuid.UUID): The profile whose counters change.
+        **deltas (int): Amount added to each counter, e.g. ``followers_count=1``.
+    """
+    values = {
+        counter: getattr(ProfileCounters, counter) + delta
+        for counter, delta in deltas.items()
+    }
+    statement = (
+        update(ProfileCounters)
+        .where(ProfileCounters.profile_id == profile_id)
+        .values(**values)
+    )
+    if session.exec(statement).rowcount:
+        return
+
+    session.flush()
+    try:
+        with session.begin_nested():
+            session.add(count_profile_counters(session=session, profile_ids=[profile_id])[profile_id])
+    except IntegrityError:
+        # Inserted by a concurrent transaction in the meantime
+        session.exec(statement)
+
+
+def get_profile_counters(*, session: Session, profile_id: uuid.UUID) -> ProfileCounters:
+    """
+    Get the counters of a profile.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_id (uuid.UUID): The profile.
+
+    Returns:
+        ProfileCounters: The stored counters, or counted from the tables for
+        a profile that has no row yet.
+    """
+    counters = session.get(ProfileCounters, profile_id)
+    if counters is None:
+        counters = count_profile_counters(session=session, profile_ids=[profile_id])[profile_id]
+    return counters
+
+
+def count_profile_counters(
+    *, session: Session, profile_ids: list[uuid.UUID] | None = None
+) -> dict[uuid.UUID, ProfileCounters]:
+    """
+    Count the follows, lists and ratings of some profiles, or all of them.
+
+    Each counter is one grouped query whatever the number of profiles.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_ids (list[uuid.UUID] | None): The profiles to count, None for every profile.
+
+    Returns:
+        dict: New, unsaved counters of each profile.
+    """
+    if profile_ids is None:
+        profile_ids = session.exec(select(Profile.profile_id)).all()
+    counters = {
+        profile_id: ProfileCounters(profile_id=profile_id) for profile_id in profile_ids
+    }
+
+    for counter, column in (
+        ("followers_count", Follow.following_id),
+        ("following_count", Follow.follower_id),
+        ("lists_count", MovieList.profile_id),
+        ("movies_rated", Rating.profile_id),
+    ):
+        statement = select(column, func.count()).group_by(column)
+        if len(counters) <= MAX_FILTERED_PROFILES:
+            statement = statement.where(column.in_(list(counters)))
+        for profile_id, count in session.exec(statement):
+            if profile_id in counters:
+                setattr(counters[profile_id], counter, count)
+    return counters
+
+
+def refresh_profile_counters(*, session: Session) -> int:
+    """
+    Recompute the counters of every profile from the tables.
+
+    Used to fill the table for existing profiles or to repair it.
+
+    Args:
+        session (Session): Active SQLModel database session.
+
+    Returns:
+        int: Number of profiles.
+    """
+    counters = count_profile_counters(session=session)
+    session.exec(delete(ProfileCounters))
+    if counters:
+        session.exec(insert(ProfileCounters), params=[
+            {counter: getattr(row, counter) for counter in ("profile_id", *COUNTERS)}
+            for row in counters.values()
+        ])
+    session.commit()
+    return len(counters)
+
+
+def delete_profile_counters(*, session: Session, profile_id: uuid.UUID) -> None:
+    """
+    Delete the counters of a profile about to be deleted, without committing.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_id (uuid.UUID): The profile.
+    """
+    session.exec(delete(ProfileCounters).where(ProfileCounters.profile_id == profile_id))
@@ -2,9 +2,17 @@ import uuid
 from typing import Any
 from sqlmodel import Session, select
 
+from backend.core.cache import TTLCache
+from backend.core.config import settings
+from backend.logic.controllers import feed, follows, profile_counters
 from backend.logic.models import Profile, User
 from backend.logic.schemas.profiles import CreateProfile, UpdateProfile
 
+# Profile id of each recently authenticated user, by user id. Only the worker
+# creating or deleting a profile drops its entry, the others may serve the
+# previous id until it expires.
+profile_cache = TTLCache(ttl=settings.PROFILE_CACHE_TTL_SECONDS, max_entries=10_000)
+
 
 def create_profile(*, session: Session, profile_create: CreateProfile, user_id: uuid.UUID) -> Profile:
     """
@@ -33,6 +41,7 @@ def create_profile(*, session: Session, profile_create: CreateProfile, user_id:
     )
     session.add(db_obj)
     session.commit()
+    profile_cache.invalidate(user_id)
     session.refresh(db_obj)
     return db_obj
 
@@ -58,6 +67,40 @@ def update_profile(*, session: Session, db_profile: Profile, profile_in: UpdateP
     return db_profile
 
 
+def delete_profile(*, session: Session, db_profile: Profile) -> None:
+    """
+    Delete a Profile together with its follows, counters and feed timeline.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        db_profile (Profile): The Profile object to delete.
+    """
+    user_id = db_profile.user_id
+    follows.delete_profile_follows(session=session, profile_id=db_profile.profile_id)
+    # Reloaded empty instead of orphaning the follows loaded before
+    session.expire(db_profile, ["following", "followers"])
+    profile_counters.delete_profile_counters(session=session, profile_id=db_profile.profile_id)
+    feed.delete_timeline(session=session, profile_id=db_profile.profile_id)
+    session.delete(db_profile)
+    session.commit()
+    profile_cache.invalidate(user_id)
+
+
+def get_profile_id_by_user_id(*, session: Session, user_id: uuid.UUID) -> uuid.UUID | None:
+    """
+    Retrieve the id of the Profile of a User.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        user_id (UUID): ID of the user who owns the profile.
+
+    Returns:
+        UUID | None: The id of the profile if the user has one, otherwise None.
+    """
+    statement = select(Profile.profile_id).where(Profile.user_id == user_id)
+    return session.exec(statement).first()
+
+
 def get_profile_by_username(*, session: Session, username: str) -> Profile | None:
     """
     Retrieve a Profile by their username.
@@ -0,0 +1,407 @@
+import json
+import os
+import threading
+import time
+import uuid
+from bisect import bisect_left, insort
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Literal
+
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from backend.core.config import settings
+from backend.core.storage import atomic_write_json, file_id, file_lock, read_json
+from backend.logic.models import MovieRatingStats, Rating
+from backend.logic.schemas.ratings import TopMovie
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DIR_DATA = os.path.join(CURRENT_DIR, '..', '..', 'data', 'json')
+DIR_DATA = os.path.abspath(DIR_DATA)
+
+Window = Literal["all", "7d", "30d"]
+WINDOW_DAYS: dict[Window, int | None] = {"all": None, "7d": 7, "30d": 30}
+MAX_DAYS = 30
+_PENDING = "rating_leaderboard"
+
+
+class Ranking:
+    """
+    Movies of one window kept sorted by their Bayesian average.
+
+    The score of a movie is ``(C * m + sum) / (C + count)``: its mean rate
+    pulled towards the mean ``m`` of every rating of the window by ``C``
+    virtual ratings, so a movie with two 5 star rates does not outrank one
+    with a thousand 4.8. ``m`` moves with every rating, it is refreshed by
+    ``reprior`` instead of on each change so that a change only moves its
+    own movie in the sorted list.
+
+    Args:
+        prior_weight (float): Number of virtual ratings ``C``.
+    """
+
+    def __init__(self, prior_weight: float):
+        self.prior_weight = prior_weight
+        self.prior_mean = 0.0
+        self.count = 0
+        self.sum = 0.0
+        self.totals: dict[str, list[float]] = {}
+        self._scores: dict[str, float] = {}
+        self._keys: list[tuple[float, str]] = []
+
+    def score(self, count: float, total: float) -> float:
+        return (self.prior_weight * self.prior_mean + total) / (self.prior_weight + count)
+
+    def add(self, movie_id: str, count: int, total: float) -> None:
+        """
+        Add ratings to a movie, or remove them with negative values.
+        """
+        self.count += count
+        self.sum += total
+        entry = self.totals.setdefault(movie_id, [0, 0.0])
+        entry[0] += count
+        entry[1] += total
+
+        old = self._scores.pop(movie_id, None)
+        if old is not None:
+            del self._keys[bisect_left(self._keys, (-old, movie_id))]
+        if entry[0] <= 0:
+            del self.totals[movie_id]
+            return
+        score = self.score(*entry)
+        self._scores[movie_id] = score
+        insort(self._keys, (-score, movie_id))
+
+    def reprior(self) -> None:
+        """
+        Recompute the prior mean and sort every movie again.
+        """
+        self.prior_mean = self.sum / self.count if self.count > 0 else 0.0
+        self._scores = {movie_id: self.score(*entry) for movie_id, entry in self.totals.items()}
+        self._keys = sorted((-score, movie_id) for movie_id, score in self._scores.items())
+
+    def top(self, limit: int) -> list[TopMovie]:
+        return [
+            TopMovie(
+                movie_id=movie_id,
+                score=round(-key, 4),
+                avg_rate=round(self.totals[movie_id][1] / self.totals[movie_id][0], 2),
+                count=self.totals[movie_id][0]
+            )
+            for key, movie_id in self._keys[:limit]
+        ]
+
+
+class RatingLeaderboard:
+    """
+    Top movies by Bayesian average, all time and over the last 7 and 30 days.
+
+    The rankings live in memory and are updated by the rating write paths
+    when their session commits, so a read only slices a sorted list. The
+    windows are built from per-day aggregates of the last 30 days, a day
+    leaving a window is subtracted from it when the date changes.
+
+    The aggregates are written to a JSON file at most every
+    ``persist_seconds`` and loaded from it by the next process. Without the
+    file it is rebuilt from ``MovieRatingStats`` and the ratings of the last
+    30 days, the only reads of the ratings table.
+
+    Every worker keeps the changes it applied since its last write. When
+    another worker replaced the file, its aggregates are reloaded and those
+    changes applied on top, on the next read, write or save; saves hold the
+    file lock so two workers do not overwrite each other. A file rebuilt
+    from the database (``refresh_rating_stats.py``) already counts the
+    changes of every worker, so they are dropped instead.
+
+    Args:
+        path (str): Path of the persisted aggregates.
+        prior_weight (float): Number of virtual ratings of the Bayesian average.
+        persist_seconds (float): Minimum delay between two writes of the file.
+    """
+
+    def __init__(self, path: str, *, prior_weight: float, persist_seconds: float):
+        self.path = path
+        self.prior_weight = prior_weight
+        self.persist_seconds = persist_seconds
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._stale = False
+        self._dirty = False
+        self._file_id = None
+        self._build = None
+        self._unsaved: list[list[tuple[str, float | None, date | None, float | None]]] = []
+        self._persisted_at = 0.0
+        self._reset(_today())
+
+    def _reset(self, today: date) -> None:
+        self._today = today
+        self._days: dict[date, dict[str, list[float]]] = {}
+        self._rankings = {window: Ranking(self.prior_weight) for window in WINDOW_DAYS}
+
+    def top(self, *, session: Session, window: Window = "all", limit: int = 10) -> list[TopMovie]:
+        """
+        Get the best ranked movies of a window.
+
+        Args:
+            session (Session): Active SQLModel database session, only used to rebuild.
+            window (str): ``all``, ``7d`` or ``30d``.
+            limit (int): Maximum number of movies.
+
+        Returns:
+            list[TopMovie]: The movies, best first.
+        """
+        with self._lock:
+            self._ensure_loaded(session)
+            self._advance(_today())
+            if self._dirty and time.monotonic() - self._persisted_at >= self.persist_seconds:
+                self.save()
+            return self._rankings[window].top(limit)
+
+    def apply(self, changes: list[tuple[str, float | None, date | None, float | None]]) -> None:
+        """
+        Apply committed rating changes.
+
+        Args:
+            changes (list): Tuples of movie id, old rate, day the rating was
+                created and new rate. The old rate is None for a new rating
+                and the new rate None for a deleted one. An updated rating
+                keeps its creation day.
+        """
+        with self._lock:
+            if not self._loaded or file_id(self.path) != self._file_id:
+                # Not loaded yet, or replaced by another process
+                if not self._reload():
+                    # No file: the database already has the changes, the
+                    # next read rebuilds
+                    self._stale = True
+                    return
+
+            self._apply(changes)
+            self._unsaved.append(changes)
+            self._dirty = True
+            if time.monotonic() - self._persisted_at >= self.persist_seconds:
+                self.save()
+
+    def _apply(self, changes: list[tuple[str, float | None, date | None, float | None]]) -> None:
+        self._advance(_today())
+        for movie_id, old_rate, old_day, new_rate in changes:
+            if old_rate is not None:
+                self._add(movie_id, -1, -old_rate, old_day)
+            if new_rate is not None:
+                self._add(movie_id, 1, new_rate, self._today if old_rate is None else old_day)
+
+    def _add(self, movie_id: str, count: int, total: float, day: date | None) -> None:
+        self._rankings["all"].add(movie_id, count, total)
+        if day is None or (self._today - day).days >= MAX_DAYS:
+            return
+
+        entry = self._days.setdefault(day, {}).setdefault(movie_id, [0, 0.0])
+        entry[0] += count
+        entry[1] += total
+        for window, days in WINDOW_DAYS.items():
+            if days is not None and (self._today - day).days < days:
+                self._rankings[window].add(movie_id, count, total)
+
+    def _advance(self, today: date) -> None:
+        # Subtract the days that left each window since the last change
+        if today <= self._today:
+            return
+        for day, movies in list(self._days.items()):
+            for window, days in WINDOW_DAYS.items():
+                if days is not None and (self._today - day).days < days <= (today - day).days:
+                    for movie_id, (count, total) in movies.items():
+                        self._rankings[window].add(movie_id, -count, -total)
+            if (today - day).days >= MAX_DAYS:
+                del self._days[day]
+        self._today = today
+        self._reprior()
+
+    def _reprior(self) -> None:
+        for ranking in self._rankings.values():
+            ranking.reprior()
+
+    def _ensure_loaded(self, session: Session) -> None:
+        if self._loaded and not self._stale and file_id(self.path) == self._file_id:
+            return
+        if self._stale or not self._reload():
+            self.rebuild(session=session)
+
+    def _reload(self) -> bool:
+        """
+        Load the aggregates of the file and apply on top the changes of this
+        process it does not have yet.
+
+        Returns:
+            bool: False if there is no readable file.
+        """
+        current_id = file_id(self.path)
+        if current_id is None:
+            return False
+        build = self._build
+        try:
+            self._load(read_json(self.path))
+        except (OSError, json.JSONDecodeError, KeyError, ValueError):
+            return False
+        self._file_id = current_id
+
+        if self._build != build:
+            # Rebuilt from the database, which has the changes
+            self._unsaved = []
+        for changes in self._unsaved:
+            self._apply(changes)
+        self._dirty = bool(self._unsaved)
+        return True
+
+    def _load(self, data: dict) -> None:
+        self._reset(date.fromisoformat(data["today"]))
+        self._build = data.get("build")
+        for movie_id, (count, total) in data["all"].items():
+            self._rankings["all"].totals[movie_id] = [count, total]
+            self._rankings["all"].count += count
+            self._rankings["all"].sum += total
+        for day, movies in data["days"].items():
+            for movie_id, (count, total) in movies.items():
+                self._add_day(date.fromisoformat(day), movie_id, count, total)
+        self._reprior()
+        self._loaded, self._stale, self._dirty = True, False, False
+
+    def _add_day(self, day: date, movie_id: str, count: int, total: float) -> None:
+        if (self._today - day).days >= MAX_DAYS:
+            return
+        self._days.setdefault(day, {})[movie_id] = [count, total]
+        for window, days in WINDOW_DAYS.items():
+            if days is not None and (self._today - day).days < days:
+                ranking = self._rankings[window]
+                entry = ranking.totals.setdefault(movie_id, [0, 0.0])
+                entry[0] += count
+                entry[1] += total
+                ranking.count += count
+                ranking.sum += total
+
+    def rebuild(self, *, session: Session) -> None:
+        """
+        Rebuild the leaderboard from the database and persist it.
+
+        The all time ranking comes from ``MovieRatingStats``, the windows
+        from the ratings created in the last 30 days.
+
+        Args:
+            session (Session): Active SQLModel database session.
+        """
+        with self._lock:
+            today = _today()
+            self._reset(today)
+            ranking = self._rankings["all"]
+            for movie_id, count, total in session.exec(
+                select(MovieRatingStats.movie_id, MovieRatingStats.count, MovieRatingStats.sum)
+                .where(MovieRatingStats.count > 0)
+            ):
+                ranking.totals[movie_id] = [count, total]
+                ranking.count += count
+                ranking.sum += total
+
+            since = datetime.combine(today - timedelta(days=MAX_DAYS - 1), datetime.min.time())
+            days: dict[tuple[date, str], list[float]] = defaultdict(lambda: [0, 0.0])
+            for movie_id, rate, created_at in session.exec(
+                select(Rating.movie_id, Rating.rate, Rating.created_at)
+                .where(Rating.created_at >= since)
+            ):
+                entry = days[_day(created_at), movie_id]
+                entry[0] += 1
+                entry[1] += rate
+            for (day, movie_id), (count, total) in days.items():
+                self._add_day(day, movie_id, count, total)
+
+            self._reprior()
+            self._loaded, self._stale = True, False
+            self._build = uuid.uuid4().hex
+            with file_lock(self.path):
+                self._write()
+
+    def save(self) -> None:
+        """
+        Write the aggregates to the file and refresh the prior means, after
+        merging the file if another process replaced it.
+        """
+        with self._lock, file_lock(self.path):
+            if self._loaded and file_id(self.path) not in (None, self._file_id):
+                self._reload()
+            self._write()
+
+    def _write(self) -> None:
+        self._reprior()
+        atomic_write_json(self.path, {
+            "today": self._today.isoformat(),
+            "build": self._build,
+            "all": self._rankings["all"].totals,
+            "days": {
+                day.isoformat(): movies for day, movies in self._days.items()
+            }
+        }, indent=None)
+        self._file_id = file_id(self.path)
+        self._unsaved = []
+        self._persisted_at = time.monotonic()
+        self._dirty = False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset(_today())
+            self._loaded = self._stale = self._dirty = False
+            self._file_id = self._build = None
+            self._unsaved = []
+
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def _day(moment: datetime | None) -> date | None:
+    if moment is None:
+        return None
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.date()
+
+
+leaderboard = RatingLeaderboard(
+    os.path.join(DIR_DATA, 'rating_leaderboard.json'),
+    prior_weight=settings.RATING_TOP_PRIOR_WEIGHT,
+    persist_seconds=settings.RATING_TOP_PERSIST_SECONDS
+)
+
+
+def track_rating_change(
+    *,
+    session: Session,
+    movie_id: str,
+    old_rate: float | None,
+    old_created_at: datetime | None,
+    new_rate: float | None
+) -> None:
+    """
+    Record the change of a rating, applied to the leaderboard when the
+    session commits.
+
+    Args:
+        session (Session): The session writing the rating.
+        movie_id (str): The movie of the rating.
+        old_rate (float | None): Previous rate, None for a new rating.
+        old_created_at (datetime | None): When the previous rate was given.
+        new_rate (float | None): New rate, None for a deleted rating.
+    """
+    session.info.setdefault(_PENDING, []).append(
+        (movie_id, old_rate, _day(old_created_at), new_rate)
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_changes(session: Session) -> None:
+    changes = session.info.pop(_PENDING, None)
+    if changes:
+        leaderboard.apply(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING, None)
@@ -1,17 +1,41 @@
+import csv
+import json
 import uuid
-from typing import Any
+from datetime import datetime, timezone
+from itertools import groupby
+from typing import Any, Callable, Iterable, Iterator, Literal
 
-from sqlmodel import Session, select
+from sqlalchemy import Insert
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, delete, func, select, update
 
-from backend.logic.models import Rating, Profile
+from backend.core.cache import TTLCache
+from backend.core.config import settings
+from backend.logic.controllers.feed import publish_activity
+from backend.logic.controllers.profile_counters import update_profile_counters
+from backend.logic.controllers.rating_leaderboard import track_rating_change
+from backend.logic.controllers.taste_match import track_profile_ratings
+from backend.logic.enum import FeedActivities
+from backend.logic.models import MovieRatingStats, Rating, Profile
 from backend.logic.schemas.ratings import (
     CreateRating,
     ProfileRating, 
     ProfileRatingsPublic, 
     MovieRating, 
-    MovieRatingsPublic
+    MovieRatingsPublic,
+    MovieRatingAverage,
+    MovieRatingStatsPublic,
+    RatingImportError,
+    RatingImportResult
 )
 
+BUCKETS = 10
+STATS_COLUMNS = ("count", "sum", "sum_sq", *(f"bucket_{bucket}" for bucket in range(1, BUCKETS + 1)))
+MAX_IMPORT_ERRORS = 100
+
+histogram_cache = TTLCache(ttl=settings.RATING_STATISTICS_TTL_SECONDS, max_entries=1)
+
 
 def create_or_update_rating(
     *, session: Session, profile_id: uuid.UUID, movie_id: str, rating_in: CreateRating,
@@ -19,6 +43,17 @@ def create_or_update_rating(
     """
     Create or update a rating using a validated CreateRating schema.
 
+    The previous rate is read first, locking the row, since the aggregates
+    of the movie are updated from it in the same transaction and an upsert
+    cannot return the value it replaced. The rating is then written with one
+    upsert, so concurrent requests for the same profile and movie cannot
+    fail on the primary key: two statements in all. A new rating is
+    inserted without overwriting, so a rating created by a concurrent
+    request in the meantime costs one more read and upsert, updating it
+    from its rate.
+
+    An updated rating keeps its ``created_at``.
+
     Args:
         session (Session): Active SQLModel database session.
         rating_in (CreateRating): Input schema containing profile_id, movie_id, and rate.
@@ -26,26 +61,103 @@ def create_or_update_rating(
     Returns:
         Rating: The created or updated rating object.
     """
-    db_obj = session.exec(
-        select(Rating).where(
-            Rating.profile_id == profile_id,
-            Rating.movie_id == movie_id
-        )
-    ).first()
+    old_rate, old_created_at = _read_rating(session, profile_id, movie_id)
+    values = [dict(
+        profile_id=profile_id,
+        movie_id=movie_id,
+        rate=rating_in.rate,
+        created_at=datetime.now(timezone.utc)
+    )]
 
-    if db_obj:
-        db_obj.rate = rating_in.rate
-    else:
-        db_obj = Rating(
-            profile_id=profile_id,
+    inserted = False
+    if old_rate is None:
+        rating = session.exec(
+            upsert_ratings(session=session, values=values, overwrite=False).returning(Rating),
+            execution_options={"populate_existing": True}
+        ).scalar_one_or_none()
+        inserted = rating is not None
+        if not inserted:
+            # Created by a concurrent request since it was read, committed
+            # by now since the insert waited for it
+            old_rate, old_created_at = _read_rating(session, profile_id, movie_id)
+    if not inserted:
+        rating = session.exec(
+            upsert_ratings(session=session, values=values).returning(Rating),
+            execution_options={"populate_existing": True}
+        ).scalar_one()
+
+    update_movie_rating_stats(
+        session=session, movie_id=movie_id, old_rate=old_rate, new_rate=rating_in.rate
+    )
+    track_rating_change(
+        session=session,
+        movie_id=movie_id,
+        old_rate=old_rate,
+        old_created_at=old_created_at,
+        new_rate=rating_in.rate
+    )
+    track_profile_ratings(session=session, profile_id=profile_id)
+    if inserted:
+        update_profile_counters(session=session, profile_id=profile_id, movies_rated=1)
+        publish_activity(
+            session=session,
+            actor_id=profile_id,
+            activity=FeedActivities.RATING,
+            object_id=movie_id,
             movie_id=movie_id,
-            rate=rating_in.rate
+            detail=str(rating_in.rate)
         )
-
-    session.add(db_obj)
+    # Keep the returned values instead of expiring them on commit
+    session.expunge(rating)
     session.commit()
-    session.refresh(db_obj)
-    return db_obj
+    return rating
+
+
+def _read_rating(
+    session: Session, profile_id: uuid.UUID, movie_id: str
+) -> tuple[float | None, datetime | None]:
+    return session.exec(
+        select(Rating.rate, Rating.created_at).where(
+            Rating.profile_id == profile_id,
+            Rating.movie_id == movie_id
+        ).with_for_update()
+    ).first() or (None, None)
+
+
+def upsert_ratings(*, session: Session, values: list[dict[str, Any]], overwrite: bool = True) -> Insert:
+    """
+    Build an ``INSERT ... ON CONFLICT (profile_id, movie_id) DO UPDATE`` of
+    ratings for the dialect of the session, updating only the rate.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        values (list[dict]): Rows with profile_id, movie_id, rate and created_at.
+        overwrite (bool): False to leave existing ratings as they are
+            (``DO NOTHING``).
+
+    Returns:
+        Insert: The statement, to be executed or extended with ``returning``.
+    """
+    statement = _upsert(session)(Rating).values(values)
+    if not overwrite:
+        return statement.on_conflict_do_nothing(index_elements=[Rating.profile_id, Rating.movie_id])
+    # An existing rating keeps the time it was created
+    return statement.on_conflict_do_update(
+        index_elements=[Rating.profile_id, Rating.movie_id],
+        set_={"rate": statement.excluded.rate}
+    )
+
+
+def _upsert(session: Session) -> Callable[..., Insert]:
+    # The insert construct with ON CONFLICT support of the session's dialect
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Rating upsert is not supported on {dialect}")
+    return insert
 
 
 def get_ratings_by_profile(
@@ -98,3 +210,419 @@ def get_ratings_by_movie_id(
     ]
 
     return MovieRatingsPublic(movie_id=movie_id, ratings=ratings_list)
+
+
+def delete_rating(*, session: Session, rating: Rating) -> None:
+    """
+    Delete a rating and remove it from the aggregates of its movie and the
+    counters of its profile.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        rating (Rating): The rating to delete.
+    """
+    update_movie_rating_stats(
+        session=session, movie_id=rating.movie_id, old_rate=rating.rate, new_rate=None
+    )
+    track_rating_change(
+        session=session,
+        movie_id=rating.movie_id,
+        old_rate=rating.rate,
+        old_created_at=rating.created_at,
+        new_rate=None
+    )
+    profile_id = rating.profile_id
+    session.delete(rating)
+    update_profile_counters(session=session, profile_id=profile_id, movies_rated=-1)
+    track_profile_ratings(session=session, profile_id=profile_id)
+    session.commit()
+
+
+def rating_bucket(rate: float) -> int:
+    """
+    Histogram bucket of a rate: 1 for 0.5 stars up to 10 for 5 stars.
+    """
+    return min(max(int(rate * 2 + 0.5), 1), BUCKETS)
+
+
+def update_movie_rating_stats(
+    *, session: Session, movie_id: str, old_rate: float | None, new_rate: float | None
+) -> None:
+    """
+    Apply the change of one rating to the aggregates of its movie.
+
+    The row is changed with relative updates, so concurrent writers do not
+    overwrite each other, and is not committed: it is part of the transaction
+    that writes the rating.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        movie_id (str): The movie of the rating.
+        old_rate (float | None): Previous rate, None for a new rating.
+        new_rate (float | None): New rate, None for a deleted rating.
+    """
+    stats = MovieRatingStats
+    old, new = old_rate or 0, new_rate or 0
+    values = {
+        "count": stats.count + (new_rate is not None) - (old_rate is not None),
+        "sum": stats.sum + new - old,
+        "sum_sq": stats.sum_sq + new * new - old * old,
+    }
+    if old_rate is not None:
+        bucket = f"bucket_{rating_bucket(old_rate)}"
+        values[bucket] = getattr(stats, bucket) - 1
+    if new_rate is not None:
+        bucket = f"bucket_{rating_bucket(new_rate)}"
+        values[bucket] = values.get(bucket, getattr(stats, bucket)) + 1
+
+    statement = update(stats).where(stats.movie_id == movie_id).values(**values)
+    if session.exec(statement).rowcount or new_rate is None:
+        return
+
+    # First rating of the movie
+    try:
+        with session.begin_nested():
+            session.add(MovieRatingStats(
+                movie_id=movie_id,
+                count=1,
+                sum=new_rate,
+                sum_sq=new_rate * new_rate,
+                **{f"bucket_{rating_bucket(new_rate)}": 1}
+            ))
+    except IntegrityError:
+        # Inserted by a concurrent transaction in the meantime
+        session.exec(statement)
+
+
+def update_many_movie_rating_stats(
+    *, session: Session, changes: list[tuple[str, float | None, float | None]]
+) -> None:
+    """
+    Apply the changes of many ratings to the aggregates of their movies with
+    a single statement.
+
+    The changes are summed by movie and written with one multi-row
+    ``INSERT ... ON CONFLICT (movie_id) DO UPDATE`` adding the deltas to the
+    stored values, not committed. Rows are written in movie order so
+    concurrent batches lock them in the same order.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        changes (list): Tuples of movie id, old rate and new rate, as for
+            ``update_movie_rating_stats``.
+    """
+    deltas: dict[str, dict[str, float]] = {}
+    for movie_id, old_rate, new_rate in changes:
+        delta = deltas.setdefault(movie_id, dict.fromkeys(STATS_COLUMNS, 0))
+        for rate, sign in ((old_rate, -1), (new_rate, 1)):
+            if rate is not None:
+                delta["count"] += sign
+                delta["sum"] += sign * rate
+                delta["sum_sq"] += sign * rate * rate
+                delta[f"bucket_{rating_bucket(rate)}"] += sign
+    if not deltas:
+        return
+
+    statement = _upsert(session)(MovieRatingStats).values([
+        dict(movie_id=movie_id, **deltas[movie_id]) for movie_id in sorted(deltas)
+    ])
+    session.exec(statement.on_conflict_do_update(
+        index_elements=[MovieRatingStats.movie_id],
+        set_={
+            column: getattr(MovieRatingStats, column) + getattr(statement.excluded, column)
+            for column in STATS_COLUMNS
+        }
+    ))
+
+
+def get_movie_rating_stats(*, session: Session, movie_id: str) -> MovieRatingStatsPublic:
+    """
+    Get the number of ratings, the average and the distribution of a movie.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        movie_id (str): The movie ID.
+
+    Returns:
+        MovieRatingStatsPublic: The aggregates, zero for a movie without ratings.
+    """
+    stats = session.get(MovieRatingStats, movie_id) or MovieRatingStats(movie_id=movie_id)
+    return MovieRatingStatsPublic(
+        movie_id=movie_id,
+        count=stats.count,
+        avg_rate=round(stats.sum / stats.count, 2) if stats.count else 0.0,
+        distribution={
+            str(bucket / 2): getattr(stats, f"bucket_{bucket}")
+            for bucket in range(1, BUCKETS + 1)
+        }
+    )
+
+
+def get_rating_histogram(*, session: Session) -> dict[str, int]:
+    """
+    Get the number of ratings of each rate across all movies.
+
+    The histogram is grouped by the exact stored rates and cached for
+    ``RATING_STATISTICS_TTL_SECONDS``. When the cache is cold, concurrent
+    callers wait for a single computation.
+
+    Args:
+        session (Session): Active SQLModel database session.
+
+    Returns:
+        dict[str, int]: Number of ratings by rate, for the rates that have ratings.
+    """
+    return histogram_cache.get_or_load("histogram", lambda: _rating_histogram(session))
+
+
+def _rating_histogram(session: Session) -> dict[str, int]:
+    rows = session.exec(select(Rating.rate, func.count(Rating.rate)).group_by(Rating.rate)).all()
+    return {str(rate): count for rate, count in rows}
+
+
+def get_movie_rating_averages(
+    *, session: Session, movie_ids: list[str], profile_id: uuid.UUID | None = None
+) -> list[MovieRatingAverage]:
+    """
+    Get the average and number of ratings of several movies, and the rate the
+    profile gave to each of them, in a single query on the aggregates.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        movie_ids (list[str]): The movie IDs, duplicates are returned once.
+        profile_id (uuid.UUID | None): Profile whose own rates are included.
+
+    Returns:
+        list[MovieRatingAverage]: One entry per movie, in the order requested.
+    """
+    movie_ids = list(dict.fromkeys(movie_ids))
+    rows = session.exec(
+        select(MovieRatingStats.movie_id, MovieRatingStats.count, MovieRatingStats.sum, Rating.rate)
+        .outerjoin(Rating, (Rating.movie_id == MovieRatingStats.movie_id) & (Rating.profile_id == profile_id))
+        .where(MovieRatingStats.movie_id.in_(movie_ids))
+    ).all()
+
+    found = {
+        movie_id: MovieRatingAverage(
+            movie_id=movie_id,
+            avg_rate=round(total / count, 2) if count else 0.0,
+            count=count,
+            my_rate=rate
+        )
+        for movie_id, count, total, rate in rows
+    }
+    return [
+        found.get(movie_id) or MovieRatingAverage(movie_id=movie_id, avg_rate=0.0, count=0)
+        for movie_id in movie_ids
+    ]
+
+
+def refresh_movie_rating_stats(*, session: Session) -> int:
+    """
+    Rebuild the aggregates of every movie from the ratings.
+
+    Used to fill the table for existing ratings or to repair it.
+
+    Args:
+        session (Session): Active SQLModel database session.
+
+    Returns:
+        int: Number of movies with ratings.
+    """
+    movies = rebuild_movie_rating_stats(session=session)
+    session.commit()
+    return movies
+
+
+def rebuild_movie_rating_stats(*, session: Session, movie_ids: list[str] | None = None) -> int:
+    """
+    Recompute the aggregates of some movies, or all of them, from the ratings
+    without committing.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        movie_ids (list[str] | None): The movies to recompute, None for every movie.
+
+    Returns:
+        int: Number of recomputed movies that have ratings.
+    """
+    statement = (
+        select(Rating.movie_id, Rating.rate, func.count())
+        .group_by(Rating.movie_id, Rating.rate)
+        .order_by(Rating.movie_id)
+    )
+    clear = delete(MovieRatingStats)
+    if movie_ids is not None:
+        statement = statement.where(Rating.movie_id.in_(movie_ids))
+        clear = clear.where(MovieRatingStats.movie_id.in_(movie_ids))
+    rows = session.exec(statement).all()
+
+    session.exec(clear)
+    movies = 0
+    for movie_id, group in groupby(rows, key=lambda row: row[0]):
+        stats = MovieRatingStats(movie_id=movie_id)
+        for _, rate, count in group:
+            bucket = f"bucket_{rating_bucket(rate)}"
+            stats.count += count
+            stats.sum += rate * count
+            stats.sum_sq += rate * rate * count
+            setattr(stats, bucket, getattr(stats, bucket) + count)
+        session.add(stats)
+        movies += 1
+    session.flush()
+    return movies
+
+
+def parse_ratings(
+    lines: Iterable[str], *, format: Literal["csv", "ndjson"]
+) -> Iterator[tuple[int, ProfileRating | str]]:
+    """
+    Read and validate the ratings of an import file one line at a time.
+
+    CSV files need a header with ``movie_id`` and ``rate`` columns, other
+    columns are ignored. NDJSON files have one ``{"movie_id", "rate"}``
+    object per line.
+
+    Args:
+        lines (Iterable[str]): Lines of the file.
+        format (str): ``csv`` or ``ndjson``.
+
+    Yields:
+        tuple: The line number and either the rating or the reason it is invalid.
+    """
+    if format == "csv":
+        reader = csv.DictReader(lines)
+        records = ((reader.line_num, row) for row in reader)
+    else:
+        records = _read_ndjson(lines)
+
+    for line, record in records:
+        if isinstance(record, str):
+            yield line, record
+            continue
+        try:
+            movie_id = str(record.get("movie_id") or "").strip()
+            if not 0 < len(movie_id) <= 20:
+                raise ValueError("movie_id must have between 1 and 20 characters")
+            rate = CreateRating.model_validate({"rate": record.get("rate")}).rate
+            yield line, ProfileRating(movie_id=movie_id, rate=rate)
+        except ValidationError as e:
+            yield line, f"rate: {e.errors()[0]['msg']}"
+        except (ValueError, AttributeError) as e:
+            yield line, str(e)
+
+
+def _read_ndjson(lines: Iterable[str]) -> Iterator[tuple[int, dict | str]]:
+    for line, text in enumerate(lines, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except json.JSONDecodeError as e:
+            yield line, f"invalid JSON: {e.msg}"
+            continue
+        yield line, record if isinstance(record, dict) else "expected a JSON object"
+
+
+def import_ratings(
+    *,
+    session: Session,
+    profile_id: uuid.UUID,
+    rows: Iterable[tuple[int, ProfileRating | str]],
+    batch_size: int
+) -> RatingImportResult:
+    """
+    Write the ratings of a profile read by ``parse_ratings``.
+
+    Ratings are written with multi-row upserts, one batch at a time, and
+    each batch commits together with the aggregates of its movies, so memory
+    does not grow with the size of the file. A movie repeated in the file
+    keeps its last rate. Only the first ``MAX_IMPORT_ERRORS`` errors are
+    reported.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_id (uuid.UUID): The profile the ratings belong to.
+        rows (Iterable): Line numbers and ratings or errors.
+        batch_size (int): Number of ratings written by each statement.
+
+    Returns:
+        RatingImportResult: Number of imported and failed rows and the errors.
+    """
+    imported = failed = 0
+    errors = []
+    batch: dict[str, float] = {}
+
+    for line, row in rows:
+        if isinstance(row, str):
+            failed += 1
+            if len(errors) < MAX_IMPORT_ERRORS:
+                errors.append(RatingImportError(line=line, error=row))
+            continue
+
+        batch.pop(row.movie_id, None)
+        batch[row.movie_id] = row.rate
+        imported += 1
+        if len(batch) >= batch_size:
+            _write_ratings(session, profile_id, batch)
+            batch = {}
+
+    if batch:
+        _write_ratings(session, profile_id, batch)
+    return RatingImportResult(imported=imported, failed=failed, errors=errors)
+
+
+def _read_ratings(
+    session: Session, profile_id: uuid.UUID, movie_ids: list[str]
+) -> dict[str, tuple[float, datetime]]:
+    return {
+        movie_id: (rate, created_at)
+        for movie_id, rate, created_at in session.exec(
+            select(Rating.movie_id, Rating.rate, Rating.created_at)
+            .where(Rating.profile_id == profile_id, Rating.movie_id.in_(movie_ids))
+            .with_for_update()
+        )
+    }
+
+
+def _write_ratings(session: Session, profile_id: uuid.UUID, batch: dict[str, float]) -> None:
+    now = datetime.now(timezone.utc)
+    values = {
+        movie_id: dict(profile_id=profile_id, movie_id=movie_id, rate=rate, created_at=now)
+        for movie_id, rate in batch.items()
+    }
+    previous = _read_ratings(session, profile_id, list(batch))
+
+    # New ratings are inserted without overwriting, as in create_or_update_rating
+    inserted = set()
+    new = [movie_id for movie_id in batch if movie_id not in previous]
+    if new:
+        inserted = set(session.exec(
+            upsert_ratings(
+                session=session, values=[values[movie_id] for movie_id in new], overwrite=False
+            ).returning(Rating.movie_id)
+        ).scalars())
+        raced = [movie_id for movie_id in new if movie_id not in inserted]
+        if raced:
+            previous.update(_read_ratings(session, profile_id, raced))
+    if len(inserted) < len(batch):
+        session.exec(upsert_ratings(session=session, values=[
+            values[movie_id] for movie_id in batch if movie_id not in inserted
+        ]))
+
+    update_many_movie_rating_stats(session=session, changes=[
+        (movie_id, previous.get(movie_id, (None, None))[0], rate) for movie_id, rate in batch.items()
+    ])
+    for movie_id, rate in batch.items():
+        old_rate, old_created_at = previous.get(movie_id, (None, None))
+        track_rating_change(
+            session=session,
+            movie_id=movie_id,
+            old_rate=old_rate,
+            old_created_at=old_created_at,
+            new_rate=rate
+        )
+    track_profile_ratings(session=session, profile_id=profile_id)
+    if inserted:
+        update_profile_counters(session=session, profile_id=profile_id, movies_rated=len(inserted))
+    session.commit()
@@ -0,0 +1,545 @@
+import os
+import tempfile
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, NamedTuple
+
+import numpy as np
+from scipy import sparse
+from sqlmodel import Session, func, select
+
+from backend.core.storage import file_id, fsync_dir
+from backend.logic.models import Rating
+from backend.logic.schemas.recommendations import MovieRecommendation
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+DIR_DATA = os.path.join(CURRENT_DIR, '..', '..', 'data')
+DIR_DATA = os.path.abspath(DIR_DATA)
+INDEX_PATH = os.path.join(DIR_DATA, 'movie_neighbours.npz')
+
+# Size of the dense similarity blocks computed at once, in cells
+BLOCK_CELLS = 4_000_000
+# Past this share of changed movies an incremental build does a full one
+MAX_INCREMENTAL_SHARE = 0.2
+LOAD_CHUNK = 50_000
+
+
+class RatingMatrix(NamedTuple):
+    movie_ids: np.ndarray
+    profiles: np.ndarray
+    movies: np.ndarray
+    rates: np.ndarray
+    n_profiles: int
+
+
+class BuildResult(NamedTuple):
+    movies: int
+    rebuilt: int
+    incremental: bool
+
+
+class NeighbourIndex:
+    """
+    Top-K most similar movies of every rated movie.
+
+    Row ``i`` of ``neighbours`` holds the positions in ``movie_ids`` of the
+    movies most similar to ``movie_ids[i]``, best first, padded with -1, and
+    the same row of ``scores`` their similarities. ``movie_ids`` is sorted so
+    a movie is found with a binary search.
+
+    Args:
+        movie_ids (np.ndarray): Sorted ids of the indexed movies.
+        neighbours (np.ndarray): int32 array of shape (movies, K).
+        scores (np.ndarray): float32 array of shape (movies, K).
+        last_rated_at (str | None): Creation time of the newest rating seen by the build.
+        adjusted (bool | None): Whether the similarities are adjusted cosines,
+            None when unknown.
+    """
+
+    def __init__(
+        self,
+        movie_ids: np.ndarray,
+        neighbours: np.ndarray,
+        scores: np.ndarray,
+        last_rated_at: str | None = None,
+        adjusted: bool | None = None
+    ):
+        self.movie_ids = movie_ids
+        self.neighbours = neighbours
+        self.scores = scores
+        self.last_rated_at = last_rated_at
+        self.adjusted = adjusted
+
+    @property
+    def k(self) -> int:
+        return self.neighbours.shape[1]
+
+    def positions(self, movie_ids: np.ndarray) -> np.ndarray:
+        """
+        Positions of the given movies in the index, -1 for unknown movies.
+        """
+        positions = np.searchsorted(self.movie_ids, movie_ids)
+        found = positions < len(self.movie_ids)
+        found[found] = self.movie_ids[positions[found]] == movie_ids[found]
+        return np.where(found, positions, -1)
+
+    def recommend(self, movie_ids: list[str], rates: list[float], limit: int = 20) -> list[tuple[str, float]]:
+        """
+        Predict the rate of the neighbours of the rated movies.
+
+        The prediction of a movie is the mean rate of the profile plus the
+        similarity weighted average of the profile's deviations from its mean
+        on the rated neighbours. Movies already rated are never returned and
+        ties are broken by the total similarity, so a profile that always
+        gives the same rate still gets the closest movies first.
+
+        Args:
+            movie_ids (list[str]): Movies rated by the profile.
+            rates (list[float]): Rates given to those movies.
+            limit (int): Maximum number of recommendations.
+
+        Returns:
+            list[tuple[str, float]]: Movie ids and predicted rates, best first.
+        """
+        if not movie_ids or not len(self.movie_ids):
+            return []
+
+        rates = np.asarray(rates, dtype=np.float32)
+        positions = self.positions(np.asarray(movie_ids, dtype=self.movie_ids.dtype))
+        known = positions >= 0
+        if not known.any():
+            return []
+
+        mean = rates.mean()
+        rated = positions[known]
+        neighbours = self.neighbours[rated]
+        scores = self.scores[rated]
+        deviations = np.broadcast_to((rates[known] - mean)[:, None], neighbours.shape)
+
+        valid = neighbours >= 0
+        candidates, inverse = np.unique(neighbours[valid], return_inverse=True)
+        weights = np.bincount(inverse, weights=scores[valid])
+        deltas = np.bincount(inverse, weights=scores[valid] * deviations[valid])
+
+        keep = ~np.isin(candidates, rated) & (weights > 0)
+        candidates, weights, deltas = candidates[keep], weights[keep], deltas[keep]
+        predicted = np.clip(mean + deltas / weights, 0.5, 5)
+
+        order = np.lexsort((-weights, -predicted))[:limit]
+        return [
+            (str(self.movie_ids[i]), round(float(rate), 2))
+            for i, rate in zip(candidates[order], predicted[order])
+        ]
+
+    def save(self, path: str) -> None:
+        """
+        Write the index to a ``.npz`` file, replacing it atomically.
+        """
+        directory = os.path.dirname(path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                np.savez(
+                    file,
+                    movie_ids=self.movie_ids,
+                    neighbours=self.neighbours,
+                    scores=self.scores,
+                    last_rated_at=np.array(self.last_rated_at or ''),
+                    adjusted=np.array(-1 if self.adjusted is None else int(self.adjusted))
+                )
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        fsync_dir(directory)
+
+    @classmethod
+    def load(cls, path: str) -> "NeighbourIndex":
+        with np.load(path) as data:
+            return cls(
+                movie_ids=data['movie_ids'],
+                neighbours=data['neighbours'],
+                scores=data['scores'],
+                last_rated_at=str(data['last_rated_at']) or None,
+                # Files written before the flag was stored
+                adjusted=bool(data['adjusted']) if 'adjusted' in data and data['adjusted'] >= 0 else None
+            )
+
+
+def load_rating_matrix(*, session: Session) -> RatingMatrix:
+    """
+    Read every rating into arrays of profile positions, movie positions and rates.
+
+    Args:
+        session (Session): Active SQLModel database session.
+
+    Returns:
+        RatingMatrix: Coordinates of the ratings, movie ids sorted.
+    """
+    profiles: dict[uuid.UUID, int] = {}
+    profile_positions, movie_ids, rates = [], [], []
+    result = session.exec(
+        select(Rating.profile_id, Rating.movie_id, Rating.rate)
+        .execution_options(yield_per=LOAD_CHUNK)
+    )
+    for profile_id, movie_id, rate in result:
+        profile_positions.append(profiles.setdefault(profile_id, len(profiles)))
+        movie_ids.append(movie_id)
+        rates.append(rate)
+
+    movie_ids, movies = np.unique(np.array(movie_ids, dtype='U20'), return_inverse=True)
+    return RatingMatrix(
+        movie_ids=movie_ids,
+        profiles=np.array(profile_positions, dtype=np.int32),
+        movies=movies.astype(np.int32),
+        rates=np.array(rates, dtype=np.float32),
+        n_profiles=len(profiles)
+    )
+
+
+def item_vectors(matrix: RatingMatrix, *, adjusted: bool = True) -> sparse.csc_matrix:
+    """
+    Build the normalized profile×movie matrix whose columns are compared.
+
+    With ``adjusted`` the mean rate of each profile is subtracted from its
+    rates first (adjusted cosine), so a movie rated 4 by someone who rates
+    everything 5 counts as a dislike.
+    """
+    rates = matrix.rates.astype(np.float64)
+    if adjusted and len(rates):
+        totals = np.bincount(matrix.profiles, weights=rates, minlength=matrix.n_profiles)
+        counts = np.bincount(matrix.profiles, minlength=matrix.n_profiles)
+        rates = rates - (totals / np.maximum(counts, 1))[matrix.profiles]
+
+    vectors = sparse.csc_matrix(
+        (rates, (matrix.profiles, matrix.movies)),
+        shape=(matrix.n_profiles, len(matrix.movie_ids))
+    )
+    norms = np.sqrt(np.asarray(vectors.multiply(vectors).sum(axis=0))).ravel()
+    norms[norms == 0] = 1
+    return (vectors @ sparse.diags(1 / norms)).tocsc()
+
+
+def top_neighbours(
+    vectors: sparse.csc_matrix,
+    rows: np.ndarray,
+    k: int,
+    *,
+    keep_similarity: bool = False
+) -> tuple[np.ndarray, np.ndarray, sparse.csr_matrix | None]:
+    """
+    Compute the K most similar movies of some movies.
+
+    The similarities are computed by blocks of rows, the block being a dense
+    slice of the movie×movie similarity matrix small enough to stay in memory.
+    Only positive similarities are kept.
+
+    Args:
+        vectors (sparse.csc_matrix): Normalized matrix from ``item_vectors``.
+        rows (np.ndarray): Positions of the movies to compute.
+        k (int): Number of neighbours per movie.
+        keep_similarity (bool): Also return the similarity rows, for the incremental build.
+
+    Returns:
+        tuple: The neighbours and scores of the rows, and their similarity
+        rows as a sparse matrix when ``keep_similarity`` is set.
+    """
+    n_movies = vectors.shape[1]
+    neighbours = np.full((len(rows), k), -1, dtype=np.int32)
+    scores = np.zeros((len(rows), k), dtype=np.float32)
+    similarities = []
+    transposed = vectors.T.tocsr()
+    block = max(1, BLOCK_CELLS // max(n_movies, 1))
+
+    for start in range(0, len(rows), block):
+        chunk = rows[start:start + block]
+        dense = (transposed[chunk] @ vectors).toarray()
+        dense[np.arange(len(chunk)), chunk] = 0
+        dense[dense < 0] = 0
+        if keep_similarity:
+            similarities.append(sparse.csr_matrix(dense, dtype=np.float32))
+
+        neighbours[start:start + len(chunk)], scores[start:start + len(chunk)] = _top_k(
+            dense, np.broadcast_to(np.arange(n_movies, dtype=np.int32), dense.shape), k
+        )
+
+    if not keep_similarity:
+        return neighbours, scores, None
+    if similarities:
+        return neighbours, scores, sparse.vstack(similarities).tocsr()
+    return neighbours, scores, sparse.csr_matrix((0, n_movies), dtype=np.float32)
+
+
+def _top_k(scores: np.ndarray, candidates: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    # Keep the k best candidates of every row, best first, -1 where the
+    # score is not positive
+    width = scores.shape[1]
+    if width > k:
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        best = np.broadcast_to(np.arange(width), scores.shape)
+    best_scores = np.take_along_axis(scores, best, axis=1)
+    order = np.argsort(-best_scores, axis=1, kind='stable')
+    best = np.take_along_axis(best, order, axis=1)
+    best_scores = np.take_along_axis(best_scores, order, axis=1)
+    best_ids = np.take_along_axis(candidates, best, axis=1)
+
+    neighbours = np.full((scores.shape[0], k), -1, dtype=np.int32)
+    top = np.zeros((scores.shape[0], k), dtype=np.float32)
+    neighbours[:, :best.shape[1]] = np.where(best_scores > 0, best_ids, -1)
+    top[:, :best.shape[1]] = np.where(best_scores > 0, best_scores, 0)
+    return neighbours, top
+
+
+def build_neighbour_index(
+    matrix: RatingMatrix,
+    *,
+    k: int,
+    adjusted: bool = True,
+    previous: NeighbourIndex | None = None,
+    changed: np.ndarray | None = None,
+    last_rated_at: str | None = None
+) -> tuple[NeighbourIndex, int]:
+    """
+    Build the neighbour index of a rating matrix.
+
+    With a ``previous`` index and the ids of the ``changed`` movies, only the
+    rows of the changed movies (and of movies new to the index) are
+    recomputed; the other rows keep their neighbours, with the similarities
+    to the changed movies updated. A row is recomputed as well when one of
+    its neighbours got less similar than its previous K-th neighbour, as the
+    movie that should take its place is unknown. This gives the same index
+    as a full build with the plain cosine but, with adjusted cosine, leaves
+    the small drift of the profile means on the other pairs until the next
+    full build.
+
+    Args:
+        matrix (RatingMatrix): Ratings loaded by ``load_rating_matrix``.
+        k (int): Number of neighbours per movie.
+        adjusted (bool): Use the adjusted cosine instead of the plain cosine.
+        previous (NeighbourIndex | None): Index to update.
+        changed (np.ndarray | None): Ids of the movies rated since ``previous`` was built.
+        last_rated_at (str | None): Creation time of the newest rating.
+
+    Returns:
+        tuple: The index and the number of recomputed rows.
+    """
+    n_movies = len(matrix.movie_ids)
+    vectors = item_vectors(matrix, adjusted=adjusted)
+
+    rows = None
+    if (
+        previous is not None and changed is not None
+        and previous.k == k and previous.adjusted == adjusted
+    ):
+        remapped = _remap(previous, matrix.movie_ids)
+        stale = np.union1d(
+            np.flatnonzero(~remapped[2]),
+            _positions(matrix.movie_ids, changed)
+        ).astype(np.int32)
+        if len(stale) <= MAX_INCREMENTAL_SHARE * n_movies:
+            rows = stale
+
+    if rows is None:
+        neighbours, scores, _ = top_neighbours(vectors, np.arange(n_movies, dtype=np.int32), k)
+        index = NeighbourIndex(matrix.movie_ids, neighbours, scores, last_rated_at, adjusted)
+        return index, n_movies
+
+    neighbours, scores, _ = remapped
+    new_neighbours, new_scores, similarity = top_neighbours(
+        vectors, rows, k, keep_similarity=True
+    )
+    incomplete = _merge(neighbours, scores, rows, similarity.T.tocsr(), k)
+    neighbours[rows], scores[rows] = new_neighbours, new_scores
+
+    incomplete = np.setdiff1d(np.flatnonzero(incomplete), rows).astype(np.int32)
+    if len(incomplete):
+        neighbours[incomplete], scores[incomplete], _ = top_neighbours(vectors, incomplete, k)
+
+    index = NeighbourIndex(matrix.movie_ids, neighbours, scores, last_rated_at, adjusted)
+    return index, len(rows) + len(incomplete)
+
+
+def _positions(movie_ids: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    positions = np.searchsorted(movie_ids, ids)
+    found = positions < len(movie_ids)
+    found[found] = movie_ids[positions[found]] == ids[found]
+    return positions[found]
+
+
+def _remap(previous: NeighbourIndex, movie_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Move the rows and neighbour positions of the previous index to the
+    # positions of the current movies. Movies no longer rated become -1 in
+    # the neighbour lists, movies new to the index get empty rows.
+    n_movies, k = len(movie_ids), previous.k
+    new_positions = np.full(len(previous.movie_ids) + 1, -1, dtype=np.int32)
+    old_rows = _positions(previous.movie_ids, movie_ids)
+    current_rows = _positions(movie_ids, previous.movie_ids[old_rows])
+    new_positions[old_rows] = current_rows
+
+    neighbours = np.full((n_movies, k), -1, dtype=np.int32)
+    scores = np.zeros((n_movies, k), dtype=np.float32)
+    known = np.zeros(n_movies, dtype=bool)
+    neighbours[current_rows] = new_positions[previous.neighbours[old_rows]]
+    scores[current_rows] = previous.scores[old_rows]
+    known[current_rows] = True
+    return neighbours, scores, known
+
+
+def _merge(
+    neighbours: np.ndarray,
+    scores: np.ndarray,
+    rows: np.ndarray,
+    similarity: sparse.csr_matrix,
+    k: int
+) -> np.ndarray:
+    # Replace the similarities to the recomputed movies in the neighbour
+    # lists of every other movie. ``similarity`` holds, for each movie, its
+    # similarity to each recomputed row. Returns the rows whose new K-th
+    # score is below the previous one: a movie outside the previous list
+    # may belong to them now.
+    floor = scores[:, -1].copy()
+    stale = np.isin(neighbours, rows) | (neighbours < 0)
+    neighbours[stale] = -1
+    scores[stale] = 0
+
+    block = max(1, BLOCK_CELLS // max(len(rows) + k, 1))
+    for start in range(0, len(neighbours), block):
+        stop = min(start + block, len(neighbours))
+        fresh = similarity[start:stop].toarray()
+        candidates = np.hstack([
+            neighbours[start:stop],
+            np.broadcast_to(rows, (stop - start, len(rows)))
+        ])
+        candidate_scores = np.hstack([scores[start:stop], fresh])
+        candidate_scores[candidates < 0] = 0
+        neighbours[start:stop], scores[start:stop] = _top_k(candidate_scores, candidates, k)
+    return scores[:, -1] < floor
+
+
+def build_recommendations(
+    *,
+    session: Session,
+    k: int = 50,
+    adjusted: bool = True,
+    full: bool = False,
+    path: str | None = None
+) -> BuildResult:
+    """
+    Build or update the movie neighbour index from the ratings table.
+
+    Unless ``full`` is given and when an index built with the same ``k`` and
+    ``adjusted`` already exists, only the movies rated since it was built are
+    recomputed. Deleted ratings and updated rates, which keep their creation
+    time, are not tracked: a periodic full build picks them up.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        k (int): Number of neighbours per movie.
+        adjusted (bool): Use the adjusted cosine instead of the plain cosine.
+        full (bool): Rebuild every row.
+        path (str | None): Path of the index file, ``INDEX_PATH`` by default.
+
+    Returns:
+        BuildResult: Size of the index and number of recomputed rows.
+    """
+    path = path or INDEX_PATH
+    previous = None
+    if not full and os.path.exists(path):
+        previous = NeighbourIndex.load(path)
+        if previous.k != k or previous.adjusted != adjusted:
+            # Built with other parameters, every row is recomputed
+            previous = None
+
+    last_rated_at = session.exec(select(func.max(Rating.created_at))).one()
+    last_rated_at = last_rated_at.isoformat() if last_rated_at else None
+
+    changed = None
+    if previous is not None:
+        if previous.last_rated_at == last_rated_at:
+            return BuildResult(len(previous.movie_ids), 0, True)
+        statement = select(Rating.movie_id).distinct()
+        if previous.last_rated_at:
+            since = datetime.fromisoformat(previous.last_rated_at)
+            statement = statement.where(Rating.created_at > since)
+        changed = np.array(session.exec(statement).all(), dtype='U20')
+
+    matrix = load_rating_matrix(session=session)
+    index, rebuilt = build_neighbour_index(
+        matrix,
+        k=k,
+        adjusted=adjusted,
+        previous=previous,
+        changed=changed,
+        last_rated_at=last_rated_at
+    )
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    index.save(path)
+    return BuildResult(
+        movies=len(index.movie_ids),
+        rebuilt=rebuilt,
+        incremental=rebuilt < len(index.movie_ids)
+    )
+
+
+_lock = threading.Lock()
+_loaded: dict[str, Any] = {}
+
+
+def get_neighbour_index(path: str | None = None) -> NeighbourIndex | None:
+    """
+    Get the index of a file, loaded once and reloaded when the file is replaced.
+
+    Returns:
+        NeighbourIndex | None: The index, or None if it was never built.
+    """
+    path = path or INDEX_PATH
+    with _lock:
+        current_id = file_id(path)
+        if current_id is None:
+            return None
+        cached = _loaded.get(path)
+        if cached is None or cached[0] != current_id:
+            cached = (current_id, NeighbourIndex.load(path))
+            _loaded[path] = cached
+        return cached[1]
+
+
+def recommend_movies(
+    *,
+    session: Session,
+    profile_id: uuid.UUID,
+    limit: int = 20,
+    path: str | None = None
+) -> list[MovieRecommendation]:
+    """
+    Recommend movies to a profile from the neighbours of the movies it rated.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_id (uuid.UUID): The ID of the profile.
+        limit (int): Maximum number of recommendations.
+        path (str | None): Path of the index file, ``INDEX_PATH`` by default.
+
+    Returns:
+        list[MovieRecommendation]: Recommended movies, best first. Empty when
+        the index was not built or the profile has not rated indexed movies.
+    """
+    index = get_neighbour_index(path)
+    if index is None:
+        return []
+
+    rated = session.exec(
+        select(Rating.movie_id, Rating.rate).where(Rating.profile_id == profile_id)
+    ).all()
+    if not rated:
+        return []
+
+    movie_ids, rates = zip(*rated)
+    return [
+        MovieRecommendation(movie_id=movie_id, score=score)
+        for movie_id, score in index.recommend(list(movie_ids), list(rates), limit)
+    ]
@@ -0,0 +1,237 @@
+import uuid
+
+import numpy as np
+from sqlalchemy import String, cast, event
+from sqlmodel import Session, select
+
+from backend.core.cache import TTLCache
+from backend.core.config import settings
+from backend.logic.models import Follow, Profile, Rating
+from backend.logic.schemas.profiles import TasteMatch
+
+# Largest difference between two rates, 0.5 and 5 stars
+MAX_RATE_DIFFERENCE = 4.5
+# Profiles whose ratings are read by one query
+LOAD_CHUNK = 1000
+_PENDING = "taste_match"
+_EMPTY = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32))
+
+# Ratings of each recently scored profile: the sorted hashes of its movie ids
+# and its rates. Dropped when this process writes a rating of the profile,
+# the writes of the other workers are seen once they expire.
+rating_vectors = TTLCache(
+    ttl=settings.TASTE_VECTOR_TTL_SECONDS, max_entries=settings.TASTE_VECTOR_MAX_ENTRIES
+)
+
+
+def match_scores(co_rated: np.ndarray, differences: np.ndarray) -> np.ndarray:
+    """
+    Turn the rate differences of many profiles into match percentages.
+
+    The match of a profile is 100% minus its mean absolute rate difference
+    with the target on the movies both rated, relative to the largest
+    possible difference.
+
+    Args:
+        co_rated (np.ndarray): Number of co-rated movies of each profile.
+        differences (np.ndarray): Sum of the absolute rate differences of each profile.
+
+    Returns:
+        np.ndarray: The match percentage of every profile, NaN without co-rated movies.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return 100 * (1 - differences / co_rated / MAX_RATE_DIFFERENCE)
+
+
+def load_rating_vectors(
+    *, session: Session, profile_ids: list[uuid.UUID]
+) -> dict[uuid.UUID, tuple[np.ndarray, np.ndarray]]:
+    """
+    Get the rating vectors of some profiles, reading the ratings of the
+    profiles missing from ``rating_vectors`` by chunks of ``LOAD_CHUNK``.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_ids (list[uuid.UUID]): The profiles.
+
+    Returns:
+        dict: The sorted hashes of the rated movies and the rates of each profile.
+    """
+    vectors = {}
+    missing = []
+    for profile_id in dict.fromkeys(profile_ids):
+        vector = rating_vectors.get(profile_id)
+        if vector is None:
+            missing.append(profile_id)
+        else:
+            vectors[profile_id] = vector
+
+    for start in range(0, len(missing), LOAD_CHUNK):
+        chunk = missing[start:start + LOAD_CHUNK]
+        loaded = dict.fromkeys(chunk, _EMPTY)
+        # The profile ids are read as text and parsed once per profile
+        # rather than once per rating
+        rows = session.exec(
+            select(cast(Rating.profile_id, String), Rating.movie_id, Rating.rate)
+            .where(Rating.profile_id.in_(chunk))
+            .order_by(Rating.profile_id)
+        ).all()
+        if rows:
+            owners, movie_ids, rates = zip(*rows)
+            owners = np.array(owners)
+            # The movies are keyed by the hash of their id, which only has to
+            # agree within this process: the vectors are never shared, and a
+            # collision between two 64-bit hashes is negligible
+            hashes = np.fromiter(map(hash, movie_ids), dtype=np.int64, count=len(movie_ids))
+            rates = np.array(rates, dtype=np.float32)
+            first = np.r_[True, owners[1:] != owners[:-1]]
+            starts = np.flatnonzero(first)
+            # Sort the movies of each profile, keeping the profiles in order
+            order = np.lexsort((hashes, np.cumsum(first)))
+            hashes, rates = hashes[order], rates[order]
+            for owner, profile_hashes, profile_rates in zip(
+                owners[starts], np.split(hashes, starts[1:]), np.split(rates, starts[1:])
+            ):
+                loaded[uuid.UUID(owner)] = (profile_hashes, profile_rates)
+
+        for profile_id, vector in loaded.items():
+            rating_vectors.put(profile_id, vector)
+        vectors.update(loaded)
+    return vectors
+
+
+def get_taste_matches(
+    *,
+    session: Session,
+    profile_id: uuid.UUID,
+    other_ids: list[uuid.UUID]
+) -> dict[uuid.UUID, tuple[float, int]]:
+    """
+    Score the taste of a profile against other profiles.
+
+    The vectors of the other profiles are concatenated, so one binary
+    search in the sorted movies of the profile finds every co-rated movie
+    and two ``bincount`` sum the rate differences and the co-rated movies
+    of each profile, without a loop over the profiles. Nothing is sized by
+    the number of movies known to the process.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_id (uuid.UUID): The profile to compare with.
+        other_ids (list[uuid.UUID]): The profiles to score.
+
+    Returns:
+        dict: The match percentage and the number of co-rated movies of
+        each profile that co-rated at least one movie.
+    """
+    other_ids = [other_id for other_id in dict.fromkeys(other_ids) if other_id != profile_id]
+    if not other_ids:
+        return {}
+    vectors = load_rating_vectors(session=session, profile_ids=[profile_id, *other_ids])
+    own_hashes, own_rates = vectors[profile_id]
+    if not len(own_hashes):
+        return {}
+
+    lengths = [len(vectors[other_id][0]) for other_id in other_ids]
+    owners = np.repeat(np.arange(len(other_ids), dtype=np.int32), lengths)
+    hashes = np.concatenate([vectors[other_id][0] for other_id in other_ids])
+    rates = np.concatenate([vectors[other_id][1] for other_id in other_ids])
+
+    positions = np.minimum(np.searchsorted(own_hashes, hashes), len(own_hashes) - 1)
+    co = own_hashes[positions] == hashes
+    owners = owners[co]
+    co_rated = np.bincount(owners, minlength=len(other_ids))
+    differences = np.bincount(
+        owners,
+        weights=np.abs(rates[co] - own_rates[positions[co]]).astype(np.float64),
+        minlength=len(other_ids)
+    )
+    matches = match_scores(co_rated, differences)
+    return {
+        other_ids[i]: (round(float(matches[i]), 1), int(co_rated[i]))
+        for i in np.flatnonzero(co_rated)
+    }
+
+
+def get_taste_match(
+    *, session: Session, profile_id: uuid.UUID, other: Profile
+) -> TasteMatch:
+    """
+    Score the taste of a profile against another one.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_id (uuid.UUID): The profile to compare with, usually the caller.
+        other (Profile): The other profile.
+
+    Returns:
+        TasteMatch: The match, None without co-rated movies.
+    """
+    matches = get_taste_matches(
+        session=session,
+        profile_id=profile_id,
+        other_ids=[other.profile_id]
+    )
+    match, co_rated = matches.get(other.profile_id, (None, 0))
+    return TasteMatch(
+        profile_id=other.profile_id, username=other.username, match=match, co_rated=co_rated
+    )
+
+
+def get_follower_taste_matches(
+    *, session: Session, profile_id: uuid.UUID, limit: int = 100
+) -> list[TasteMatch]:
+    """
+    Score the taste of a profile against each of its followers.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        profile_id (uuid.UUID): The followed profile.
+        limit (int): Maximum number of followers returned.
+
+    Returns:
+        list[TasteMatch]: The followers that co-rated at least one movie,
+        best match first.
+    """
+    matches = get_taste_matches(
+        session=session,
+        profile_id=profile_id,
+        other_ids=session.exec(
+            select(Follow.follower_id).where(Follow.following_id == profile_id)
+        ).all()
+    )
+    best = sorted(matches.items(), key=lambda item: (-item[1][0], -item[1][1]))[:limit]
+    if not best:
+        return []
+
+    usernames = dict(session.exec(
+        select(Profile.profile_id, Profile.username)
+        .where(Profile.profile_id.in_([other_id for other_id, _ in best]))
+    ).all())
+    return [
+        TasteMatch(profile_id=other_id, username=usernames[other_id], match=match, co_rated=co_rated)
+        for other_id, (match, co_rated) in best
+    ]
+
+
+def track_profile_ratings(*, session: Session, profile_id: uuid.UUID) -> None:
+    """
+    Record that the ratings of a profile changed, dropping its cached vector
+    when the session commits.
+
+    Args:
+        session (Session): The session writing the ratings.
+        profile_id (uuid.UUID): The profile.
+    """
+    session.info.setdefault(_PENDING, set()).add(profile_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_vectors(session: Session) -> None:
+    for profile_id in session.info.pop(_PENDING, ()):
+        rating_vectors.invalidate(profile_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_PENDING, None)
@@ -1,12 +1,28 @@
-from typing import Any
+import uuid
+from typing import Any, NamedTuple
 
 from sqlmodel import Session, select
 
+from backend.core.cache import TTLCache
+from backend.core.config import settings
 from backend.core.security import get_password_hash, verify_password
+from backend.logic.enum import UserStatus, UserTypes
 from backend.logic.models import User 
 from backend.logic.schemas.users import CreateUser, UpdateUser
 
 
+class UserSnapshot(NamedTuple):
+    user_id: uuid.UUID
+    user_status: UserStatus
+    user_type: UserTypes
+
+
+# Status and type of recently authenticated users, by user id
+user_snapshots = TTLCache(
+    ttl=settings.USER_CACHE_TTL_SECONDS, max_entries=settings.USER_CACHE_MAX_ENTRIES
+)
+
+
 def create_user(*, session: Session, user_create: CreateUser) -> User:
     """
     Create a new User in the database.
@@ -48,10 +64,52 @@ def update_user(*, session: Session, db_user: User, user_in: UpdateUser) -> Any:
     db_user.sqlmodel_update(user_data, update=extra_data)
     session.add(db_user)
     session.commit()
+    user_snapshots.invalidate(db_user.user_id)
     session.refresh(db_user)
     return db_user
 
 
+def get_user_snapshot(*, session: Session, user_id: uuid.UUID) -> UserSnapshot | None:
+    """
+    Retrieve the status and type of a User, as checked on every
+    authenticated request.
+
+    Snapshots are cached for ``USER_CACHE_TTL_SECONDS``, so a cached user
+    costs a dictionary lookup. ``update_user`` and ``delete_user`` drop the
+    snapshot of the user they change; changes made by other processes are
+    seen once it expires.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        user_id (UUID): ID of the user.
+
+    Returns:
+        UserSnapshot | None: The snapshot if the user exists, otherwise None.
+    """
+    snapshot = user_snapshots.get(user_id)
+    if snapshot is None:
+        user = session.get(User, user_id)
+        if not user:
+            return None
+        snapshot = UserSnapshot(user.user_id, user.user_status, user.user_type)
+        user_snapshots.put(user_id, snapshot)
+    return snapshot
+
+
+def delete_user(*, session: Session, db_user: User) -> None:
+    """
+    Delete a User from the database.
+
+    Args:
+        session (Session): Active SQLModel database session.
+        db_user (User): The User object to delete.
+    """
+    user_id = db_user.user_id
+    session.delete(db_user)
+    session.commit()
+    user_snapshots.invalidate(user_id)
+
+
 def get_user_by_email(*, session: Session, email: str) -> User | None:
     """
     Retrieve a User by their email address.
@@ -3,11 +3,13 @@ from .user_types import UserTypes
 from .profile_roles import ProfileRoles
 from .target_types import TargetTypes
 from .user_genders import UserGender
+from .feed_activities import FeedActivities
 
 __all__ = [
     "UserTypes",
     "UserStatus",
     "UserGender",
     "ProfileRoles",
-    "TargetTypes"
+    "TargetTypes",
+    "FeedActivities"
 ]
\ No newline at end of file
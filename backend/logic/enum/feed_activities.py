@@ -0,0 +1,19 @@
+from enum import Enum
+
+class FeedActivities(str, Enum):
+    """
+    Enum class that defines the kinds of activity shown in the feed.
+
+    Attributes:
+        RATING: A movie was rated.
+        LIST: A public movie list was created.
+        LIST_MOVIE: A movie was added to a public movie list.
+        COMMENT: A comment was written.
+        ARTICLE: An article was published.
+    """
+
+    RATING = 'rating'
+    LIST = 'list'
+    LIST_MOVIE = 'list_movie'
+    COMMENT = 'comment'
+    ARTICLE = 'article'
@@ -1,25 +1,29 @@
 from .users import User
-from .profiles import Profile
+from .profiles import Profile, ProfileCounters
 from .follows import Follow
-from .ratings import Rating
-from .movie_lists import MovieList
+from .ratings import Rating, MovieRatingStats
+from .movie_lists import MovieList, MovieListItem
 from .reactions import Reaction
 from .comments import Comment
 from .articles import Article
 from .articles_tags import Section, Newsletter
 from .author_article import AuthorArticle
+from .feed import FeedItem
 
 
 __all__ = [
     "User", 
     "Profile", 
+    "ProfileCounters",
     "Follow", 
     "Rating", 
     "MovieList", 
+    "MovieListItem",
     "Reaction",
     "Comment",
     "Article",
     "Section",
     "Newsletter",
-    "AuthorArticle"
+    "AuthorArticle",
+    "FeedItem"
 ]
\ No newline at end of file
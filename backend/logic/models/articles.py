@@ -1,6 +1,7 @@
 import uuid
 from typing import Optional
 from datetime import datetime, timezone
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 
 
@@ -21,10 +22,15 @@ class Article(SQLModel, table=True):
         newsletter (Optional[Newsletter]): Many-to-one relationship to the Newsletter the article is part of (optional).
         author_article (List[AuthorArticle]): One-to-many relationship with authors linked to this article.
     """
+    __table_args__ = (
+        # Keyset pagination
+        Index("ix_article_created_at_article_id", "created_at", "article_id"),
+    )
+
     article_title: str = Field(max_length=100)
     movie_ref_id: str | None = Field(index=True, max_length=20)
     article_id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    created_at: datetime = datetime.now(timezone.utc)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     section_id: int = Field(foreign_key='section.section_id')
     newsletter_id: int | None = Field(foreign_key='newsletter.newsletter_id')
 
@@ -0,0 +1,41 @@
+import uuid
+from datetime import datetime, timezone
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+from backend.logic.enum import FeedActivities
+
+
+class FeedItem(SQLModel, table=True):
+    """
+    Database model representing an activity in the feed timeline of a profile.
+
+    An activity is copied to the timeline of every follower of its actor
+    when it happens. Activities of profiles with many followers are written
+    once, to the timeline of the actor itself, and read from there by the
+    followers.
+
+    Attributes:
+        profile_id (UUID): Owner of the timeline.
+        actor_id (UUID): Profile that did the activity, not a foreign key so
+            the timelines of others do not hold a deleted profile.
+        activity (FeedActivities): Kind of activity.
+        object_id (str): The rated movie, the list, the comment or the article.
+        movie_id (Optional[str]): The movie involved, if any.
+        detail (Optional[str]): Short text shown with the activity, like the rate or the title.
+        created_at (datetime): Timestamp of the activity (UTC time).
+        feed_item_id (UUID): Primary key identifier, auto-generated UUID.
+    """
+    __table_args__ = (
+        # Timeline reads, newest first
+        Index("ix_feeditem_profile_id_created_at", "profile_id", "created_at", "feed_item_id"),
+    )
+
+    profile_id: uuid.UUID = Field(foreign_key="profile.profile_id")
+    actor_id: uuid.UUID
+    activity: FeedActivities
+    object_id: str = Field(max_length=40)
+    movie_id: str | None = Field(default=None, max_length=20)
+    detail: str | None = Field(default=None, max_length=155)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    feed_item_id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
@@ -1,12 +1,19 @@
 import uuid
 from datetime import datetime, timezone
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
 class Follow(SQLModel, table=True):
+    __table_args__ = (
+        # Keyset pagination of the followers and following lists
+        Index("ix_follow_following_id_created_at", "following_id", "created_at", "follower_id"),
+        Index("ix_follow_follower_id_created_at", "follower_id", "created_at", "following_id"),
+    )
+
     follower_id: uuid.UUID = Field(foreign_key="profile.profile_id", primary_key=True)
     following_id: uuid.UUID = Field(foreign_key="profile.profile_id", primary_key=True)
-    created_at: datetime = datetime.now(timezone.utc)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     follower: "Profile" = Relationship(
         back_populates="following", sa_relationship_kwargs={"foreign_keys": "[Follow.follower_id]"}
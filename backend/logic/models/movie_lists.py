@@ -1,15 +1,39 @@
 import uuid
 from datetime import datetime, timezone
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
 class MovieList(SQLModel, table=True):
+    __table_args__ = (
+        # Keyset pagination
+        Index("ix_movielist_privacy_created_at_list_id", "privacy", "created_at", "list_id"),
+    )
+
     name: str = Field(max_length=155)
     description: str | None = Field(max_length=255)
     privacy: bool = False
     profile_id: uuid.UUID = Field(foreign_key="profile.profile_id")
 
     list_id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    created_at: datetime = datetime.now(timezone.utc)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     profile: "Profile" = Relationship(back_populates="movie_list")
+    items: list["MovieListItem"] = Relationship(back_populates="movie_list")
+
+
+class MovieListItem(SQLModel, table=True):
+    """
+    Database model representing a movie inside a movie list.
+
+    Attributes:
+        list_id (UUID): Foreign key to the list, first column of the primary key.
+        movie_id (str): Reference to the movie, second column of the primary key and indexed
+            to find the lists that contain a movie.
+        added_at (datetime): Timestamp when the movie was added to the list (UTC time).
+    """
+    list_id: uuid.UUID = Field(foreign_key="movielist.list_id", primary_key=True, ondelete='CASCADE')
+    movie_id: str = Field(max_length=20, primary_key=True, index=True)
+    added_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    movie_list: "MovieList" = Relationship(back_populates="items")
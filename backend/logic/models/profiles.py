@@ -47,4 +47,25 @@ class Profile(SQLModel, table=True):
     )
 
     author_article: list["AuthorArticle"] = Relationship(back_populates="profile")
-    
\ No newline at end of file
+    
+
+class ProfileCounters(SQLModel, table=True):
+    """
+    Database model holding the counters shown on a profile.
+
+    The row is kept up to date by the follow, rating and movie list write
+    paths in the same transaction as the change itself, so rendering a
+    profile does not load its collections.
+
+    Attributes:
+        profile_id (UUID): Reference to the profile.
+        followers_count (int): Number of profiles following the profile.
+        following_count (int): Number of profiles the profile is following.
+        lists_count (int): Number of movie lists of the profile.
+        movies_rated (int): Number of movies rated by the profile.
+    """
+    profile_id: uuid.UUID = Field(foreign_key="profile.profile_id", primary_key=True)
+    followers_count: int = 0
+    following_count: int = 0
+    lists_count: int = 0
+    movies_rated: int = 0
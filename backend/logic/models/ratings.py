@@ -5,9 +5,39 @@ from sqlmodel import Field, Relationship, SQLModel
 
 class Rating(SQLModel, table=True):
     profile_id: uuid.UUID = Field(foreign_key="profile.profile_id" ,primary_key=True)
-    movie_id: str = Field(max_length=20, primary_key=True)
+    movie_id: str = Field(max_length=20, primary_key=True, index=True)
     rate: float = Field(ge=0.5, le=5)
-    created_at: datetime = datetime.now(timezone.utc)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
 
     profile: "Profile" = Relationship(back_populates="rating")
-    
\ No newline at end of file
+
+
+class MovieRatingStats(SQLModel, table=True):
+    """
+    Database model holding the rating aggregates of a movie.
+
+    The row is kept up to date by the rating write paths in the same
+    transaction as the rating itself, so reading the average or the
+    distribution of a movie is a primary key lookup.
+
+    Attributes:
+        movie_id (str): Reference to the movie (max 20 characters).
+        count (int): Number of ratings.
+        sum (float): Sum of the rates.
+        sum_sq (float): Sum of the squared rates, for the variance.
+        bucket_1 ... bucket_10 (int): Number of rates rounded to 0.5, 1.0 ... 5.0 stars.
+    """
+    movie_id: str = Field(max_length=20, primary_key=True)
+    count: int = 0
+    sum: float = 0
+    sum_sq: float = 0
+    bucket_1: int = 0
+    bucket_2: int = 0
+    bucket_3: int = 0
+    bucket_4: int = 0
+    bucket_5: int = 0
+    bucket_6: int = 0
+    bucket_7: int = 0
+    bucket_8: int = 0
+    bucket_9: int = 0
+    bucket_10: int = 0
@@ -2,6 +2,7 @@ import uuid
 from typing import Optional
 from datetime import date, datetime, timezone
 from pydantic import EmailStr
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 from backend.logic.enum import UserStatus, UserTypes, UserGender
 
@@ -22,6 +23,11 @@ class User(SQLModel, table=True):
         created_at (datetime): Timestamp of when the user account was created (UTC time).
         profile (Optional["Profile"]): Optional one-to-one relationship to the user's profile.
     """
+    __table_args__ = (
+        # Keyset pagination
+        Index("ix_user_created_at_user_id", "created_at", "user_id"),
+    )
+
     full_name: str = Field(max_length=255)
     email: EmailStr = Field(unique=True, index=True, max_length=255)
     hashed_password: str
@@ -31,7 +37,7 @@ class User(SQLModel, table=True):
     user_status: UserStatus = Field(default=UserStatus.ACTIVE)
     user_type: UserTypes = Field(default=UserTypes.EXTERNAL)
     user_id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    created_at: datetime = datetime.now(timezone.utc)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     profile: Optional["Profile"] = Relationship(back_populates="user")
     
\ No newline at end of file
@@ -103,9 +103,11 @@ class ArticlesPublic(SQLModel):
     Attributes:
         articles (List[ArticlePublic]): List of articles with basic public info.
         count (int): Total number of articles.
+        next_cursor (Optional[str]): Cursor of the next page, None on the last page.
     """
     articles: list[ArticlePublic]
     count: int
+    next_cursor: str | None = None
 
 class ArticlesPublicEXT(SQLModel):
     """
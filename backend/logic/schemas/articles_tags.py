@@ -44,9 +44,11 @@ class SectionsPublic(SQLModel):
     Attributes:
         sections (List[SectionPublic]): List of sections.
         count (int): Total number of sections.
+        next_cursor (Optional[str]): Cursor of the next page, None on the last page.
     """
     sections: list[SectionPublic]
     count: int
+    next_cursor: str | None = None
 
 
 class NewsletterPublic(SQLModel):
@@ -68,6 +70,8 @@ class NewslettersPublic(SQLModel):
     Attributes:
         newsletters (List[SectionPublic]): List of newsletters.
         count (int): Total number of newsletters.
+        next_cursor (Optional[str]): Cursor of the next page, None on the last page.
     """
     newsletters: list[NewsletterPublic]
-    count: int
\ No newline at end of file
+    count: int
+    next_cursor: str | None = None
\ No newline at end of file
@@ -0,0 +1,34 @@
+import uuid
+from datetime import datetime
+from sqlmodel import SQLModel
+
+from backend.logic.enum import FeedActivities
+
+
+class FeedItemPublic(SQLModel):
+    """
+    Public-facing model for an activity of the feed.
+
+    Attributes:
+        feed_item_id (uuid.UUID): Unique identifier of the item.
+        actor_id (uuid.UUID): Profile that did the activity.
+        username (str): Username of that profile.
+        activity (FeedActivities): Kind of activity.
+        object_id (str): The rated movie, the list, the comment or the article.
+        movie_id (Optional[str]): The movie involved, if any.
+        detail (Optional[str]): Short text shown with the activity.
+        created_at (datetime): When the activity happened.
+    """
+    feed_item_id: uuid.UUID
+    actor_id: uuid.UUID
+    username: str
+    activity: FeedActivities
+    object_id: str
+    movie_id: str | None = None
+    detail: str | None = None
+    created_at: datetime
+
+
+class FeedPublic(SQLModel):
+    items: list[FeedItemPublic]
+    next_cursor: str | None = None
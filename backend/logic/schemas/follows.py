@@ -1,5 +1,5 @@
 import uuid
-from sqlmodel import SQLModel
+from sqlmodel import Field, SQLModel
 
 from backend.logic.schemas.profiles import ProfilePublic
 
@@ -7,8 +7,53 @@ from backend.logic.schemas.profiles import ProfilePublic
 class FollowersPublic(ProfilePublic):
     followers: list[ProfilePublic]
     count: int
+    next_cursor: str | None = None
 
 
 class FollowingPublic(ProfilePublic):
     following: list[ProfilePublic]
-    count: int
\ No newline at end of file
+    count: int
+    next_cursor: str | None = None
+
+class FollowSuggestion(SQLModel):
+    """
+    Model for a profile suggested to follow.
+
+    Attributes:
+        profile_id (uuid.UUID): The suggested profile.
+        username (str): Username of the suggested profile.
+        score (float): Ranking score, higher first.
+        shared_follows (int): Number of followed profiles that follow it.
+        shared_ratings (int): Number of movies both rated highly.
+    """
+    profile_id: uuid.UUID
+    username: str
+    score: float
+    shared_follows: int
+    shared_ratings: int
+
+
+class FollowSuggestionsPublic(SQLModel):
+    suggestions: list[FollowSuggestion]
+
+
+class ProfileIdsIn(SQLModel):
+    profile_ids: list[uuid.UUID] = Field(min_length=1, max_length=500)
+
+
+class FollowStatus(SQLModel):
+    """
+    Model for the follow relationship between the caller and a profile.
+
+    Attributes:
+        profile_id (uuid.UUID): The other profile.
+        following (bool): Whether the caller follows the profile.
+        followed_by (bool): Whether the profile follows the caller.
+    """
+    profile_id: uuid.UUID
+    following: bool
+    followed_by: bool
+
+
+class FollowStatusesPublic(SQLModel):
+    statuses: list[FollowStatus]
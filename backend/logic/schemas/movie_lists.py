@@ -1,4 +1,5 @@
 import uuid
+from datetime import datetime
 from sqlmodel import SQLModel
 
 from backend.logic.schemas.profiles import ProfilePublic
@@ -19,17 +20,22 @@ class UpdateMovieList(MovieListBase):
     privacy: bool | None = None
 
 
+class MovieListItemPublic(SQLModel):
+    movie_id: str
+    added_at: datetime
+
+
 class MovieListPublic(MovieListBase):
     list_id: uuid.UUID
     profile_id: uuid.UUID
-    movies: list | None = None
+    movies: list[MovieListItemPublic] | None = None
 
 
 class MovieListsPublic(SQLModel):
     movie_lists: list[MovieListPublic]
     count: int
+    next_cursor: str | None = None
 
 
 class ProfileMovieLists(ProfilePublic, MovieListsPublic):
     pass
-    
\ No newline at end of file
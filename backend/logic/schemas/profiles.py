@@ -90,9 +90,11 @@ class ProfilesPublic(SQLModel):
     Attributes:
         profiles (List[ProfilePublic]): List of public profile data.
         count (int): Total number of profiles.
+        next_cursor (Optional[str]): Cursor of the next page, None on the last page.
     """
     profiles: list[ProfilePublic]
     count: int
+    next_cursor: str | None = None
 
 
 class ProfilesPublicEXT(SQLModel):
@@ -104,4 +106,31 @@ class ProfilesPublicEXT(SQLModel):
         count (int): Total number of profiles.
     """
     profiles: list[ProfilePublicEXT]
-    count: int
\ No newline at end of file
+    count: int
+
+class TasteMatch(SQLModel):
+    """
+    Model for the taste similarity between a profile and another one.
+
+    Attributes:
+        profile_id (uuid.UUID): The other profile.
+        username (str): Username of the other profile.
+        match (Optional[float]): Similarity percentage, None without co-rated movies.
+        co_rated (int): Number of movies rated by both profiles.
+    """
+    profile_id: uuid.UUID
+    username: str
+    match: float | None = None
+    co_rated: int
+
+
+class TasteMatchesPublic(SQLModel):
+    """
+    Model representing the taste similarity of a profile with several others.
+
+    Attributes:
+        profile_id (uuid.UUID): The profile the others are compared with.
+        matches (List[TasteMatch]): Similarities, best match first.
+    """
+    profile_id: uuid.UUID
+    matches: list[TasteMatch]
@@ -26,4 +26,48 @@ class MovieRating(SQLModel):
 class MovieRatingsPublic(SQLModel):
     movie_id: str
     ratings: list[MovieRating]
-    
\ No newline at end of file
+    
+
+class MovieRatingStatsPublic(SQLModel):
+    movie_id: str
+    count: int
+    avg_rate: float
+    distribution: dict[str, int]
+
+
+class MovieIdsIn(SQLModel):
+    movie_ids: list[str] = Field(min_length=1, max_length=100)
+
+
+class MovieRatingAverage(SQLModel):
+    movie_id: str
+    avg_rate: float
+    count: int
+    my_rate: float | None = None
+
+
+class MovieRatingAveragesPublic(SQLModel):
+    averages: list[MovieRatingAverage]
+
+
+class RatingImportError(SQLModel):
+    line: int
+    error: str
+
+
+class RatingImportResult(SQLModel):
+    imported: int
+    failed: int
+    errors: list[RatingImportError]
+
+
+class TopMovie(SQLModel):
+    movie_id: str
+    score: float
+    avg_rate: float
+    count: int
+
+
+class TopMoviesPublic(SQLModel):
+    window: str
+    movies: list[TopMovie]
@@ -0,0 +1,12 @@
+import uuid
+from sqlmodel import SQLModel
+
+
+class MovieRecommendation(SQLModel):
+    movie_id: str
+    score: float
+
+
+class MovieRecommendationsPublic(SQLModel):
+    profile_id: uuid.UUID
+    recommendations: list[MovieRecommendation]
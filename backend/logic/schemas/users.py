@@ -115,6 +115,8 @@ class UsersPublic(SQLModel):
     Attributes:
         users (List[UserPublic]): List of user public profiles.
         count (int): Total number of users matching a query or in the system.
+        next_cursor (Optional[str]): Cursor of the next page, None on the last page.
     """
     users: list[UserPublic]
-    count: int
\ No newline at end of file
+    count: int
+    next_cursor: str | None = None
\ No newline at end of file
@@ -0,0 +1,14 @@
+from backend.logic.controllers.article_controller import ArticleController
+
+
+def init() -> None:
+    migrated = ArticleController().migrate()
+    print(f"{migrated} articles migrated")
+
+
+def main() -> None:
+    init()
+
+
+if __name__ == "__main__":
+    main()
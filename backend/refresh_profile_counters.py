@@ -0,0 +1,18 @@
+from sqlmodel import Session
+
+from backend.core.db import engine
+from backend.logic.controllers import profile_counters
+
+
+def init() -> None:
+    with Session(engine) as session:
+        profiles = profile_counters.refresh_profile_counters(session=session)
+    print(f"Counters rebuilt for {profiles} profiles")
+
+
+def main() -> None:
+    init()
+
+
+if __name__ == "__main__":
+    main()
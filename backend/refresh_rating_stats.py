@@ -0,0 +1,20 @@
+from sqlmodel import Session
+
+from backend.core.db import engine
+from backend.logic.controllers import ratings
+from backend.logic.controllers.rating_leaderboard import leaderboard
+
+
+def init() -> None:
+    with Session(engine) as session:
+        movies = ratings.refresh_movie_rating_stats(session=session)
+        leaderboard.rebuild(session=session)
+    print(f"Rating aggregates and top movies rebuilt for {movies} movies")
+
+
+def main() -> None:
+    init()
+
+
+if __name__ == "__main__":
+    main()
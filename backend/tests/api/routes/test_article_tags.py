@@ -2,7 +2,10 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session, select
 
 from backend.core.config import settings
+from backend.logic.controllers import article_tags
 from backend.logic.models import Section
+from backend.logic.schemas.articles_tags import CreateTag
+from backend.tests.utils.utils import random_lower_string
 
 
 def test_create_sections(
@@ -166,4 +169,31 @@ def test_delete_newsletter(
     )
 
     assert 200 <= r.status_code < 300
-    assert r.json()['message'] == 'Newsletter deleted successfully'
\ No newline at end of file
+    assert r.json()['message'] == 'Newsletter deleted successfully'
+
+
+def test_read_sections_cursor(
+    client: TestClient, db: Session
+) -> None:
+    for _ in range(3):
+        article_tags.create_section(
+            session=db,
+            section_create=CreateTag(name=random_lower_string(), description=random_lower_string())
+        )
+
+    url = f"{settings.API_V1_STR}/articles/t/sections"
+    seen = []
+    params = {"limit": 2}
+    while True:
+        page = client.get(url, params=params).json()
+        assert len(page["sections"]) <= 2
+        seen.extend(section["section_id"] for section in page["sections"])
+        if page["next_cursor"] is None:
+            break
+        params["after"] = page["next_cursor"]
+
+    assert seen == sorted(seen)
+    assert len(seen) == page["count"]
+
+    r = client.get(url, params={"limit": 2, "skip": 2})
+    assert [section["section_id"] for section in r.json()["sections"]] == seen[2:4]
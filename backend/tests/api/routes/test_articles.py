@@ -4,8 +4,9 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session, select
 
 from backend.core.config import settings
-from backend.logic.controllers import article_controller, profiles
+from backend.logic.controllers import article_controller, article_tags, profiles
 from backend.logic.models import Article, Profile, AuthorArticle
+from backend.logic.schemas.articles_tags import CreateTag
 from backend.tests.utils.utils import random_lower_string
 
 
@@ -128,6 +129,45 @@ def test_get_article(
     assert 'article_id' in article
 
 
+def test_article_cache_stats(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    article_id = db.exec(
+        select(Article.article_id)
+        .select_from(Article)
+    ).first()
+    client.get(f"{settings.API_V1_STR}/articles/{article_id}")
+
+    r = client.get(
+        f"{settings.API_V1_STR}/articles/cache/stats",
+        headers=superuser_token_headers
+    )
+
+    assert 200 <= r.status_code < 300
+    stats = r.json()
+    assert stats['hits'] >= 1
+    assert stats['size_bytes'] <= stats['max_bytes']
+
+
+def test_get_newsletter_etag(
+    client: TestClient, db: Session
+) -> None:
+    newsletter = article_tags.create_newsletter(
+        session=db,
+        newsletter_create=CreateTag(name=random_lower_string(), description=random_lower_string())
+    )
+    url = f"{settings.API_V1_STR}/articles/newsletter/{newsletter.newsletter_id}"
+
+    r = client.get(url)
+    assert r.status_code == 200
+    assert r.json()['newsletter'] == newsletter.name
+    etag = r.headers['etag']
+
+    r = client.get(url, headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.headers['etag'] == etag
+
+
 def test_get_article_not_found(
     client: TestClient, db: Session
 ) -> None:
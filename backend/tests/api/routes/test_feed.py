@@ -0,0 +1,54 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from backend.core.config import settings
+from backend.logic.controllers import follows, profiles, ratings, users
+from backend.logic.schemas.profiles import CreateProfile
+from backend.logic.schemas.ratings import CreateRating
+from backend.logic.schemas.users import CreateUser
+from backend.tests.utils.user import user_and_profile_in, user_authentication_headers
+from backend.tests.utils.utils import random_birth_date, random_email, random_lower_string
+
+
+def test_read_feed(client: TestClient, db: Session) -> None:
+    email, password = random_email(), random_lower_string()
+    user = users.create_user(session=db, user_create=CreateUser(
+        email=email,
+        password=password,
+        birth_date=random_birth_date(),
+        full_name="Feed Reader",
+        user_gender="other",
+        user_type="external"
+    ))
+    reader = profiles.create_profile(
+        session=db, profile_create=CreateProfile(username=random_lower_string()), user_id=user.user_id
+    )
+    headers = user_authentication_headers(client=client, email=email, password=password)
+    _, actor = user_and_profile_in(db)
+    follows.create_follow(session=db, following_id=actor.profile_id, follower_id=reader.profile_id)
+    for _ in range(3):
+        ratings.create_or_update_rating(
+            session=db,
+            profile_id=actor.profile_id,
+            movie_id=uuid.uuid4().hex[:20],
+            rating_in=CreateRating(rate=4)
+        )
+
+    r = client.get(f"{settings.API_V1_STR}/feed/", headers=headers, params={"limit": 2})
+    assert r.status_code == 200
+    page = r.json()
+    assert len(page["items"]) == 2
+    assert page["items"][0]["activity"] == "rating"
+    assert page["items"][0]["username"] == actor.username
+
+    r = client.get(
+        f"{settings.API_V1_STR}/feed/", headers=headers, params={"after": page["next_cursor"]}
+    )
+    assert len(r.json()["items"]) == 1
+    assert r.json()["next_cursor"] is None
+
+    r = client.get(f"{settings.API_V1_STR}/feed/", headers=headers, params={"after": "not-a-cursor"})
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Invalid cursor"
@@ -134,6 +134,39 @@ def test_retrieve_followers_others(
     assert len(r.json()['followers']) >= 1
 
 
+def test_retrieve_followers_pages(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    _, profile = user_and_profile_in(db)
+    for _ in range(3):
+        _, follower = user_and_profile_in(db)
+        follows.create_follow(session=db, following_id=profile.profile_id, follower_id=follower.profile_id)
+
+    r = client.get(
+        f"{settings.API_V1_STR}/follows/profile/{profile.profile_id}/followers",
+        headers=superuser_token_headers,
+        params={"limit": 2}
+    )
+    page = r.json()
+    assert page['count'] == 3
+    assert len(page['followers']) == 2
+
+    r = client.get(
+        f"{settings.API_V1_STR}/follows/profile/{profile.profile_id}/followers",
+        headers=superuser_token_headers,
+        params={"limit": 2, "after": page['next_cursor']}
+    )
+    assert len(r.json()['followers']) == 1
+    assert r.json()['next_cursor'] is None
+
+    r = client.get(
+        f"{settings.API_V1_STR}/follows/profile/{profile.profile_id}/followers",
+        headers=superuser_token_headers,
+        params={"after": "not-a-cursor"}
+    )
+    assert r.status_code == 400
+
+
 def test_retrieve_following_others(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
@@ -156,6 +189,59 @@ def test_retrieve_following_others(
     assert len(r.json()['following']) >= 1
 
 
+def test_read_follow_suggestions(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    _, friend = user_and_profile_in(db)
+    _, suggested = user_and_profile_in(db)
+    follows.create_follow(session=db, following_id=suggested.profile_id, follower_id=friend.profile_id)
+
+    r = client.post(
+        f"{settings.API_V1_STR}/follows/{friend.profile_id}",
+        headers=superuser_token_headers
+    )
+    assert r.status_code == 200
+
+    r = client.get(
+        f"{settings.API_V1_STR}/follows/suggestions",
+        headers=superuser_token_headers
+    )
+    assert r.status_code == 200
+    suggestions = r.json()["suggestions"]
+    assert str(suggested.profile_id) in [suggestion["profile_id"] for suggestion in suggestions]
+    assert str(friend.profile_id) not in [suggestion["profile_id"] for suggestion in suggestions]
+
+
+def test_read_follow_statuses(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    _, followed = user_and_profile_in(db)
+    _, stranger = user_and_profile_in(db)
+    r = client.post(
+        f"{settings.API_V1_STR}/follows/{followed.profile_id}",
+        headers=superuser_token_headers
+    )
+    assert r.status_code == 200
+
+    r = client.post(
+        f"{settings.API_V1_STR}/follows/status",
+        headers=superuser_token_headers,
+        json={"profile_ids": [str(followed.profile_id), str(stranger.profile_id)]}
+    )
+    assert r.status_code == 200
+    assert r.json()["statuses"] == [
+        {"profile_id": str(followed.profile_id), "following": True, "followed_by": False},
+        {"profile_id": str(stranger.profile_id), "following": False, "followed_by": False}
+    ]
+
+    r = client.post(
+        f"{settings.API_V1_STR}/follows/status",
+        headers=superuser_token_headers,
+        json={"profile_ids": []}
+    )
+    assert r.status_code == 422
+
+
 def test_delete_follow(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
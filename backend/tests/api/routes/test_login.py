@@ -1,7 +1,14 @@
+import jwt
 from fastapi.testclient import TestClient
 from pytest import Session
 
+from backend.core import security
 from backend.core.config import settings
+from backend.logic.controllers import profiles, users
+from backend.logic.schemas.profiles import CreateProfile
+from backend.logic.schemas.users import CreateUser
+from backend.tests.utils.user import user_authentication_headers
+from backend.tests.utils.utils import random_birth_date, random_email, random_lower_string
 
 
 def test_get_access_token(client: TestClient, db: Session) -> None:
@@ -34,4 +41,25 @@ def test_use_access_token(
     )
     result = r.json()
     assert r.status_code == 200
-    assert "email" in result
\ No newline at end of file
+    assert "email" in result
+
+def test_access_token_carries_profile_id(client: TestClient, db: Session) -> None:
+    email, password = random_email(), random_lower_string()
+    user = users.create_user(session=db, user_create=CreateUser(
+        email=email,
+        password=password,
+        birth_date=random_birth_date(),
+        full_name="Token Owner",
+        user_gender="other",
+        user_type="external"
+    ))
+    profile = profiles.create_profile(
+        session=db, profile_create=CreateProfile(username=random_lower_string()), user_id=user.user_id
+    )
+
+    headers = user_authentication_headers(client=client, email=email, password=password)
+    payload = jwt.decode(
+        headers["Authorization"].split()[1], settings.SECRET_KEY, algorithms=[security.ALGORITHM]
+    )
+    assert payload["sub"] == str(user.user_id)
+    assert payload["profile_id"] == str(profile.profile_id)
@@ -4,7 +4,7 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session, select
 
 from backend.core.config import settings
-from backend.logic.controllers import movie_list_controller, profiles, movie_lists
+from backend.logic.controllers import profiles, movie_lists
 from backend.logic.models import MovieList, Profile
 from backend.logic.schemas.movie_lists import CreateMovieList
 from backend.tests.utils.user import user_and_profile_in
@@ -305,8 +305,6 @@ def test_delete_movie_list(
         )
         assert 200 <= r.status_code < 300
         assert r.json()['message'] == f"{id} removed successfully"
-    
-    movie_list_controller.MovieListController().flush_list()
 
 
 def test_delete_profile(
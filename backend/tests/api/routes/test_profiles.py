@@ -4,10 +4,12 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session, select
 
 from backend.core.config import settings
-from backend.logic.controllers import profiles
-from backend.logic.models import Profile
-from backend.tests.utils.user import user_and_profile_in
-from backend.tests.utils.utils import random_lower_string
+from backend.logic.controllers import follows, profiles, users
+from backend.logic.models import Follow, Profile, Rating
+from backend.logic.schemas.profiles import CreateProfile
+from backend.logic.schemas.users import CreateUser
+from backend.tests.utils.user import user_and_profile_in, user_authentication_headers
+from backend.tests.utils.utils import random_birth_date, random_email, random_lower_string
 
 
 def test_create_my_profile(
@@ -79,6 +81,71 @@ def test_get_existing_profile(
     assert existing_profile['username'] == profile.username
 
 
+def test_get_profile_counters(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    _, profile = user_and_profile_in(db)
+    _, follower = user_and_profile_in(db)
+    follows.create_follow(session=db, following_id=profile.profile_id, follower_id=follower.profile_id)
+
+    r = client.get(
+        f"{settings.API_V1_STR}/profiles/{profile.profile_id}",
+        headers=superuser_token_headers
+    )
+    assert r.status_code == 200
+    assert r.json()["followers_count"] == 1
+    assert r.json()["following_count"] == 0
+
+    r = client.get(
+        f"{settings.API_V1_STR}/profiles/{follower.profile_id}",
+        headers=superuser_token_headers
+    )
+    assert r.json()["following_count"] == 1
+
+
+def test_read_taste_match(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    my_profile = client.get(
+        f"{settings.API_V1_STR}/profiles/my-profile",
+        headers=superuser_token_headers
+    ).json()
+    movie_id = uuid.uuid4().hex[:20]
+    _, profile = user_and_profile_in(db)
+    db.add(Rating(profile_id=uuid.UUID(my_profile['profile_id']), movie_id=movie_id, rate=4))
+    db.add(Rating(profile_id=profile.profile_id, movie_id=movie_id, rate=4))
+    db.commit()
+    follows.create_follow(
+        session=db, following_id=profile.profile_id, follower_id=uuid.UUID(my_profile['profile_id'])
+    )
+
+    r = client.get(
+        f"{settings.API_V1_STR}/profiles/{profile.profile_id}/taste-match",
+        headers=superuser_token_headers
+    )
+    assert 200 <= r.status_code < 300
+    assert r.json()['match'] == 100.0
+    assert r.json()['co_rated'] >= 1
+
+    r = client.get(
+        f"{settings.API_V1_STR}/profiles/{profile.profile_id}/taste-match/followers",
+        headers=superuser_token_headers
+    )
+    assert 200 <= r.status_code < 300
+    matches = r.json()['matches']
+    assert [match['profile_id'] for match in matches] == [my_profile['profile_id']]
+
+    r = client.get(
+        f"{settings.API_V1_STR}/profiles/{uuid.uuid4()}/taste-match",
+        headers=superuser_token_headers
+    )
+    assert r.status_code == 404
+
+    db.delete(db.get(Follow, (uuid.UUID(my_profile['profile_id']), profile.profile_id)))
+    db.delete(db.get(Rating, (uuid.UUID(my_profile['profile_id']), movie_id)))
+    db.commit()
+
+
 def test_get_retrieving_profiles_permissions_error(
     client: TestClient
 ) -> None:
@@ -167,4 +234,34 @@ def test_delete_profile(
     assert deleted_profile["message"] == "Profile deleted successfully"
 
     result = db.exec(select(Profile).where(Profile.profile_id == uuid.UUID(r_get.json()['profile_id']))).first()
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+def test_my_profile_after_replacing_it(client: TestClient, db: Session) -> None:
+    email, password = random_email(), random_lower_string()
+    user = users.create_user(session=db, user_create=CreateUser(
+        email=email,
+        password=password,
+        birth_date=random_birth_date(),
+        full_name="Profile Owner",
+        user_gender="other",
+        user_type="external"
+    ))
+    profiles.create_profile(
+        session=db, profile_create=CreateProfile(username=random_lower_string()), user_id=user.user_id
+    )
+    # The token names the first profile
+    headers = user_authentication_headers(client=client, email=email, password=password)
+    r = client.get(f"{settings.API_V1_STR}/profiles/my-profile", headers=headers)
+    assert r.status_code == 200
+
+    r = client.delete(f"{settings.API_V1_STR}/profiles/", headers=headers)
+    assert r.status_code == 200
+    r = client.get(f"{settings.API_V1_STR}/ratings/profile", headers=headers)
+    assert r.status_code == 404
+
+    created = client.post(
+        f"{settings.API_V1_STR}/profiles", headers=headers, json={"username": random_lower_string()}
+    ).json()
+    r = client.get(f"{settings.API_V1_STR}/profiles/my-profile", headers=headers)
+    assert r.status_code == 200
+    assert r.json()["profile_id"] == created["profile_id"]
@@ -4,7 +4,7 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session, select
 
 from backend.core.config import settings
-from backend.logic.controllers import profiles, ratings
+from backend.logic.controllers import profiles, ratings, recommendations
 from backend.logic.models import Profile
 from backend.logic.models.ratings import Rating
 from backend.logic.schemas.ratings import CreateRating
@@ -131,6 +131,115 @@ def test_get_avg_rating(
     assert r.json()['avg_rate'] == avg
 
 
+def test_get_rating_statistics(client: TestClient) -> None:
+    r = client.get(f"{settings.API_V1_STR}/ratings/statistics")
+
+    assert 200 <= r.status_code < 300
+    statistics = r.json()
+    assert statistics
+
+
+def test_read_top_movies(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.get(f"{settings.API_V1_STR}/ratings/top", params={"window": "7d", "limit": 5})
+
+    assert 200 <= r.status_code < 300
+    top = r.json()
+    assert top['window'] == "7d"
+    assert 0 < len(top['movies']) <= 5
+    scores = [movie['score'] for movie in top['movies']]
+    assert scores == sorted(scores, reverse=True)
+
+    r = client.get(f"{settings.API_V1_STR}/ratings/top", params={"window": "1y"})
+    assert r.status_code == 422
+
+
+def test_get_avg_ratings_batch(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.post(
+        f"{settings.API_V1_STR}/ratings/movies/averages",
+        headers=superuser_token_headers,
+        json={"movie_ids": ["12345", "movie-0-ratings"]}
+    )
+
+    assert 200 <= r.status_code < 300
+    averages = r.json()['averages']
+    assert [item['movie_id'] for item in averages] == ["12345", "movie-0-ratings"]
+    assert averages[0]['count'] >= 1
+    assert averages[0]['my_rate'] is not None
+    assert averages[1] == {"movie_id": "movie-0-ratings", "avg_rate": 0.0, "count": 0, "my_rate": None}
+
+
+def test_get_avg_ratings_batch_too_many(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.post(
+        f"{settings.API_V1_STR}/ratings/movies/averages",
+        headers=superuser_token_headers,
+        json={"movie_ids": [str(i) for i in range(101)]}
+    )
+
+    assert r.status_code == 422
+
+
+def test_import_ratings(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    content = "movie_id,rate\nimport-1,4\nimport-2,3.5\nimport-3,10\n"
+
+    r = client.post(
+        f"{settings.API_V1_STR}/ratings/import",
+        headers=superuser_token_headers,
+        files={"file": ("ratings.csv", content, "text/csv")}
+    )
+
+    assert 200 <= r.status_code < 300
+    result = r.json()
+    assert result['imported'] == 2
+    assert result['failed'] == 1
+    assert result['errors'][0]['line'] == 4
+
+
+def test_import_ratings_ndjson(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    content = '{"movie_id": "import-1", "rate": 2}\n'
+
+    r = client.post(
+        f"{settings.API_V1_STR}/ratings/import",
+        headers=superuser_token_headers,
+        params={"format": "ndjson"},
+        files={"file": ("ratings.ndjson", content, "application/x-ndjson")}
+    )
+
+    assert 200 <= r.status_code < 300
+    assert r.json()['imported'] == 1
+
+
+def test_read_movie_recommendations(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session, tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(recommendations, "INDEX_PATH", str(tmp_path / "neighbours.npz"))
+    _, profile = user_and_profile_in(db)
+    db.add(Rating(profile_id=profile.profile_id, movie_id="12345", rate=5))
+    db.add(Rating(profile_id=profile.profile_id, movie_id="recommended-1", rate=4.5))
+    db.commit()
+    recommendations.build_recommendations(session=db, adjusted=False)
+
+    r = client.get(
+        f"{settings.API_V1_STR}/recommendations/movies",
+        headers=superuser_token_headers,
+        params={"limit": 5}
+    )
+
+    assert 200 <= r.status_code < 300
+    movie_ids = [item['movie_id'] for item in r.json()['recommendations']]
+    assert "recommended-1" in movie_ids
+    assert "12345" not in movie_ids
+
+
 def test_delete_rating(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
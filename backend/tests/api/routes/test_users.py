@@ -9,6 +9,7 @@ from backend.logic.controllers import users
 from backend.logic.enum import UserGender, UserTypes
 from backend.logic.models import User
 from backend.logic.schemas.users import CreateUser
+from backend.tests.utils.user import user_authentication_headers
 from backend.tests.utils.utils import random_birth_date, random_email, random_lower_string
 
 
@@ -201,6 +202,42 @@ def test_retrieve_users(
         assert "email" in item
 
 
+def test_retrieve_users_cursor(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    for _ in range(3):
+        users.create_user(session=db, user_create=user_in(email=random_email(), password=random_lower_string()))
+
+    url = f"{settings.API_V1_STR}/users/"
+    r = client.get(url, headers=superuser_token_headers, params={"limit": 1000})
+    expected = [item["user_id"] for item in r.json()["users"]]
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        page = client.get(url, headers=superuser_token_headers, params=params).json()
+        seen.extend(item["user_id"] for item in page["users"])
+        if page["next_cursor"] is None:
+            break
+        params["after"] = page["next_cursor"]
+
+    assert seen == expected
+    assert len(seen) == page["count"]
+
+
+def test_retrieve_users_invalid_cursor(
+    client: TestClient, superuser_token_headers: dict[str, str]
+) -> None:
+    r = client.get(
+        f"{settings.API_V1_STR}/users/",
+        headers=superuser_token_headers,
+        params={"after": "not-a-cursor"}
+    )
+
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Invalid cursor"
+
+
 def test_update_user_me(
     client: TestClient, normal_user_token_headers: dict[str, str], db: Session
 ) -> None:
@@ -476,4 +513,30 @@ def test_delete_user_without_privileges(
         headers=normal_user_token_headers,
     )
     assert r.status_code == 403
-    assert r.json()["detail"] == "The user doesn't have enough privileges"
\ No newline at end of file
+    assert r.json()["detail"] == "The user doesn't have enough privileges"
+
+def test_deactivated_user_is_not_served_from_cache(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    email, password = random_email(), random_lower_string()
+    user = users.create_user(session=db, user_create=user_in(email=email, password=password))
+    headers = user_authentication_headers(client=client, email=email, password=password)
+    for _ in range(2):
+        r = client.get(f"{settings.API_V1_STR}/users/account", headers=headers)
+        assert r.status_code == 200
+
+    r = client.get(f"{settings.API_V1_STR}/users/cache/stats", headers=superuser_token_headers)
+    assert r.status_code == 200
+    stats = r.json()
+    assert stats["hits"] >= 1
+    assert 0 < stats["hit_rate"] <= 1
+
+    r = client.patch(
+        f"{settings.API_V1_STR}/users/{user.user_id}",
+        headers=superuser_token_headers,
+        json={"user_status": "inactive"}
+    )
+    assert r.status_code == 200
+    r = client.get(f"{settings.API_V1_STR}/users/account", headers=headers)
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Inactive user"
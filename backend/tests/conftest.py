@@ -9,30 +9,38 @@ from backend.app import app
 from backend.logic.models import (
     User, 
     Profile, 
+    ProfileCounters,
     Follow, 
     Rating, 
+    MovieRatingStats,
     MovieList, 
+    MovieListItem,
     Reaction,
     Comment,
     Article,
     Section,
     Newsletter,
-    AuthorArticle
+    AuthorArticle,
+    FeedItem
 )
 from backend.tests.utils.user import authentication_token_from_email
 from backend.tests.utils.utils import get_superuser_token_headers
 
 
 models = [ 
+    FeedItem,
     Reaction,
     Comment,
     Rating,
+    MovieRatingStats,
+    MovieListItem,
     MovieList,
     Follow,
     AuthorArticle,
     Article,
     Newsletter,
     Section,
+    ProfileCounters,
     Profile,
     User
 ]
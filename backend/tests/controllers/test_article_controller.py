@@ -3,6 +3,10 @@ import os
 import json
 from datetime import date
 import uuid
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from backend.core.cache import LRUCache
 from backend.logic.entities.article import Article
 from backend.logic.controllers.article_controller import ArticleController
 
@@ -14,11 +18,14 @@ class TestArticleController(unittest.TestCase):
 
     def setUp(self):
         """
-        Prepare a temporary test environment by using a test-specific JSON file.
+        Prepare a temporary test environment by using a test-specific directory.
         """
-        self.test_file = os.path.join(os.getcwd(), 'backend', 'data', 'test_storage_article.json')
+        self.test_dir = tempfile.mkdtemp()
+        self.test_file = os.path.join(self.test_dir, 'storage_article.json')
         self.controller = ArticleController()
-        self.controller.file = self.test_file  # Override default file with test file
+        # Override default storage with test storage
+        self.controller.directory = os.path.join(self.test_dir, 'articles')
+        self.controller.file = self.test_file
 
         with open(self.test_file, 'w', encoding='utf-8') as f:
             json.dump([], f)
@@ -31,10 +38,9 @@ class TestArticleController(unittest.TestCase):
 
     def tearDown(self):
         """
-        Remove the test file after each test run.
+        Remove the test directory after each test run.
         """
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
 
     def test_add_article(self):
         """
@@ -43,11 +49,14 @@ class TestArticleController(unittest.TestCase):
         result_id = self.controller.add(self.test_article)
         self.assertEqual(result_id, self.test_article.article_id)
 
-        with open(self.test_file, 'r', encoding='utf-8') as f:
+        path = self.controller._path(str(self.test_article.article_id))
+        self.assertEqual(
+            os.path.relpath(path, self.controller.directory).count(os.sep), 2
+        )
+        with open(path, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
-        self.assertEqual(len(data), 1)
-        self.assertEqual(data[0]['body']['content'], "Test article content")
+        self.assertEqual(data['body']['content'], "Test article content")
 
     def test_add_invalid_object(self):
         """
@@ -68,9 +77,10 @@ class TestArticleController(unittest.TestCase):
 
     def test_get_all_with_corrupt_file(self):
         """
-        Test get_all when the JSON file is corrupt.
+        Test get_all when a JSON file is corrupt.
         """
-        with open(self.test_file, 'w', encoding='utf-8') as f:
+        self.controller.add(self.test_article)
+        with open(self.controller._path(str(self.test_article.article_id)), 'w', encoding='utf-8') as f:
             f.write("{ esto no es JSON válido ")
 
         articles = self.controller.get_all()
@@ -97,7 +107,9 @@ class TestArticleController(unittest.TestCase):
         """
         Test get_by_id when the file is corrupt.
         """
-        with open(self.test_file, 'w', encoding='utf-8') as f:
+        path = self.controller._path(1)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
             f.write("{ archivo roto ")
 
         result = self.controller.get_by_id(1)
@@ -118,8 +130,9 @@ class TestArticleController(unittest.TestCase):
 
         articles = self.controller.get_all()
         self.assertEqual(len(articles), 2)
-        self.assertIsNotNone(articles[1]['article_id'])
-        self.assertEqual(articles[1]['body']['content'], "Second article")
+        self.assertEqual(
+            self.controller.get_by_id(str(article2.article_id))['body']['content'], "Second article"
+        )
 
     def test_update_article_success(self):
         """
@@ -162,6 +175,129 @@ class TestArticleController(unittest.TestCase):
         self.assertFalse(result)
     
     
+    def test_concurrent_adds(self):
+        """
+        Test that concurrent writers do not lose updates.
+        """
+        new_articles = [
+            Article(article_id=uuid.uuid4(), content=f'Article {i}', image_rel_url='test/image.png')
+            for i in range(20)
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(self.controller.add, new_articles))
+
+        articles = self.controller.get_all()
+        self.assertEqual(len(articles), 20)
+        for _, _, files in os.walk(self.controller.directory):
+            self.assertFalse(any(name.endswith('.tmp') for name in files))
+
+    def test_update_keeps_other_articles(self):
+        """
+        Test that updating an article does not rewrite the other ones.
+        """
+        article2 = Article(
+            article_id=uuid.uuid4(),
+            content='Second article',
+            image_rel_url='test/image2.png'
+        )
+        self.controller.add(self.test_article)
+        self.controller.add(article2)
+        other_path = self.controller._path(str(article2.article_id))
+        mtime = os.stat(other_path).st_mtime_ns
+
+        self.controller.update_article(str(self.test_article.article_id), {"content": "Updated"})
+
+        self.assertEqual(os.stat(other_path).st_mtime_ns, mtime)
+
+    def test_migrate(self):
+        """
+        Test moving the legacy monolithic file into the sharded store.
+        """
+        with open(self.test_file, 'w', encoding='utf-8') as f:
+            json.dump([self.test_article.to_dict()], f)
+
+        self.assertEqual(self.controller.migrate(), 1)
+        self.assertEqual(self.controller.migrate(), 0)
+
+        found = self.controller.get_by_id(str(self.test_article.article_id))
+        self.assertEqual(found['body']['content'], 'Test article content')
+
+    def test_migrate_corrupt_file(self):
+        """
+        Test that an unreadable legacy file is reported and kept as is.
+        """
+        with open(self.test_file, 'w', encoding='utf-8') as f:
+            f.write('[{"article_id": ')
+
+        with self.assertRaises(RuntimeError):
+            self.controller.migrate()
+        with open(self.test_file, encoding='utf-8') as f:
+            self.assertEqual(f.read(), '[{"article_id": ')
+
+    def test_get_by_id_cached(self):
+        """
+        Test that repeated reads are served from the cache.
+        """
+        self.controller.cache = LRUCache(max_bytes=1024 * 1024)
+        self.controller.add(self.test_article)
+        article_id = str(self.test_article.article_id)
+
+        first = self.controller.get_by_id(article_id)
+        second = self.controller.get_by_id(article_id)
+
+        self.assertIs(first, second)
+        stats = self.controller.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_cache_invalidated_on_write(self):
+        """
+        Test that update and delete invalidate the cached body.
+        """
+        self.controller.cache = LRUCache(max_bytes=1024 * 1024)
+        self.controller.add(self.test_article)
+        article_id = str(self.test_article.article_id)
+        self.controller.get_by_id(article_id)
+
+        self.controller.update_article(article_id, {"content": "Updated content"})
+        self.assertEqual(self.controller.get_by_id(article_id)['body']['content'], "Updated content")
+
+        self.controller.delete_article(article_id)
+        self.assertIsNone(self.controller.get_by_id(article_id))
+        self.assertEqual(self.controller.cache.stats()['entries'], 0)
+
+    def test_cache_detects_external_change(self):
+        """
+        Test that a change made by another process is not hidden by the cache.
+        """
+        self.controller.cache = LRUCache(max_bytes=1024 * 1024)
+        self.controller.add(self.test_article)
+        article_id = str(self.test_article.article_id)
+        self.controller.get_by_id(article_id)
+
+        other = ArticleController()
+        other.cache = LRUCache(max_bytes=1024 * 1024)
+        other.directory = self.controller.directory
+        other.update_article(article_id, {"content": "Changed elsewhere"})
+
+        self.assertEqual(self.controller.get_by_id(article_id)['body']['content'], "Changed elsewhere")
+
+    def test_cache_evicts_by_size(self):
+        """
+        Test that the cache stays under its size limit.
+        """
+        self.controller.add(self.test_article)
+        size = os.path.getsize(self.controller._path(str(self.test_article.article_id)))
+        self.controller.cache = LRUCache(max_bytes=size * 2)
+
+        for i in range(3):
+            article = Article(article_id=uuid.uuid4(), content='x' * len('Test article content'), image_rel_url='test/image.png')
+            self.controller.add(article)
+            self.controller.get_by_id(str(article.article_id))
+
+        stats = self.controller.cache.stats()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertLessEqual(stats['size_bytes'], stats['max_bytes'])
+
     def test_flush_list(self):
         controller = ArticleController()
         result = controller.flush_list()
@@ -1,12 +1,15 @@
+import uuid
 from fastapi.encoders import jsonable_encoder
 import pytest
 from sqlmodel import Session
 
 from backend.logic.models import Article
-from backend.logic.controllers import articles, article_tags
+from backend.logic.controllers import articles, article_tags, authors_articles
 from backend.logic.schemas.articles import CreateArticle, UpdateArticle
 from backend.logic.schemas.articles_tags import CreateTag
-from backend.tests.utils.utils import random_lower_string, random_birth_date
+from backend.logic.schemas.author_articles import CreateAuthor
+from backend.tests.utils.user import user_and_profile_in
+from backend.tests.utils.utils import count_queries, random_lower_string, random_birth_date
 
 
 def section_in():
@@ -82,4 +85,77 @@ def test_update_article(db: Session) -> None:
     article_2 = db.get(Article, article.article_id)
     
     assert article_2
-    assert article_2.newsletter_id is not None
\ No newline at end of file
+    assert article_2.newsletter_id is not None
+
+
+def test_get_article_detail(db: Session) -> None:
+    user, profile = user_and_profile_in(db)
+    section = article_tags.create_section(session=db, section_create=section_in())
+    newsletter = article_tags.create_newsletter(session=db, newsletter_create=newsletter_in())
+    article_in = CreateArticle(
+        article_title=random_lower_string(),
+        section_id=section.section_id,
+        newsletter_id=newsletter.newsletter_id
+    )
+    article = articles.create_article(session=db, article_create=article_in)
+    authors_articles.create_author_article(
+        session=db,
+        author_create=CreateAuthor(profile_id=profile.profile_id, article_id=article.article_id, main_author=True)
+    )
+
+    article_id = article.article_id
+    with count_queries(db) as statements:
+        detail = articles.get_article_detail(session=db, article_id=article_id)
+
+    assert len(statements) == 1
+    article_2, section_name, newsletter_name, author = detail
+    assert article_2.article_id == article_id
+    assert section_name == section.name
+    assert newsletter_name == newsletter.name
+    assert author == user.full_name
+
+
+def test_get_article_detail_without_author(db: Session) -> None:
+    section = article_tags.create_section(session=db, section_create=section_in())
+    article_in = CreateArticle(
+        article_title=random_lower_string(),
+        section_id=section.section_id
+    )
+    article = articles.create_article(session=db, article_create=article_in)
+
+    _, section_name, newsletter_name, author = articles.get_article_detail(
+        session=db, article_id=article.article_id
+    )
+
+    assert section_name == section.name
+    assert newsletter_name is None
+    assert author is None
+    assert articles.get_article_detail(session=db, article_id=uuid.uuid4()) is None
+
+
+def test_get_newsletter_articles(db: Session) -> None:
+    newsletter = article_tags.create_newsletter(session=db, newsletter_create=newsletter_in())
+    sections = [
+        article_tags.create_section(session=db, section_create=section_in())
+        for _ in range(3)
+    ]
+    for i, section in enumerate(sections):
+        for _ in range(i + 1):
+            articles.create_article(session=db, article_create=CreateArticle(
+                article_title=random_lower_string(),
+                section_id=section.section_id,
+                newsletter_id=newsletter.newsletter_id
+            ))
+    section_names = [section.name for section in sections]
+    db.refresh(newsletter)
+
+    with count_queries(db) as statements:
+        result = articles.get_newsletter_articles(session=db, newsletter=newsletter)
+
+    # A single query whatever the number of sections
+    assert len(statements) == 1
+    assert result.newsletter == newsletter.name
+    assert result.total_sections == 3
+    assert result.total_articles == 6
+    assert [group.section for group in result.data] == section_names
+    assert [group.count for group in result.data] == [1, 2, 3]
@@ -0,0 +1,87 @@
+import threading
+import time
+
+from sqlmodel import Session, func, select
+
+from backend.core.cache import TTLCache
+from backend.logic.controllers import article_tags, counts
+from backend.logic.models import MovieList, Section
+from backend.logic.schemas.articles_tags import CreateTag
+from backend.tests.utils.utils import count_queries, random_lower_string
+
+
+def create_section(db: Session) -> Section:
+    return article_tags.create_section(session=db, section_create=CreateTag(
+        name=random_lower_string(),
+        description=random_lower_string()
+    ))
+
+
+def test_count_is_cached(db: Session) -> None:
+    create_section(db)
+    count = counts.count_rows(session=db, model=Section)
+
+    with count_queries(db) as statements:
+        count_2 = counts.count_rows(session=db, model=Section)
+
+    assert not statements
+    assert count_2 == count == db.exec(select(func.count()).select_from(Section)).one()
+
+
+def test_count_invalidated_on_commit(db: Session) -> None:
+    count = counts.count_rows(session=db, model=Section)
+
+    section = create_section(db)
+    assert counts.count_rows(session=db, model=Section) == count + 1
+
+    db.delete(section)
+    db.commit()
+    assert counts.count_rows(session=db, model=Section) == count
+
+
+def test_count_with_filter(db: Session) -> None:
+    public = counts.count_rows(session=db, model=MovieList, where=MovieList.privacy == False)
+    private = counts.count_rows(session=db, model=MovieList, where=MovieList.privacy == True)
+
+    assert public + private == counts.count_rows(session=db, model=MovieList)
+    assert public == db.exec(
+        select(func.count()).select_from(MovieList).where(MovieList.privacy == False)
+    ).one()
+
+
+def test_count_estimate_falls_back_to_exact(db: Session) -> None:
+    # Planner statistics are only used on PostgreSQL
+    assert counts.count_rows(session=db, model=Section, estimate=True) == \
+        counts.count_rows(session=db, model=Section)
+
+
+def test_ttl_cache_expires() -> None:
+    cache = TTLCache(ttl=0.05)
+    cache.put("key", 1)
+
+    assert cache.get("key") == 1
+    time.sleep(0.1)
+    assert cache.get("key") is None
+
+
+def test_ttl_cache_single_flight() -> None:
+    cache = TTLCache(ttl=60)
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.1)
+        return 42
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("key", load)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [42] * 5
+    assert len(calls) == 1
@@ -0,0 +1,102 @@
+import uuid
+
+from sqlmodel import Session, func, select
+
+from backend.core.config import settings
+from backend.logic.controllers import feed, follows, movie_lists, ratings
+from backend.logic.enum import FeedActivities
+from backend.logic.models import FeedItem
+from backend.logic.schemas.movie_lists import CreateMovieList
+from backend.logic.schemas.ratings import CreateRating
+from backend.tests.utils.user import user_and_profile_in
+
+
+def test_feed_fan_out_on_write(db: Session) -> None:
+    _, actor = user_and_profile_in(db)
+    followers = [user_and_profile_in(db)[1] for _ in range(2)]
+    for follower in followers:
+        follows.create_follow(session=db, following_id=actor.profile_id, follower_id=follower.profile_id)
+    movie_id = uuid.uuid4().hex[:20]
+
+    ratings.create_or_update_rating(
+        session=db, profile_id=actor.profile_id, movie_id=movie_id, rating_in=CreateRating(rate=4.5)
+    )
+    movie_list = movie_lists.create_movie_list(
+        session=db,
+        movielist_create=CreateMovieList(name="Favourites"),
+        profile_id=actor.profile_id
+    )
+    movie_lists.add_movie(session=db, list_id=movie_list.list_id, movie_id=movie_id)
+    movie_lists.create_movie_list(
+        session=db,
+        movielist_create=CreateMovieList(name="Private", privacy=True),
+        profile_id=actor.profile_id
+    )
+
+    written = db.exec(
+        select(func.count()).select_from(FeedItem).where(FeedItem.actor_id == actor.profile_id)
+    ).one()
+    assert written == 3 * len(followers)
+
+    page = feed.get_feed(session=db, profile_id=followers[0].profile_id)
+    assert [item.activity for item in page.items] == [
+        FeedActivities.LIST_MOVIE, FeedActivities.LIST, FeedActivities.RATING
+    ]
+    assert page.items[0].username == actor.username
+    assert page.items[2].movie_id == movie_id
+    assert page.items[2].detail == "4.5"
+    assert feed.get_feed(session=db, profile_id=actor.profile_id).items == []
+
+
+def test_feed_fan_out_on_read_and_pages(db: Session, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "FEED_FANOUT_MAX_FOLLOWERS", 1)
+    _, big = user_and_profile_in(db)
+    _, small = user_and_profile_in(db)
+    _, reader = user_and_profile_in(db)
+    _, other = user_and_profile_in(db)
+    follows.create_follow(session=db, following_id=big.profile_id, follower_id=reader.profile_id)
+    follows.create_follow(session=db, following_id=big.profile_id, follower_id=other.profile_id)
+    follows.create_follow(session=db, following_id=small.profile_id, follower_id=reader.profile_id)
+
+    for actor in (big, small, big):
+        written = feed.publish_activity(
+            session=db,
+            actor_id=actor.profile_id,
+            activity=FeedActivities.RATING,
+            object_id=uuid.uuid4().hex[:20]
+        )
+        assert written == 1
+    db.commit()
+
+    first = feed.get_feed(session=db, profile_id=reader.profile_id, limit=2)
+    second = feed.get_feed(session=db, profile_id=reader.profile_id, after=first.next_cursor, limit=2)
+    assert [item.actor_id for item in first.items + second.items] == [
+        big.profile_id, small.profile_id, big.profile_id
+    ]
+    assert second.next_cursor is None
+    assert [item.actor_id for item in feed.get_feed(session=db, profile_id=other.profile_id).items] == [
+        big.profile_id, big.profile_id
+    ]
+    # The outbox of a big account is not part of its own feed
+    assert feed.get_feed(session=db, profile_id=big.profile_id).items == []
+
+
+def test_feed_timelines_are_capped(db: Session, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "FEED_MAX_ITEMS", 3)
+    monkeypatch.setattr(settings, "FEED_TRIM_MARGIN", 1)
+    _, actor = user_and_profile_in(db)
+    _, reader = user_and_profile_in(db)
+    follows.create_follow(session=db, following_id=actor.profile_id, follower_id=reader.profile_id)
+
+    objects = [uuid.uuid4().hex[:20] for _ in range(5)]
+    for object_id in objects:
+        feed.publish_activity(
+            session=db, actor_id=actor.profile_id, activity=FeedActivities.RATING, object_id=object_id
+        )
+        if object_id == objects[3]:
+            # Within the margin
+            assert len(feed.get_feed(session=db, profile_id=reader.profile_id).items) == 4
+    db.commit()
+
+    items = feed.get_feed(session=db, profile_id=reader.profile_id).items
+    assert [item.object_id for item in items] == objects[:1:-1]
@@ -0,0 +1,98 @@
+import uuid
+
+from sqlmodel import Session
+
+from backend.logic.controllers import follow_graph, follows
+from backend.logic.controllers.follow_graph import FollowGraph
+from backend.logic.models import Follow, Rating
+from backend.tests.utils.user import user_and_profile_in
+
+
+def test_follow_graph_patches_match_rebuild(db: Session) -> None:
+    profiles = [user_and_profile_in(db)[1].profile_id for _ in range(5)]
+    for follower, followed in [(0, 1), (0, 2), (1, 3), (2, 3), (2, 4)]:
+        db.add(Follow(follower_id=profiles[follower], following_id=profiles[followed]))
+    db.commit()
+
+    graph = FollowGraph()
+    graph.build(session=db)
+    assert graph.two_hop(profiles[0], 10) == [(profiles[3], 2), (profiles[4], 1)]
+
+    graph.add(profiles[0], profiles[3])
+    graph.remove(profiles[2], profiles[4])
+    graph.add(profiles[4], uuid.uuid4())
+    assert graph.two_hop(profiles[0], 10) == []
+    assert graph.is_following(profiles[0], profiles[3])
+    assert not graph.is_following(profiles[2], profiles[4])
+    assert set(graph.following(profiles[0])) == {profiles[1], profiles[2], profiles[3]}
+
+    graph.remove(profiles[0], profiles[2])
+    following = {profile_id: graph.following(profile_id) for profile_id in profiles}
+    graph.compact()
+    assert {profile_id: graph.following(profile_id) for profile_id in profiles} == following
+    assert graph.two_hop(profiles[0], 10) == []
+
+
+def test_follow_graph_catches_up_with_other_writers(db: Session, monkeypatch) -> None:
+    graph = FollowGraph(check_seconds=0)
+    monkeypatch.setattr(follow_graph, "graph", graph)
+    me, friend, other = [user_and_profile_in(db)[1].profile_id for _ in range(3)]
+    graph.ensure_loaded(session=db)
+    builds = []
+    build = graph.build
+    monkeypatch.setattr(graph, "build", lambda *, session: builds.append(1) or build(session=session))
+
+    # Patched in by this process, no rebuild
+    follows.create_follow(session=db, following_id=friend, follower_id=me)
+    follows.delete_follow(session=db, follow=db.get(Follow, (me, friend)))
+    follows.create_follow(session=db, following_id=other, follower_id=me)
+    graph.ensure_loaded(session=db)
+    graph.ensure_loaded(session=db)
+    assert builds == []
+    assert graph.following(me) == [other]
+
+    # Created by another worker, without track_follow_change: patched in
+    db.add(Follow(follower_id=friend, following_id=me))
+    db.add(Follow(follower_id=other, following_id=friend))
+    db.commit()
+    graph.ensure_loaded(session=db)
+    assert builds == []
+    assert graph.is_following(friend, me)
+    assert graph.following(other) == [friend]
+
+    # Deleted by another worker: rebuilt
+    db.delete(db.get(Follow, (friend, me)))
+    db.commit()
+    graph.ensure_loaded(session=db)
+    assert builds == [1]
+    assert not graph.is_following(friend, me)
+
+
+def test_get_follow_suggestions(db: Session, monkeypatch) -> None:
+    graph = FollowGraph()
+    monkeypatch.setattr(follow_graph, "graph", graph)
+    monkeypatch.setattr(follows, "graph", graph)
+    me, friend, close, far, other = [user_and_profile_in(db)[1].profile_id for _ in range(5)]
+    movie_id = uuid.uuid4().hex[:20]
+
+    follows.create_follow(session=db, following_id=friend, follower_id=me)
+    follows.create_follow(session=db, following_id=other, follower_id=me)
+    follows.create_follow(session=db, following_id=far, follower_id=friend)
+    follows.create_follow(session=db, following_id=close, follower_id=friend)
+    for profile_id in (me, close):
+        db.add(Rating(profile_id=profile_id, movie_id=movie_id, rate=4.5))
+    db.commit()
+
+    suggestions = follows.get_follow_suggestions(session=db, profile_id=me)
+    assert [suggestion.profile_id for suggestion in suggestions] == [close, far]
+    assert suggestions[0].shared_follows == 1
+    assert suggestions[0].shared_ratings == 1
+
+    # Patched by the write paths once built
+    follows.create_follow(session=db, following_id=far, follower_id=other)
+    assert follows.get_follow_suggestions(session=db, profile_id=me)[0].profile_id == far
+    follows.delete_follow(session=db, follow=db.get(Follow, (friend, far)))
+    follows.delete_follow(session=db, follow=db.get(Follow, (other, far)))
+    assert [suggestion.profile_id for suggestion in follows.get_follow_suggestions(
+        session=db, profile_id=me
+    )] == [close]
@@ -1,9 +1,11 @@
 import uuid
+from datetime import datetime, timedelta, timezone
 from sqlmodel import Session
 
 from backend.logic.models import Follow
 from backend.logic.controllers import follows
 from backend.tests.utils.user import user_and_profile_in
+from backend.tests.utils.utils import count_queries
 
 
 def test_create_follow(db: Session) -> None:
@@ -29,6 +31,40 @@ def test_get_profile_followers(db: Session) -> None:
     assert followers.followers[0].profile_id == profile1.profile_id
 
 
+def test_get_profile_followers_pages(db: Session) -> None:
+    _, profile = user_and_profile_in(db)
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    followers = [user_and_profile_in(db)[1] for _ in range(5)]
+    for i, follower in enumerate(followers):
+        # Two follows share a timestamp to exercise the tie-breaker
+        db.add(Follow(
+            follower_id=follower.profile_id,
+            following_id=profile.profile_id,
+            created_at=created_at + timedelta(seconds=i // 2)
+        ))
+    db.commit()
+
+    seen, after = [], None
+    while True:
+        page = follows.get_profile_followers(
+            session=db, profile_id=profile.profile_id, after=after, limit=2
+        )
+        assert page.count == 5
+        assert len(page.followers) <= 2
+        seen += [follower.profile_id for follower in page.followers]
+        after = page.next_cursor
+        if after is None:
+            break
+
+    assert sorted(seen) == sorted(follower.profile_id for follower in followers)
+    assert len(seen) == 5
+
+    following = follows.get_profile_following(session=db, profile_id=followers[0].profile_id, limit=1)
+    assert following.count == 1
+    assert following.following[0].profile_id == profile.profile_id
+    assert following.next_cursor is None
+
+
 def test_get_profile_followers_empty(db: Session) -> None:
     _, profile2 = user_and_profile_in(db)
 
@@ -83,4 +119,20 @@ def test_get_profile_not_found_following(db: Session) -> None:
     nonexistent_profile_id = uuid.uuid4()
     following = follows.get_profile_following(session=db, profile_id=nonexistent_profile_id)
 
-    assert following is None
\ No newline at end of file
+    assert following is None
+
+def test_get_follow_statuses(db: Session) -> None:
+    profile_id, followed, follower, mutual, stranger = [
+        user_and_profile_in(db)[1].profile_id for _ in range(5)
+    ]
+    follows.create_follow(session=db, following_id=followed, follower_id=profile_id)
+    follows.create_follow(session=db, following_id=mutual, follower_id=profile_id)
+    follows.create_follow(session=db, following_id=profile_id, follower_id=follower)
+    follows.create_follow(session=db, following_id=profile_id, follower_id=mutual)
+    profile_ids = [stranger, followed, follower, mutual, followed]
+    expected = [(stranger, False, False), (followed, True, False), (follower, False, True), (mutual, True, True)]
+
+    with count_queries(db) as statements:
+        statuses = follows.get_follow_statuses(session=db, profile_id=profile_id, profile_ids=profile_ids)
+    assert len(statements) == 1
+    assert [(status.profile_id, status.following, status.followed_by) for status in statuses] == expected
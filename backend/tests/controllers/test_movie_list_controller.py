@@ -1,252 +1,240 @@
 import unittest
 import os
 import json
-from unittest.mock import patch, mock_open
+import shutil
+import tempfile
 from uuid import uuid4
+from backend.core.oplog import OperationLog
+from backend.core.storage import atomic_write_json
+from backend.logic.controllers import movie_list_controller
 from backend.logic.controllers.movie_list_controller import MovieListController
 from backend.logic.entities.movie_list import MovieList
 
+
 class TestMovieListController(unittest.TestCase):
 
     def setUp(self):
         self.example_id = str(uuid4())
         self.profile_id = str(uuid4())
 
+        self.test_dir = tempfile.mkdtemp()
+        self.test_file = os.path.join(self.test_dir, 'storage_movie_lists.json')
+        with open(self.test_file, 'w', encoding='utf-8') as f:
+            json.dump([{
+                "id": "some-id",
+                "profile_id": "some-user",
+                "movies": [{"movie_id": "101", "added_at": "2025-04-25T00:00:00"}]
+            }], f)
+
+    def tearDown(self):
+        movie_list_controller._stores.clear()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
 
-    @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps([]))
-    @patch("json.dump")
-    def test_add_movie_list(self, mock_json_dump, mock_open_file, mock_exists):
+    def _controller(self) -> MovieListController:
         controller = MovieListController()
+        controller.file = self.test_file
+        return controller
+
+    def _restart(self) -> MovieListController:
+        """
+        Simulate a new process by dropping the in-memory index.
+        """
+        movie_list_controller._stores.clear()
+        return self._controller()
+
+    def test_add_movie_list(self):
+        controller = self._controller()
 
         new_movie_list = MovieList(
-            id=str(uuid4()),
+            id=self.example_id,
             profile_id=self.profile_id,
         )
 
         result = controller.add(new_movie_list)
 
-        self.assertGreaterEqual(mock_open_file.call_count, 1)
-        mock_json_dump.assert_called_once()
-
-        args, _ = mock_json_dump.call_args
-        dumped_data = args[0]
         self.assertEqual(result, new_movie_list)
+        self.assertEqual(controller.get_by_id(self.example_id)["profile_id"], self.profile_id)
 
-    
-    @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps([{
-        "id": "some-id",
-        "profile_id": "some-user",
-        "movies": [101, 102, 103]
-    }]))
-    def test_remove_movie_list(self, mock_file, mock_exists):
-        controller = MovieListController()
+    def test_add_only_appends_to_log(self):
+        controller = self._controller()
+        with open(self.test_file, 'r', encoding='utf-8') as f:
+            snapshot = f.read()
+
+        controller.add(MovieList(id=self.example_id, profile_id=self.profile_id))
+        controller.add_movie(self.example_id, "102")
+
+        with open(self.test_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), snapshot)
+        with open(controller.store.log_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+    def test_remove_movie_list(self):
+        controller = self._controller()
         result = controller.remove("some-id")
 
         assert result is True
+        assert controller.get_by_id("some-id") is None
+        assert all(item["id"] != "some-id" for item in self._restart().get_all())
 
-        handle = mock_file()
-        written_data = "".join(call.args[0] for call in handle.write.call_args_list)
-        data = json.loads(written_data)
-        assert all(item["id"] != "some-id" for item in data)
-
-
-    @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps([
-        {
-            "id": "another-id",
-            "profile_id": "some-user",
-            "movies": [101, 102, 103]
-        }
-    ]))
-    def test_delete_movie_list_not_found(self, mock_file, mock_exists):
-        controller = MovieListController()
+    def test_delete_movie_list_not_found(self):
+        controller = self._controller()
         result = controller.remove("non-existent-id")
 
-        # Verifica que devuelve False
         assert result is False
+        # Nothing changed, so nothing is written to the log
+        assert not os.path.exists(controller.store.log_path)
 
-        # No debería sobrescribir el archivo porque no se eliminó nada
-        handle = mock_file()
-        handle.truncate.assert_not_called()
-        handle.write.assert_not_called()
-
-
-    @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps([{
-        "id": "some-id",
-        "profile_id": "some-user",
-        "movies": [101, 102, 103]
-    }]))
-    def test_get_all(self, mock_open_file, mock_exists):
-        controller = MovieListController()
+    def test_get_all(self):
+        controller = self._controller()
         result = controller.get_all()
 
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["profile_id"], "some-user")
-        self.assertGreaterEqual(mock_open_file.call_count, 1)
-
 
-    @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps([{
-        "id": "some-id",
-        "profile_id": "some-user",
-        "movies": [101, 102, 103]
-    }]))
-    def test_get_movie_list_by_id(self, mock_open_file, mock_exists):
-        controller = MovieListController()
+    def test_get_movie_list_by_id(self):
+        controller = self._controller()
         result = controller.get_by_id("some-id")
 
         self.assertIsNotNone(result)
         self.assertEqual(result["id"], "some-id")
+        self.assertEqual(result["movies"][0]["movie_id"], "101")
 
-    @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps([]))
-    def test_get_movie_list_by_id_not_found(self, mock_open_file, mock_exists):
-        controller = MovieListController()
+    def test_get_movie_list_by_id_not_found(self):
+        controller = self._controller()
         result = controller.get_by_id("non-existent-id")
         self.assertIsNone(result)
 
-    @patch("os.path.exists", return_value=True)
-    @patch("json.dump")
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps([{
-        "id": "some-id",
-        "profile_id": "some-user",
-        "movies": [{"movie_id": "101", "added_at": "2025-04-25T00:00:00"}]
-    }]))
-    def test_add_movie(self, mock_open_file, mock_json_dump, mock_exists):
-        controller = MovieListController()
-
-        # Simulando que la película que se va a agregar tiene el ID "102"
-        movie_id = "102"
-        movie_list_id = "some-id"
+    def test_add_movie(self):
+        controller = self._controller()
 
-        # Realizando la operación
-        exp = controller.add_movie(movie_list_id, movie_id)
+        exp = controller.add_movie("some-id", "102")
         self.assertTrue(exp)
 
-        # Verificando que la nueva película se haya agregado a la lista
-        written_data = mock_json_dump.call_args[0][0]
-        movie_list = next((m for m in written_data if m["id"] == movie_list_id), None)
-        self.assertIsNotNone(movie_list)
-        self.assertTrue(any(m["movie_id"] == movie_id for m in movie_list["movies"]))
+        movie_list = self._restart().get_by_id("some-id")
+        self.assertTrue(any(m["movie_id"] == "102" for m in movie_list["movies"]))
 
+    def test_add_list_not_found(self):
+        controller = self._controller()
 
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps([{
-        "id": "some-id",
-        "profile_id": "some-user",
-        "movies": [{"movie_id": "101", "added_at": "2025-04-25T00:00:00"}]
-    }]))
-    def test_add_list_not_found(self, mock_file):
-        controller = MovieListController()
-
-        movie_id = "101"
-        movie_list_id = "another-id"
-
-        exp = controller.add_movie(movie_list_id, movie_id)
+        exp = controller.add_movie("another-id", "101")
 
         self.assertFalse(exp)
 
+    def test_add_movie_exists(self):
+        controller = self._controller()
 
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps([{
-        "id": "some-id",
-        "profile_id": "some-user",
-        "movies": [{"movie_id": "101", "added_at": "2025-04-25T00:00:00"}]
-    }]))
-    def test_add_movie_exists(self, mock_file):
-        controller = MovieListController()
-
-        movie_id = "101"
-        movie_list_id = "some-id"
-
-        exp = controller.add_movie(movie_list_id, movie_id)
+        exp = controller.add_movie("some-id", "101")
 
         self.assertFalse(exp)
-        
-
-    @patch("os.path.exists", return_value=True)
-    @patch("json.dump")
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps([{
-        "id": "some-id",
-        "profile_id": "some-user",
-        "movies": [
-            {"movie_id": "101", "added_at": "2025-04-25T00:00:00"},
-            {"movie_id": "102", "added_at": "2025-04-26T00:00:00"}
-        ]
-    }]))
-    def test_remove_movie(self, mock_open_file, mock_json_dump, mock_exists):
-        controller = MovieListController()
-
-        # Simulando que la película que se va a eliminar tiene el ID "102"
-        movie_id = "102"
-        movie_list_id = "some-id"
-
-        # Realizando la operación
-        controller.remove_movie(movie_list_id, movie_id)
 
-        written_data = mock_json_dump.call_args[0][0]
-        movie_list = next((m for m in written_data if m["id"] == movie_list_id), None)
-        self.assertIsNotNone(movie_list)
-        self.assertFalse(any(m["movie_id"] == movie_id for m in movie_list["movies"]))
+    def test_remove_movie(self):
+        controller = self._controller()
+        controller.add_movie("some-id", "102")
 
+        self.assertTrue(controller.remove_movie("some-id", "102"))
 
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps([{
-        "id": "some-id",
-        "profile_id": "some-user",
-        "movies": [{"movie_id": "101", "added_at": "2025-04-25T00:00:00"}]
-    }]))
-    def test_remove_list_not_found(self, mock_file):
-        controller = MovieListController()
+        movie_list = self._restart().get_by_id("some-id")
+        self.assertFalse(any(m["movie_id"] == "102" for m in movie_list["movies"]))
 
-        # La película que se intenta eliminar no existe en la lista
-        movie_id = "999"
-        movie_list_id = "another-id"
+    def test_remove_list_not_found(self):
+        controller = self._controller()
 
-        # Realizando la operación
-        exp = controller.remove_movie(movie_list_id, movie_id)
+        exp = controller.remove_movie("another-id", "999")
 
-        # Verificando que no se haya modificado el archivo porque la película no existe
         self.assertFalse(exp)
 
+    def test_remove_movie_not_found(self):
+        controller = self._controller()
 
-    @patch("builtins.open", new_callable=mock_open, read_data=json.dumps([{
-        "id": "some-id",
-        "profile_id": "some-user",
-        "movies": [{"movie_id": "101", "added_at": "2025-04-25T00:00:00"}]
-    }]))
-    def test_remove_movie_not_found(self, mock_file):
-        controller = MovieListController()
+        exp = controller.remove_movie("some-id", "999")
 
-        # La película que se intenta eliminar no existe en la lista
-        movie_id = "999"
-        movie_list_id = "some-id"
+        self.assertFalse(exp)
 
-        # Realizando la operación
-        exp = controller.remove_movie(movie_list_id, movie_id)
+    def test_compact(self):
+        controller = self._controller()
+        controller.add_movie("some-id", "102")
+        controller.add(MovieList(id=self.example_id, profile_id=self.profile_id))
+
+        controller.compact()
+
+        self.assertFalse(os.path.exists(controller.store.log_path))
+        self.assertFalse(os.path.exists(controller.store.rotated_path))
+        with open(self.test_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(len(data), 2)
+        self.assertEqual(len(self._restart().get_by_id("some-id")["movies"]), 2)
+
+    def test_background_compaction(self):
+        controller = self._controller()
+        controller.store.compact_threshold = 3
+
+        for movie_id in ("102", "103", "104"):
+            controller.add_movie("some-id", movie_id)
+        controller.store._compacting.join()
+
+        self.assertEqual(controller.store.pending, 0)
+        with open(self.test_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(len(json.load(f)[0]["movies"]), 4)
+
+    def test_recover_interrupted_compaction(self):
+        controller = self._controller()
+        controller.add_movie("some-id", "102")
+        controller.remove_movie("some-id", "101")
+        # Crash after the snapshot was replaced but before the rotated log was removed
+        os.replace(controller.store.log_path, controller.store.rotated_path)
+        atomic_write_json(self.test_file, controller.store._dump(controller.store.state))
+
+        movies = self._restart().get_by_id("some-id")["movies"]
+
+        self.assertEqual([m["movie_id"] for m in movies], ["102"])
+
+    def test_recover_torn_log(self):
+        controller = self._controller()
+        controller.add_movie("some-id", "102")
+        with open(controller.store.log_path, 'a', encoding='utf-8') as f:
+            f.write('{"op": "add_movie", "id": "some-')
+
+        controller = self._restart()
+        movies = controller.get_by_id("some-id")["movies"]
+        self.assertEqual(len(movies), 2)
+
+        controller.add_movie("some-id", "103")
+        self.assertEqual(len(self._restart().get_by_id("some-id")["movies"]), 3)
+
+    def test_sync_with_other_process(self):
+        controller = self._controller()
+        other = OperationLog(
+            self.test_file,
+            load=movie_list_controller._load,
+            dump=movie_list_controller._dump,
+            apply=movie_list_controller._apply,
+            copy=movie_list_controller._copy
+        )
 
-        # Verificando que no se haya modificado el archivo porque la película no existe
-        self.assertFalse(exp)
+        other.append({"op": "add_movie", "id": "some-id", "movie_id": "102", "added_at": None})
+        self.assertEqual(len(controller.get_by_id("some-id")["movies"]), 2)
 
+        # A compaction in the other process replaces the snapshot and the log
+        other.compact()
+        other.append({"op": "remove_movie", "id": "some-id", "movie_id": "101"})
+        self.assertTrue(controller.add_movie("some-id", "103"))
 
-    @patch("os.path.exists", return_value=True)
-    @patch("json.dump")
-    @patch("builtins.open", new_callable=mock_open)
-    def test_flush_list(self, mock_open_file, mock_json_dump, mock_exists):
-        controller = MovieListController()
+        movies = [m["movie_id"] for m in controller.get_by_id("some-id")["movies"]]
+        self.assertEqual(movies, ["102", "103"])
+        with other.read() as index:
+            self.assertEqual(list(index["some-id"]["movies"]), ["102", "103"])
+
+    def test_flush_list(self):
+        controller = self._controller()
+        controller.add_movie("some-id", "102")
 
-        # Ejecutar el método
         result = controller.flush_list()
 
-        # Verificar que el resultado sea True
         self.assertTrue(result)
-
-        # Verificar que se abrió el archivo al menos una vez
-        mock_open_file.assert_called_once_with(controller.file, "w", encoding="utf-8")
-
-        # Verificar que se haya escrito una lista vacía
-        mock_json_dump.assert_called_once_with([], mock_open_file(), indent=4)
+        self.assertFalse(os.path.exists(controller.store.log_path))
+        with open(self.test_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [])
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -1,8 +1,10 @@
+import uuid
+
 from fastapi.encoders import jsonable_encoder
 import pytest
 from sqlmodel import Session
 
-from backend.logic.models import MovieList
+from backend.logic.models import MovieList, MovieListItem
 from backend.logic.controllers import movie_lists
 from backend.logic.schemas.movie_lists import CreateMovieList, UpdateMovieList
 from backend.tests.utils.utils import random_lower_string
@@ -53,4 +55,76 @@ def test_update_movie_list(db: Session) -> None:
     
     assert movie_list_2
     assert movie_list_2.name == new_name
-    
\ No newline at end of file
+    
+
+
+def test_add_and_remove_movie(db: Session) -> None:
+    _, profile = user_and_profile_in(db)
+    movie_list = movie_lists.create_movie_list(
+        session=db, movielist_create=CreateMovieList(name=random_lower_string()), profile_id=profile.profile_id
+    )
+
+    assert movie_lists.add_movie(session=db, list_id=movie_list.list_id, movie_id='101')
+    assert movie_lists.add_movie(session=db, list_id=movie_list.list_id, movie_id='102')
+    assert not movie_lists.add_movie(session=db, list_id=movie_list.list_id, movie_id='101')
+
+    assert movie_lists.remove_movie(session=db, list_id=movie_list.list_id, movie_id='101')
+    assert not movie_lists.remove_movie(session=db, list_id=movie_list.list_id, movie_id='101')
+
+    movies = movie_lists.get_movies_by_list_ids(session=db, list_ids=[movie_list.list_id])
+    assert [m.movie_id for m in movies[movie_list.list_id]] == ['102']
+
+
+def test_get_movies_by_list_ids(db: Session) -> None:
+    _, profile = user_and_profile_in(db)
+    list_1 = movie_lists.create_movie_list(
+        session=db, movielist_create=CreateMovieList(name=random_lower_string()), profile_id=profile.profile_id
+    )
+    list_2 = movie_lists.create_movie_list(
+        session=db, movielist_create=CreateMovieList(name=random_lower_string()), profile_id=profile.profile_id
+    )
+    for movie_id in ['Shrek', 'Avatar', 'Luck']:
+        movie_lists.add_movie(session=db, list_id=list_1.list_id, movie_id=movie_id)
+
+    movies = movie_lists.get_movies_by_list_ids(session=db, list_ids=[list_1.list_id, list_2.list_id])
+
+    assert [m.movie_id for m in movies[list_1.list_id]] == ['Shrek', 'Avatar', 'Luck']
+    assert movies[list_2.list_id] == []
+
+
+def test_delete_movie_list(db: Session) -> None:
+    _, profile = user_and_profile_in(db)
+    movie_list = movie_lists.create_movie_list(
+        session=db, movielist_create=CreateMovieList(name=random_lower_string()), profile_id=profile.profile_id
+    )
+    list_id = movie_list.list_id
+    movie_lists.add_movie(session=db, list_id=list_id, movie_id='101')
+
+    movie_lists.delete_movie_list(session=db, db_movielist=movie_list)
+
+    assert db.get(MovieList, list_id) is None
+    assert db.get(MovieListItem, (list_id, '101')) is None
+
+
+def test_import_movie_lists(db: Session) -> None:
+    _, profile = user_and_profile_in(db)
+    movie_list = movie_lists.create_movie_list(
+        session=db, movielist_create=CreateMovieList(name=random_lower_string()), profile_id=profile.profile_id
+    )
+    data = [
+        {
+            "id": str(movie_list.list_id),
+            "profile_id": str(profile.profile_id),
+            "movies": [
+                {"movie_id": "101", "added_at": "2025-04-25T00:00:00+00:00"},
+                {"movie_id": "102", "added_at": "2025-04-26T00:00:00+00:00"}
+            ]
+        },
+        {"id": str(uuid.uuid4()), "profile_id": str(profile.profile_id), "movies": [{"movie_id": "103"}]}
+    ]
+
+    assert movie_lists.import_movie_lists(session=db, movie_lists_data=data) == 2
+    assert movie_lists.import_movie_lists(session=db, movie_lists_data=data) == 0
+
+    movies = movie_lists.get_movies_by_list_ids(session=db, list_ids=[movie_list.list_id])
+    assert [m.movie_id for m in movies[movie_list.list_id]] == ['101', '102']
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+from sqlmodel import Session
+
+from backend.logic.controllers import article_tags, articles
+from backend.logic.controllers.newsletter_snapshots import snapshots
+from backend.logic.schemas.articles import CreateArticle, UpdateArticle
+from backend.logic.schemas.articles_tags import CreateTag, UpdateTag
+from backend.tests.utils.utils import count_queries, random_birth_date, random_lower_string
+
+
+def create_newsletter_article(db: Session):
+    section = article_tags.create_section(session=db, section_create=CreateTag(
+        name=random_lower_string(),
+        description=random_lower_string()
+    ))
+    newsletter = article_tags.create_newsletter(session=db, newsletter_create=CreateTag(
+        name=str(random_birth_date()),
+        description=random_lower_string()
+    ))
+    article = articles.create_article(session=db, article_create=CreateArticle(
+        article_title=random_lower_string(),
+        section_id=section.section_id,
+        newsletter_id=newsletter.newsletter_id
+    ))
+    return section, newsletter, article
+
+
+def test_snapshot_is_reused(db: Session) -> None:
+    _, newsletter, article = create_newsletter_article(db)
+    newsletter_id = newsletter.newsletter_id
+
+    snapshot = snapshots.get(session=db, newsletter_id=newsletter_id)
+    with count_queries(db) as statements:
+        snapshot_2 = snapshots.get(session=db, newsletter_id=newsletter_id)
+
+    assert not statements
+    assert snapshot_2 is snapshot
+    payload = json.loads(snapshot.payload)
+    assert payload['newsletter'] == newsletter.name
+    assert payload['data'][0]['articles'][0]['article_id'] == str(article.article_id)
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_snapshot_rebuilt_on_article_change(db: Session) -> None:
+    _, newsletter, article = create_newsletter_article(db)
+    snapshot = snapshots.get(session=db, newsletter_id=newsletter.newsletter_id)
+
+    articles.update_article(
+        session=db,
+        db_article=article,
+        article_in=UpdateArticle(article_title="Updated title")
+    )
+    snapshot_2 = snapshots.get(session=db, newsletter_id=newsletter.newsletter_id)
+
+    assert snapshot_2.etag != snapshot.etag
+    assert json.loads(snapshot_2.payload)['data'][0]['articles'][0]['article_title'] == "Updated title"
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_snapshot_rebuilt_on_section_change(db: Session) -> None:
+    section, newsletter, _ = create_newsletter_article(db)
+    snapshot = snapshots.get(session=db, newsletter_id=newsletter.newsletter_id)
+
+    new_name = random_lower_string()
+    article_tags.update_section(session=db, db_tag=section, tag_in=UpdateTag(name=new_name))
+    snapshot_2 = snapshots.get(session=db, newsletter_id=newsletter.newsletter_id)
+
+    assert snapshot_2.etag != snapshot.etag
+    assert json.loads(snapshot_2.payload)['data'][0]['section'] == new_name
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_snapshot_of_other_newsletter_kept(db: Session) -> None:
+    _, newsletter, _ = create_newsletter_article(db)
+    snapshot = snapshots.get(session=db, newsletter_id=newsletter.newsletter_id)
+
+    _, other, article = create_newsletter_article(db)
+    articles.update_article(
+        session=db,
+        db_article=article,
+        article_in=UpdateArticle(article_title="Updated title")
+    )
+
+    assert snapshots.get(session=db, newsletter_id=newsletter.newsletter_id) is snapshot
+
+
+def test_snapshot_not_found(db: Session) -> None:
+    assert snapshots.get(session=db, newsletter_id=-1) is None
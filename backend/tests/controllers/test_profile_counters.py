@@ -0,0 +1,140 @@
+import uuid
+
+from sqlmodel import Session
+
+from backend.logic.controllers import follows, movie_lists, profile_counters, profiles, ratings
+from backend.logic.controllers.follow_graph import graph
+from backend.logic.models import Follow, ProfileCounters, Rating
+from backend.logic.schemas.movie_lists import CreateMovieList
+from backend.logic.schemas.ratings import CreateRating
+from backend.tests.utils.user import user_and_profile_in
+
+
+def counters_of(db: Session, profile_id) -> tuple[int, int, int, int]:
+    counters = profile_counters.get_profile_counters(session=db, profile_id=profile_id)
+    return (
+        counters.followers_count,
+        counters.following_count,
+        counters.lists_count,
+        counters.movies_rated
+    )
+
+
+def test_counters_follow_write_paths(db: Session) -> None:
+    _, profile = user_and_profile_in(db)
+    _, other = user_and_profile_in(db)
+
+    assert counters_of(db, profile.profile_id) == (0, 0, 0, 0)
+
+    follow = follows.create_follow(
+        session=db, following_id=other.profile_id, follower_id=profile.profile_id
+    )
+    assert counters_of(db, profile.profile_id) == (0, 1, 0, 0)
+    assert counters_of(db, other.profile_id) == (1, 0, 0, 0)
+
+    follows.delete_follow(session=db, follow=follow)
+    assert counters_of(db, profile.profile_id) == (0, 0, 0, 0)
+    assert counters_of(db, other.profile_id) == (0, 0, 0, 0)
+
+
+def test_counters_rating_and_list_write_paths(db: Session) -> None:
+    _, profile = user_and_profile_in(db)
+    movie_id, other_movie_id = uuid.uuid4().hex[:20], uuid.uuid4().hex[:20]
+
+    ratings.create_or_update_rating(
+        session=db, profile_id=profile.profile_id, movie_id=movie_id, rating_in=CreateRating(rate=4)
+    )
+    ratings.create_or_update_rating(
+        session=db, profile_id=profile.profile_id, movie_id=movie_id, rating_in=CreateRating(rate=3)
+    )
+    assert counters_of(db, profile.profile_id) == (0, 0, 0, 1)
+
+    rows = ratings.parse_ratings(
+        [f'{{"movie_id": "{movie_id}", "rate": 5}}', f'{{"movie_id": "{other_movie_id}", "rate": 2}}'],
+        format="ndjson"
+    )
+    ratings.import_ratings(session=db, profile_id=profile.profile_id, rows=rows, batch_size=10)
+    assert counters_of(db, profile.profile_id) == (0, 0, 0, 2)
+
+    ratings.delete_rating(session=db, rating=db.get(Rating, (profile.profile_id, movie_id)))
+    assert counters_of(db, profile.profile_id) == (0, 0, 0, 1)
+
+    movie_list = movie_lists.create_movie_list(
+        session=db,
+        movielist_create=CreateMovieList(name="Watch later", privacy=False),
+        profile_id=profile.profile_id
+    )
+    assert counters_of(db, profile.profile_id) == (0, 0, 1, 1)
+    movie_lists.delete_movie_list(session=db, db_movielist=movie_list)
+    assert counters_of(db, profile.profile_id) == (0, 0, 0, 1)
+
+
+def test_counters_deleted_without_row(db: Session) -> None:
+    _, profile = user_and_profile_in(db)
+    _, other = user_and_profile_in(db)
+    movie_id = uuid.uuid4().hex[:20]
+    follow = follows.create_follow(
+        session=db, following_id=other.profile_id, follower_id=profile.profile_id
+    )
+    ratings.create_or_update_rating(
+        session=db, profile_id=profile.profile_id, movie_id=movie_id, rating_in=CreateRating(rate=4)
+    )
+    movie_list = movie_lists.create_movie_list(
+        session=db,
+        movielist_create=CreateMovieList(name="Watch later", privacy=False),
+        profile_id=profile.profile_id
+    )
+    # Counters not filled yet for existing profiles
+    profile_counters.delete_profile_counters(session=db, profile_id=profile.profile_id)
+    profile_counters.delete_profile_counters(session=db, profile_id=other.profile_id)
+    db.commit()
+
+    follows.delete_follow(session=db, follow=follow)
+    ratings.delete_rating(session=db, rating=db.get(Rating, (profile.profile_id, movie_id)))
+    movie_lists.delete_movie_list(session=db, db_movielist=movie_list)
+
+    for profile_id in (profile.profile_id, other.profile_id):
+        stored = db.get(ProfileCounters, profile_id)
+        db.refresh(stored)
+        assert (stored.followers_count, stored.following_count, stored.lists_count, stored.movies_rated) == (0, 0, 0, 0)
+
+
+def test_counters_of_followed_and_followers_on_profile_delete(db: Session) -> None:
+    _, profile = user_and_profile_in(db)
+    _, followed = user_and_profile_in(db)
+    _, follower = user_and_profile_in(db)
+    follows.create_follow(session=db, following_id=followed.profile_id, follower_id=profile.profile_id)
+    follows.create_follow(session=db, following_id=profile.profile_id, follower_id=follower.profile_id)
+    follows.create_follow(session=db, following_id=followed.profile_id, follower_id=follower.profile_id)
+    graph.build(session=db)
+    assert counters_of(db, followed.profile_id) == (2, 0, 0, 0)
+    assert counters_of(db, follower.profile_id) == (0, 2, 0, 0)
+
+    profile_id = profile.profile_id
+    assert profile.following and profile.followers
+    profiles.delete_profile(session=db, db_profile=profile)
+
+    for other, expected in ((followed, (1, 0, 0, 0)), (follower, (0, 1, 0, 0))):
+        db.refresh(db.get(ProfileCounters, other.profile_id))
+        assert counters_of(db, other.profile_id) == expected
+    assert db.get(ProfileCounters, profile_id) is None
+    assert not graph.is_following(profile_id, followed.profile_id)
+    assert not graph.is_following(follower.profile_id, profile_id)
+    assert graph.is_following(follower.profile_id, followed.profile_id)
+
+
+def test_refresh_profile_counters(db: Session) -> None:
+    _, profile = user_and_profile_in(db)
+    _, other = user_and_profile_in(db)
+    # Written without the controllers, so the counters are out of date
+    db.add(Follow(follower_id=other.profile_id, following_id=profile.profile_id))
+    db.add(ProfileCounters(profile_id=profile.profile_id, movies_rated=7))
+    db.commit()
+
+    assert counters_of(db, profile.profile_id) == (0, 0, 0, 7)
+    assert counters_of(db, other.profile_id) == (0, 1, 0, 0)
+
+    assert profile_counters.refresh_profile_counters(session=db) >= 2
+    assert counters_of(db, profile.profile_id) == (1, 0, 0, 0)
+    assert counters_of(db, other.profile_id) == (0, 1, 0, 0)
+    assert db.get(ProfileCounters, other.profile_id) is not None
@@ -125,4 +125,19 @@ def test_update_profile(db: Session) -> None:
     
     assert profile_2
     assert profile_2.username == new_username
-    
\ No newline at end of file
+    
+
+def test_profile_cache_dropped_on_create_and_delete(db: Session) -> None:
+    user = users.create_user(session=db, user_create=user_in())
+    profiles.profile_cache.put(user.user_id, "stale")
+
+    profile = profiles.create_profile(
+        session=db, profile_create=CreateProfile(username=random_lower_string()), user_id=user.user_id
+    )
+    assert profiles.profile_cache.get(user.user_id) is None
+
+    profiles.profile_cache.put(user.user_id, profile.profile_id)
+    profile_id = profile.profile_id
+    profiles.delete_profile(session=db, db_profile=profile)
+    assert profiles.profile_cache.get(user.user_id) is None
+    assert db.get(Profile, profile_id) is None
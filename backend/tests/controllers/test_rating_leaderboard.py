@@ -0,0 +1,115 @@
+import uuid
+from datetime import date, timedelta
+
+from sqlmodel import Session
+
+from backend.logic.controllers import rating_leaderboard, ratings
+from backend.logic.controllers.rating_leaderboard import Ranking, RatingLeaderboard
+from backend.logic.models import Rating
+from backend.logic.schemas.ratings import CreateRating
+from backend.tests.utils.user import user_and_profile_in
+from backend.tests.utils.utils import count_queries
+
+
+def test_ranking_bayesian_average() -> None:
+    ranking = Ranking(prior_weight=10)
+    ranking.add("few", 2, 10.0)
+    ranking.add("many", 1000, 4800.0)
+    ranking.add("bad", 1000, 2000.0)
+    ranking.reprior()
+
+    assert [movie.movie_id for movie in ranking.top(3)] == ["many", "few", "bad"]
+    assert ranking.top(1)[0].avg_rate == 4.8
+    assert ranking.top(1)[0].count == 1000
+
+    ranking.add("few", 998, 4990.0)
+    assert ranking.top(1)[0].movie_id == "few"
+
+    ranking.add("bad", -1000, -2000.0)
+    assert [movie.movie_id for movie in ranking.top(3)] == ["few", "many"]
+
+
+def test_leaderboard_windows(tmp_path, monkeypatch) -> None:
+    today = date(2026, 10, 18)
+    monkeypatch.setattr(rating_leaderboard, "_today", lambda: today)
+    board = RatingLeaderboard(str(tmp_path / "top.json"), prior_weight=1, persist_seconds=0)
+    board._loaded = True
+    board.save()
+
+    board.apply([("old", None, None, 5.0), ("recent", None, None, 4.0)])
+    board.apply([("recent", None, None, 4.0)])
+    assert [movie.movie_id for movie in board.top(session=None, window="7d")] == ["old", "recent"]
+
+    today += timedelta(days=10)
+    board.apply([("recent", None, None, 3.0)])
+    assert [movie.movie_id for movie in board.top(session=None, window="7d")] == ["recent"]
+    assert board.top(session=None, window="7d")[0].count == 1
+    top_30 = {movie.movie_id: movie for movie in board.top(session=None, window="30d")}
+    assert top_30["recent"].count == 3
+
+    # Updating a rate given 10 days ago moves it out of the old day
+    board.apply([("old", 5.0, today - timedelta(days=10), 1.0)])
+    top_30 = {movie.movie_id: movie for movie in board.top(session=None, window="30d")}
+    assert top_30["old"].avg_rate == 1.0
+    assert top_30["old"].count == 1
+
+    today += timedelta(days=30)
+    assert board.top(session=None, window="30d") == []
+    assert {movie.movie_id for movie in board.top(session=None, window="all")} == {"old", "recent"}
+
+    loaded = RatingLeaderboard(board.path, prior_weight=1, persist_seconds=0)
+    assert loaded.top(session=None, window="all") == board.top(session=None, window="all")
+
+
+def test_leaderboard_merges_other_workers(tmp_path, monkeypatch) -> None:
+    path = str(tmp_path / "top.json")
+    first = RatingLeaderboard(path, prior_weight=0, persist_seconds=60)
+    first._loaded = True
+    first.save()
+    second = RatingLeaderboard(path, prior_weight=0, persist_seconds=60)
+    assert second.top(session=None) == []
+
+    def rebuild(*, session):
+        raise AssertionError("rebuilt instead of reloading")
+
+    monkeypatch.setattr(first, "rebuild", rebuild)
+    monkeypatch.setattr(second, "rebuild", rebuild)
+
+    first.apply([("a", None, None, 5.0)])
+    second.apply([("b", None, None, 4.0)])
+    first.save()
+    second.save()
+    first.apply([("a", 5.0, rating_leaderboard._today(), 3.0)])
+
+    def averages(board):
+        return {movie.movie_id: movie.avg_rate for movie in board.top(session=None, window="all")}
+
+    assert averages(first) == {"a": 3.0, "b": 4.0}
+    assert averages(second) == {"a": 5.0, "b": 4.0}
+    first.save()
+    assert averages(second) == {"a": 3.0, "b": 4.0}
+
+
+def test_leaderboard_follows_rating_writes(db: Session, tmp_path, monkeypatch) -> None:
+    board = RatingLeaderboard(str(tmp_path / "top.json"), prior_weight=0, persist_seconds=60)
+    monkeypatch.setattr(rating_leaderboard, "leaderboard", board)
+    _, profile = user_and_profile_in(db)
+    movie_id = uuid.uuid4().hex[:20]
+
+    ratings.create_or_update_rating(
+        session=db, profile_id=profile.profile_id, movie_id=movie_id, rating_in=CreateRating(rate=5)
+    )
+    top = {movie.movie_id: movie for movie in board.top(session=db, window="7d", limit=100)}
+    assert top[movie_id].avg_rate == 5.0
+
+    ratings.create_or_update_rating(
+        session=db, profile_id=profile.profile_id, movie_id=movie_id, rating_in=CreateRating(rate=2)
+    )
+    with count_queries(db) as statements:
+        top = {movie.movie_id: movie for movie in board.top(session=db, window="all", limit=100)}
+    assert statements == []
+    assert top[movie_id].avg_rate == 2.0
+    assert top[movie_id].count == 1
+
+    ratings.delete_rating(session=db, rating=db.get(Rating, (profile.profile_id, movie_id)))
+    assert movie_id not in {movie.movie_id for movie in board.top(session=db, window="all", limit=100)}
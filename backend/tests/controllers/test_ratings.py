@@ -1,16 +1,20 @@
+import threading
+import time
 import uuid
 import pytest
 from sqlmodel import Session
 from sqlmodel import func, select
 
-from backend.logic.models import Rating
+from backend.logic.models import MovieRatingStats, Rating
 from backend.logic.controllers import ratings
 from backend.logic.schemas.ratings import (
     CreateRating,
+    ProfileRating,
     ProfileRatingsPublic, 
     MovieRatingsPublic
 )
 from backend.tests.utils.user import user_and_profile_in
+from backend.tests.utils.utils import count_queries
 
 
 def test_create_or_update_rating(db: Session) -> None:
@@ -29,6 +33,57 @@ def test_create_or_update_rating(db: Session) -> None:
     assert rating.rate == rate.rate
 
 
+
+def test_create_or_update_rating_upsert(db: Session) -> None:
+    _, profile = user_and_profile_in(db)
+    profile_id = profile.profile_id
+    movie_id = uuid.uuid4().hex[:20]
+
+    created_at = None
+    for rate in (2.5, 4.0):
+        with count_queries(db) as statements:
+            rating = ratings.create_or_update_rating(
+                session=db, profile_id=profile_id, movie_id=movie_id, rating_in=CreateRating(rate=rate)
+            )
+
+        writes = [sql for sql in statements if sql.startswith("INSERT INTO rating")]
+        assert len(writes) == 1
+        assert "ON CONFLICT" in writes[0]
+        assert not any(sql.startswith("UPDATE rating ") for sql in statements)
+        assert rating.rate == rate
+        # The update keeps the creation time
+        assert created_at in (None, rating.created_at)
+        created_at = rating.created_at
+
+    assert db.get(Rating, (profile_id, movie_id)).rate == 4.0
+    assert ratings.get_movie_rating_stats(session=db, movie_id=movie_id).count == 1
+
+
+def test_create_or_update_rating_concurrent_insert(db: Session, monkeypatch) -> None:
+    _, profile = user_and_profile_in(db)
+    profile_id = profile.profile_id
+    movie_id = uuid.uuid4().hex[:20]
+    ratings.create_or_update_rating(
+        session=db, profile_id=profile_id, movie_id=movie_id, rating_in=CreateRating(rate=2.0)
+    )
+
+    # The rating is created by another request right after the first read
+    read_rating = ratings._read_rating
+    reads = []
+    def racing_read(*args):
+        reads.append(args)
+        return (None, None) if len(reads) == 1 else read_rating(*args)
+    monkeypatch.setattr(ratings, "_read_rating", racing_read)
+
+    ratings.create_or_update_rating(
+        session=db, profile_id=profile_id, movie_id=movie_id, rating_in=CreateRating(rate=4.0)
+    )
+    assert len(reads) == 2
+    stats = ratings.get_movie_rating_stats(session=db, movie_id=movie_id)
+    assert stats.count == 1
+    assert stats.avg_rate == 4.0
+    assert stats.distribution["2.0"] == 0
+
 def test_get_rating_by_profile(db: Session) -> None:
     _, profile = user_and_profile_in(db)
     movie_id = "movie-com-456"
@@ -152,3 +207,197 @@ def test_delete_rating(db: Session):
     ).first()
 
     assert deleted is None
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_movie_rating_stats(db: Session):
+    _, profile1 = user_and_profile_in(db)
+    _, profile2 = user_and_profile_in(db)
+    movie_id = uuid.uuid4().hex[:20]
+    ratings.create_or_update_rating(
+        session=db, profile_id=profile1.profile_id, movie_id=movie_id, rating_in=CreateRating(rate=2.0)
+    )
+    ratings.create_or_update_rating(
+        session=db, profile_id=profile2.profile_id, movie_id=movie_id, rating_in=CreateRating(rate=4.0)
+    )
+
+    stats = ratings.get_movie_rating_stats(session=db, movie_id=movie_id)
+    assert stats.count == 2
+    assert stats.avg_rate == 3.0
+    assert stats.distribution["2.0"] == 1
+    assert stats.distribution["4.0"] == 1
+
+    # The previous rate is replaced, not added
+    ratings.create_or_update_rating(
+        session=db, profile_id=profile1.profile_id, movie_id=movie_id, rating_in=CreateRating(rate=5.0)
+    )
+    stats = ratings.get_movie_rating_stats(session=db, movie_id=movie_id)
+    assert stats.count == 2
+    assert stats.avg_rate == 4.5
+    assert stats.distribution["2.0"] == 0
+    assert stats.distribution["5.0"] == 1
+
+    rating = db.get(Rating, (profile2.profile_id, movie_id))
+    ratings.delete_rating(session=db, rating=rating)
+    stats = ratings.get_movie_rating_stats(session=db, movie_id=movie_id)
+    assert stats.count == 1
+    assert stats.avg_rate == 5.0
+    assert sum(stats.distribution.values()) == 1
+
+
+def test_movie_rating_stats_no_ratings(db: Session):
+    stats = ratings.get_movie_rating_stats(session=db, movie_id="movie-0-ratings")
+
+    assert stats.count == 0
+    assert stats.avg_rate == 0.0
+    assert sum(stats.distribution.values()) == 0
+
+
+def test_refresh_movie_rating_stats(db: Session):
+    _, profile = user_and_profile_in(db)
+    movie_id = uuid.uuid4().hex[:20]
+    ratings.create_or_update_rating(
+        session=db, profile_id=profile.profile_id, movie_id=movie_id, rating_in=CreateRating(rate=3.5)
+    )
+    stats = db.get(MovieRatingStats, movie_id)
+    expected = stats.model_dump()
+    db.delete(stats)
+    db.commit()
+
+    ratings.refresh_movie_rating_stats(session=db)
+
+    assert db.get(MovieRatingStats, movie_id).model_dump() == expected
+
+
+def test_get_movie_rating_averages(db: Session):
+    _, profile1 = user_and_profile_in(db)
+    _, profile2 = user_and_profile_in(db)
+    movie_ids = [uuid.uuid4().hex[:20] for _ in range(3)]
+    for movie_id in movie_ids[:2]:
+        ratings.create_or_update_rating(
+            session=db, profile_id=profile1.profile_id, movie_id=movie_id, rating_in=CreateRating(rate=2.0)
+        )
+    ratings.create_or_update_rating(
+        session=db, profile_id=profile2.profile_id, movie_id=movie_ids[0], rating_in=CreateRating(rate=5.0)
+    )
+    profile_id = profile2.profile_id
+
+    with count_queries(db) as statements:
+        averages = ratings.get_movie_rating_averages(
+            session=db, movie_ids=movie_ids + movie_ids[:1], profile_id=profile_id
+        )
+
+    assert len(statements) == 1
+    assert [item.movie_id for item in averages] == movie_ids
+    assert (averages[0].avg_rate, averages[0].count, averages[0].my_rate) == (3.5, 2, 5.0)
+    assert (averages[1].avg_rate, averages[1].count, averages[1].my_rate) == (2.0, 1, None)
+    assert (averages[2].avg_rate, averages[2].count, averages[2].my_rate) == (0.0, 0, None)
+
+
+def test_parse_ratings_csv() -> None:
+    lines = [
+        "movie_id,rate,title\n",
+        "m1,4.5,Some movie\n",
+        "m2,9,Too high\n",
+        ",3,No id\n",
+        "m3,abc,Not a number\n",
+    ]
+
+    rows = list(ratings.parse_ratings(lines, format="csv"))
+
+    assert rows[0] == (2, ProfileRating(movie_id="m1", rate=4.5))
+    assert [line for line, row in rows if isinstance(row, str)] == [3, 4, 5]
+
+
+def test_parse_ratings_ndjson() -> None:
+    lines = [
+        '{"movie_id": "m1", "rate": 3}\n',
+        '\n',
+        '{"movie_id": "m2"\n',
+        '[1, 2]\n',
+    ]
+
+    rows = list(ratings.parse_ratings(lines, format="ndjson"))
+
+    assert rows[0] == (1, ProfileRating(movie_id="m1", rate=3))
+    assert [line for line, row in rows[1:]] == [3, 4]
+    assert all(isinstance(row, str) for _, row in rows[1:])
+
+
+def test_import_ratings(db: Session) -> None:
+    _, profile = user_and_profile_in(db)
+    _, other = user_and_profile_in(db)
+    movie_ids = [uuid.uuid4().hex[:20] for _ in range(5)]
+    ratings.create_or_update_rating(
+        session=db, profile_id=other.profile_id, movie_id=movie_ids[0], rating_in=CreateRating(rate=2.0)
+    )
+    ratings.create_or_update_rating(
+        session=db, profile_id=profile.profile_id, movie_id=movie_ids[0], rating_in=CreateRating(rate=2.0)
+    )
+    lines = ["movie_id,rate\n"] + [f"{movie_id},4\n" for movie_id in movie_ids]
+    lines += [f"{movie_ids[1]},5\n", "bad,0\n"]
+
+    with count_queries(db) as statements:
+        result = ratings.import_ratings(
+            session=db,
+            profile_id=profile.profile_id,
+            rows=ratings.parse_ratings(lines, format="csv"),
+            batch_size=2
+        )
+
+    # The aggregates are updated in place, never deleted and recomputed,
+    # with one statement for each of the 3 batches of 2 rows
+    assert not any(sql.startswith("DELETE FROM movieratingstats") for sql in statements)
+    assert len([sql for sql in statements if "movieratingstats" in sql]) == 3
+    assert result.imported == 6
+    assert result.failed == 1
+    assert result.errors[0].line == 8
+    assert db.get(Rating, (profile.profile_id, movie_ids[1])).rate == 5.0
+    stats = ratings.get_movie_rating_stats(session=db, movie_id=movie_ids[0])
+    assert (stats.count, stats.avg_rate) == (2, 3.0)
+    stats = ratings.get_movie_rating_stats(session=db, movie_id=movie_ids[1])
+    assert (stats.count, stats.avg_rate) == (1, 5.0)
+    assert ratings.get_movie_rating_stats(session=db, movie_id=movie_ids[4]).count == 1
+
+
+def test_get_rating_histogram(db: Session) -> None:
+    ratings.histogram_cache.clear()
+    _, profile = user_and_profile_in(db)
+    db.add(Rating(profile_id=profile.profile_id, movie_id=uuid.uuid4().hex[:20], rate=3.7))
+    db.commit()
+    rows = db.exec(select(Rating.rate, func.count()).group_by(Rating.rate)).all()
+    expected = {str(rate): count for rate, count in rows}
+    assert "3.7" in expected
+
+    assert ratings.get_rating_histogram(session=db) == expected
+
+    with count_queries(db) as statements:
+        assert ratings.get_rating_histogram(session=db) == expected
+    assert statements == []
+
+
+def test_get_rating_histogram_single_flight(monkeypatch) -> None:
+    ratings.histogram_cache.clear()
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def slow_histogram(session):
+        calls.append(session)
+        time.sleep(0.05)
+        return {"5.0": 1}
+
+    def read():
+        barrier.wait()
+        results.append(ratings.get_rating_histogram(session=None))
+
+    monkeypatch.setattr(ratings, "_rating_histogram", slow_histogram)
+    results = []
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"5.0": 1}] * 8
+    ratings.histogram_cache.clear()
@@ -0,0 +1,132 @@
+import uuid
+
+import numpy as np
+from sqlmodel import Session
+
+from backend.logic.controllers import recommendations
+from backend.logic.controllers.recommendations import (
+    NeighbourIndex,
+    RatingMatrix,
+    build_neighbour_index,
+    item_vectors,
+)
+from backend.logic.models import Rating
+from backend.tests.utils.user import user_and_profile_in
+
+
+def random_matrix(seed: int = 0, n_profiles: int = 60, n_movies: int = 40) -> RatingMatrix:
+    rng = np.random.default_rng(seed)
+    cells = rng.choice(n_profiles * n_movies, 600, replace=False)
+    return RatingMatrix(
+        movie_ids=np.array([f"m{i:03d}" for i in range(n_movies)], dtype='U20'),
+        profiles=(cells // n_movies).astype(np.int32),
+        movies=(cells % n_movies).astype(np.int32),
+        rates=(rng.integers(1, 11, len(cells)) / 2).astype(np.float32),
+        n_profiles=n_profiles
+    )
+
+
+def brute_force(matrix: RatingMatrix, adjusted: bool) -> np.ndarray:
+    dense = item_vectors(matrix, adjusted=adjusted).toarray()
+    similarity = dense.T @ dense
+    np.fill_diagonal(similarity, 0)
+    return similarity
+
+
+def test_build_neighbour_index_matches_brute_force() -> None:
+    matrix = random_matrix()
+    k = 5
+    index, rebuilt = build_neighbour_index(matrix, k=k)
+    similarity = brute_force(matrix, adjusted=True)
+
+    assert rebuilt == len(matrix.movie_ids)
+    assert index.neighbours.shape == (len(matrix.movie_ids), k)
+    for movie, (neighbours, scores) in enumerate(zip(index.neighbours, index.scores)):
+        expected = np.sort(similarity[movie][similarity[movie] > 0])[::-1][:k]
+        found = scores[neighbours >= 0]
+        np.testing.assert_allclose(found, expected, rtol=1e-5)
+        np.testing.assert_allclose(similarity[movie, neighbours[neighbours >= 0]], found, rtol=1e-5)
+        assert movie not in neighbours
+
+
+def test_build_neighbour_index_incremental() -> None:
+    matrix = random_matrix()
+    previous, _ = build_neighbour_index(matrix, k=5, adjusted=False)
+
+    # Change the rates of two movies and add a new one
+    rates = matrix.rates.copy()
+    changed = np.isin(matrix.movies, [3, 7])
+    rates[changed] = 5.5 - rates[changed]
+    extra = np.flatnonzero(matrix.movies == 3)[:4]
+    updated = RatingMatrix(
+        movie_ids=np.append(matrix.movie_ids, "m999"),
+        profiles=np.append(matrix.profiles, matrix.profiles[extra]),
+        movies=np.append(matrix.movies, np.full(len(extra), len(matrix.movie_ids), dtype=np.int32)),
+        rates=np.append(rates, rates[extra]),
+        n_profiles=matrix.n_profiles
+    )
+
+    incremental, rebuilt = build_neighbour_index(
+        updated,
+        k=5,
+        adjusted=False,
+        previous=previous,
+        changed=np.array(["m003", "m007"], dtype='U20')
+    )
+    full, _ = build_neighbour_index(updated, k=5, adjusted=False)
+
+    assert rebuilt >= 3
+    np.testing.assert_allclose(incremental.scores, full.scores, rtol=1e-5)
+    np.testing.assert_array_equal(incremental.neighbours, full.neighbours)
+
+
+def test_recommend() -> None:
+    index = NeighbourIndex(
+        movie_ids=np.array(["a", "b", "c", "d"], dtype='U20'),
+        neighbours=np.array([[1, 2], [0, 3], [0, -1], [1, -1]], dtype=np.int32),
+        scores=np.array([[0.9, 0.5], [0.9, 0.8], [0.5, 0], [0.8, 0]], dtype=np.float32)
+    )
+
+    recommended = index.recommend(["a", "unknown"], [4.0, 2.0])
+
+    assert [movie_id for movie_id, _ in recommended] == ["b", "c"]
+    assert index.recommend(["unknown"], [4.0]) == []
+    assert [movie_id for movie_id, _ in index.recommend(["a", "b"], [4.0, 4.0], limit=1)] == ["d"]
+
+
+def test_build_recommendations_and_recommend_movies(db: Session, tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(recommendations, "MAX_INCREMENTAL_SHARE", 1)
+    path = str(tmp_path / "neighbours.npz")
+    movies = [uuid.uuid4().hex[:20] for _ in range(3)]
+    profiles = [user_and_profile_in(db)[1].profile_id for _ in range(3)]
+    rated = {
+        profiles[0]: {movies[0]: 5, movies[1]: 4},
+        profiles[1]: {movies[0]: 5, movies[1]: 4, movies[2]: 5},
+        profiles[2]: {movies[2]: 3},
+    }
+    for profile_id, rates in rated.items():
+        for movie_id, rate in rates.items():
+            db.add(Rating(profile_id=profile_id, movie_id=movie_id, rate=rate))
+    db.commit()
+
+    assert recommendations.recommend_movies(session=db, profile_id=profiles[0], path=path) == []
+
+    result = recommendations.build_recommendations(session=db, k=10, adjusted=False, path=path)
+    assert not result.incremental
+    recommended = recommendations.recommend_movies(session=db, profile_id=profiles[0], path=path)
+    assert recommended[0].movie_id == movies[2]
+    assert movies[0] not in [movie.movie_id for movie in recommended]
+
+    result = recommendations.build_recommendations(session=db, k=10, adjusted=False, path=path)
+    assert result.incremental and result.rebuilt == 0
+    # Other parameters rebuild every row even without new ratings
+    result = recommendations.build_recommendations(session=db, k=10, adjusted=True, path=path)
+    assert not result.incremental and result.rebuilt == result.movies
+    assert recommendations.NeighbourIndex.load(path).adjusted is True
+    result = recommendations.build_recommendations(session=db, k=10, adjusted=False, path=path)
+    assert not result.incremental
+
+    db.add(Rating(profile_id=profiles[2], movie_id=movies[1], rate=2))
+    db.commit()
+    result = recommendations.build_recommendations(session=db, k=10, adjusted=False, path=path)
+    assert result.rebuilt >= 1
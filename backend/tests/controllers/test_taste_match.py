@@ -0,0 +1,63 @@
+import uuid
+
+import numpy as np
+from sqlmodel import Session
+
+from backend.logic.controllers import follows, ratings, taste_match
+from backend.logic.models import Rating
+from backend.logic.schemas.ratings import CreateRating
+from backend.tests.utils.user import user_and_profile_in
+from backend.tests.utils.utils import count_queries
+
+
+def test_match_scores() -> None:
+    matches = taste_match.match_scores(np.array([2, 1, 0]), np.array([0.0, 4.5, 0.0]))
+
+    assert matches[0] == 100
+    assert matches[1] == 0
+    assert np.isnan(matches[2])
+
+
+def test_taste_matches(db: Session) -> None:
+    movies = [uuid.uuid4().hex[:20] for _ in range(3)]
+    _, target = user_and_profile_in(db)
+    _, twin = user_and_profile_in(db)
+    _, opposite = user_and_profile_in(db)
+    _, stranger = user_and_profile_in(db)
+    rated = [
+        (target, [5, 4, 1]),
+        (twin, [5, 4, None]),
+        (opposite, [0.5, 1, 5]),
+    ]
+    for profile, rates in rated:
+        for movie_id, rate in zip(movies, rates):
+            if rate is not None:
+                db.add(Rating(profile_id=profile.profile_id, movie_id=movie_id, rate=rate))
+    db.add(Rating(profile_id=stranger.profile_id, movie_id=uuid.uuid4().hex[:20], rate=3))
+    db.commit()
+
+    match = taste_match.get_taste_match(session=db, profile_id=target.profile_id, other=twin)
+    assert (match.match, match.co_rated) == (100.0, 2)
+    match = taste_match.get_taste_match(session=db, profile_id=target.profile_id, other=stranger)
+    assert (match.match, match.co_rated) == (None, 0)
+
+    for profile in (twin, opposite, stranger):
+        follows.create_follow(session=db, following_id=target.profile_id, follower_id=profile.profile_id)
+
+    matches = taste_match.get_follower_taste_matches(session=db, profile_id=target.profile_id)
+    assert [match.profile_id for match in matches] == [twin.profile_id, opposite.profile_id]
+    assert matches[0].username == twin.username
+    assert matches[1].match == round(100 * (1 - (4.5 + 3 + 4) / 3 / 4.5), 1)
+    assert matches[1].co_rated == 3
+
+    assert len(taste_match.get_follower_taste_matches(session=db, profile_id=target.profile_id, limit=1)) == 1
+
+    # The rating vectors are cached, a rating write drops the profile's
+    with count_queries(db) as statements:
+        taste_match.get_follower_taste_matches(session=db, profile_id=target.profile_id)
+    assert not any("FROM rating" in statement for statement in statements)
+    ratings.create_or_update_rating(
+        session=db, profile_id=twin.profile_id, movie_id=movies[2], rating_in=CreateRating(rate=5)
+    )
+    match = taste_match.get_taste_match(session=db, profile_id=target.profile_id, other=twin)
+    assert (match.match, match.co_rated) == (round(100 * (1 - 4 / 3 / 4.5), 1), 3)
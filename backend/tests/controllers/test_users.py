@@ -7,7 +7,7 @@ from backend.logic.models import User
 from backend.logic.enum import UserTypes, UserGender
 from backend.logic.controllers import users
 from backend.logic.schemas.users import CreateUser, UpdateUser
-from backend.tests.utils.utils import random_email, random_lower_string, random_birth_date
+from backend.tests.utils.utils import count_queries, random_email, random_lower_string, random_birth_date
 
 
 full_name='User Example'
@@ -177,4 +177,31 @@ def test_failed_user_authentification_email(db: Session) -> None:
     user_auth = users.authenticate(session=db, email=wrong_email, password=user_in.password)
 
     assert user
-    assert user_auth is None
\ No newline at end of file
+    assert user_auth is None
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_user_snapshot_cache(db: Session) -> None:
+    user_in = CreateUser(
+        full_name=full_name,
+        email=random_email(), 
+        password =random_lower_string(),
+        birth_date=random_birth_date(),
+        user_gender=gender,
+        user_type=user_type
+    )
+    user = users.create_user(session=db, user_create=user_in)
+    user_id = user.user_id
+
+    snapshot = users.get_user_snapshot(session=db, user_id=user_id)
+    assert snapshot == (user_id, 'active', 'external')
+
+    db.expunge_all()
+    with count_queries(db) as statements:
+        assert users.get_user_snapshot(session=db, user_id=user_id) == snapshot
+    assert statements == []
+
+    users.update_user(session=db, db_user=db.get(User, user_id), user_in=UpdateUser(user_status='inactive'))
+    assert users.get_user_snapshot(session=db, user_id=user_id).user_status == 'inactive'
+
+    users.delete_user(session=db, db_user=db.get(User, user_id))
+    assert users.get_user_snapshot(session=db, user_id=user_id) is None
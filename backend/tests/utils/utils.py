@@ -1,8 +1,12 @@
 import secrets
 import string
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from typing import Iterator
 
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session
 
 from backend.core.config import settings
 
@@ -34,4 +38,19 @@ def get_superuser_token_headers(client: TestClient) -> dict[str, str]:
     tokens = r.json()
     a_token = tokens["access_token"]
     headers = {"Authorization": f"Bearer {a_token}"}
-    return headers
\ No newline at end of file
+    return headers
+
+
+@contextmanager
+def count_queries(session: Session) -> Iterator[list[str]]:
+    """
+    Collect the SQL statements executed through the session while in the block.
+    """
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)